@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Mac-side FocusBoard pipeline.
+
+Builds a synthetic vault in a temp HOME (TODAY.md with N blocks, TASKS.md
+with N tasks, a YouTube-Ops tree with N videos per channel, a large daily
+log), then times each parser, read_pipeline_state() (warm index and cold
+full scan), compute_calendar_now() and the full generate_state() with
+network sources stubbed out. Reports
+p50/p90/p99 latency and peak traced memory per benchmark.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py                   # Run, compare to baseline if present
+    python3 benchmarks/bench_pipeline.py --save-baseline   # Store results as the new baseline
+    python3 benchmarks/bench_pipeline.py --check           # Exit 1 on any regression
+    python3 benchmarks/bench_pipeline.py --blocks 60 --tasks 2000 --videos 200 --repeat 30
+
+The baseline (benchmarks/baseline.json) is machine-specific: save it on the
+machine you compare on.
+"""
+
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# A p50 this much slower than baseline (and at least MIN_REGRESSION_MS) is a regression
+REGRESSION_RATIO = 1.25
+MIN_REGRESSION_MS = 0.05
+
+
+def _arg(name: str, default: int) -> int:
+    if name in sys.argv:
+        return int(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
+def measure(fn, repeat: int, setup=None) -> dict:
+    """Time fn() repeat times, then once more under tracemalloc for peak memory."""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    q = statistics.quantiles(samples, n=100, method="inclusive") if len(samples) > 1 else samples * 99
+    return {
+        "p50_ms": round(statistics.median(samples), 4),
+        "p90_ms": round(q[89], 4),
+        "p99_ms": round(q[98], 4),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run_suite(repeat: int, blocks: int, tasks: int, videos: int, log_lines: int) -> dict:
+    # Point every module at the synthetic vault before importing it
+    home = Path(tempfile.mkdtemp(prefix="focusboard-bench-"))
+    os.environ["HOME"] = str(home)
+    sys.path.insert(0, str(ROOT / "mac"))
+    sys.path.insert(0, str(ROOT / "benchmarks"))
+
+    import vault
+    vault.build_vault(home, blocks=blocks, tasks=tasks,
+                      videos_per_channel=videos, log_lines=log_lines)
+
+    import config
+    import generate_state
+    import memo
+    import parsers
+    import pipeline_reader
+    from utils import read_file
+
+    logging.getLogger("focusboard").setLevel(logging.CRITICAL)
+
+    # Stub network sources: the suite measures local work only
+    events = vault.calendar_events()
+    generate_state.fetch_google_calendar = lambda cfg: (events, [])
+    generate_state.fetch_weather = lambda cfg: {"temp": 72}
+    generate_state.fetch_pipulse = lambda: {}
+    generate_state.fetch_reminders = lambda lists=None: {"count": 0, "items": []}
+
+    today = read_file(config.TODAY_PATH)
+    focus = read_file(config.FOCUS_PATH)
+    keystones = read_file(config.KEYSTONES_PATH)
+    now = generate_state.datetime.now().astimezone()
+
+    benches = {
+        "parse_today": lambda: parsers.parse_today(today),
+        "parse_focus": lambda: parsers.parse_focus(focus),
+        "parse_keystones_yaml": lambda: parsers.parse_keystones_yaml(keystones),
+        "parse_backlog_next": lambda: parsers.parse_backlog_next(config.TASKS_PATH),
+        "parse_task_counts": lambda: parsers.parse_task_counts(config.TASKS_PATH, config.QUICK_WINS_PATH),
+        "parse_daily_log": lambda: parsers.parse_daily_log(config.DAILY_LOG_PATH),
+        "read_pipeline_state": pipeline_reader.read_pipeline_state,
+        "compute_calendar_now": lambda: generate_state.compute_calendar_now(events, now),
+    }
+
+    results = {}
+    for name, fn in benches.items():
+        results[name] = measure(fn, repeat)
+    results["read_pipeline_state_cold"] = measure(pipeline_reader.read_pipeline_state, repeat,
+                                                  setup=pipeline_reader.clear)
+    results["generate_state_cold"] = measure(generate_state.generate_state, repeat, setup=memo.clear)
+    results["generate_state_warm"] = measure(generate_state.generate_state, repeat)
+    return results
+
+
+def compare(results: dict, baseline: dict) -> list[str]:
+    """Return names of benchmarks whose p50 regressed against baseline."""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        slower = r["p50_ms"] - base["p50_ms"]
+        if r["p50_ms"] > base["p50_ms"] * REGRESSION_RATIO and slower > MIN_REGRESSION_MS:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    repeat = _arg("--repeat", 20)
+    blocks = _arg("--blocks", 40)
+    tasks = _arg("--tasks", 500)
+    videos = _arg("--videos", 50)
+    log_lines = _arg("--log-lines", 5000)
+
+    results = run_suite(repeat, blocks, tasks, videos, log_lines)
+
+    baseline = {}
+    if BASELINE_PATH.exists():
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8")).get("results", {})
+
+    print(f"{blocks} blocks, {tasks} tasks, {videos} videos/channel, "
+          f"{log_lines} log lines, {repeat} runs\n")
+    print(f"{'benchmark':<24}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'peak KB':>10}{'vs base':>10}")
+    for name, r in results.items():
+        base = baseline.get(name)
+        delta = f"{r['p50_ms'] / base['p50_ms']:.2f}x" if base and base["p50_ms"] else "-"
+        print(f"{name:<24}{r['p50_ms']:>10.3f}{r['p90_ms']:>10.3f}{r['p99_ms']:>10.3f}"
+              f"{r['peak_kb']:>10.1f}{delta:>10}")
+
+    regressions = compare(results, baseline)
+    if regressions:
+        print(f"\nREGRESSED (p50 > {REGRESSION_RATIO:.2f}x baseline): {', '.join(regressions)}")
+
+    if "--save-baseline" in sys.argv:
+        BASELINE_PATH.write_text(json.dumps({
+            "params": {"repeat": repeat, "blocks": blocks, "tasks": tasks,
+                       "videos": videos, "log_lines": log_lines},
+            "results": results,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"\nBaseline saved to {BASELINE_PATH}")
+
+    if "--check" in sys.argv and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: TODAY.md parsing on a synthetic 5,000-line document.
+
+Times parsers.parse_today() (one pass, compiled patterns) and, with --against,
+the five per-section parsers from another git revision of mac/parsers.py.
+
+Usage:
+    python3 benchmarks/bench_today_parser.py
+    python3 benchmarks/bench_today_parser.py --against f9adb3e
+    python3 benchmarks/bench_today_parser.py --lines 20000 --repeat 20
+"""
+
+import importlib.util
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "mac"))
+
+import parsers  # noqa: E402
+from vault import today_md  # noqa: E402
+
+
+def load_revision(rev: str):
+    """Import mac/parsers.py as it was at git revision rev."""
+    source = subprocess.run(["git", "-C", str(ROOT), "show", f"{rev}:mac/parsers.py"],
+                            capture_output=True, text=True, check=True).stdout
+    path = Path(tempfile.mkdtemp()) / f"parsers_{rev.replace('/', '_')}.py"
+    path.write_text(source, encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_all_sections(module, content: str):
+    """Parse every TODAY.md section with the per-section API."""
+    return (module.parse_date_label(content), module.parse_day_overview(content),
+            module.parse_block_tracker(content), module.parse_recording_ready(content),
+            module.parse_done_today(content))
+
+
+def time_call(fn, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(label: str, samples: list[float]) -> float:
+    median = statistics.median(samples)
+    print(f"  {label:<34} median {median:8.3f} ms   min {min(samples):8.3f} ms")
+    return median
+
+
+def main():
+    lines, repeat, against = 5000, 50, None
+    if "--lines" in sys.argv:
+        lines = int(sys.argv[sys.argv.index("--lines") + 1])
+    if "--repeat" in sys.argv:
+        repeat = int(sys.argv[sys.argv.index("--repeat") + 1])
+    if "--against" in sys.argv:
+        against = sys.argv[sys.argv.index("--against") + 1]
+
+    content = today_md(total_lines=lines)
+    print(f"TODAY.md: {len(content.splitlines())} lines, {len(content) / 1024:.0f} KB, {repeat} runs")
+
+    current = report("parse_today (single pass)", time_call(lambda: parsers.parse_today(content), repeat))
+
+    if against:
+        legacy = load_revision(against)
+        baseline = report(f"5 section parsers @ {against}",
+                          time_call(lambda: parse_all_sections(legacy, content), repeat))
+        same = parse_all_sections(legacy, content) == parse_all_sections(parsers, content)
+        print(f"  speedup {baseline / current:.1f}x, identical output: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Synthetic FocusBoard inputs for benchmarks.
+
+Builders write a fake vault under a given home directory, using the same
+relative layout as mac/config.py, so modules imported with HOME pointed at
+that directory read the synthetic files without any path patching.
+"""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BLOCK_NAMES = ["Morning Foundation", "Creation", "Workout", "DEV-1", "DEV-2", "Clean Mama",
+               "Midday Reset", "EXEC-1", "EXEC-2", "Research", "LAB-1", "Family", "Wind-Down"]
+
+CHANNELS = ["channel-curator", "channel-pioneers", "channel-highestaura", "channel-zendo"]
+STAGES = ["idea", "scripting", "recording_ready", "recorded", "editing", "published"]
+
+
+def _block_times(blocks: int) -> list[str]:
+    """Block start times from 5:00 in 20-minute steps, in the 12-hour style TODAY.md uses."""
+    times = []
+    for i in range(blocks):
+        minutes = 5 * 60 + i * 20
+        h, m = divmod(minutes % (24 * 60), 60)
+        times.append(f"{(h - 1) % 12 + 1}:{m:02d}")
+    return times
+
+
+def today_md(blocks: int = 40, total_lines: int = 5000) -> str:
+    """A late-day TODAY.md: every section, then a long log to reach total_lines."""
+    times = _block_times(blocks)
+    out = ["# TODAY | Fri Feb 7", "", "## Day Overview", "",
+           "| Time | Block | File | Task | Source |",
+           "|------|-------|------|------|--------|"]
+    for i, t in enumerate(times):
+        name = BLOCK_NAMES[i % len(BLOCK_NAMES)]
+        out.append(f"| {t} | {name} | SOP-{i}.md | Task number {i} with some words | Source {i} |")
+    out += ["", "## Block Tracker", ""]
+    out += [f"- [{'x' if i % 2 else ' '}] {t} {BLOCK_NAMES[i % len(BLOCK_NAMES)]}"
+            for i, t in enumerate(times)]
+    out += ["", "## Recording Ready", "", "CC: 8 | Pioneers: 12 | HA: 7 | Zendo: 16 (43 total)",
+            "", "## Done Today", ""]
+    done_items = max(0, (total_lines - len(out)) // 4)
+    out += [f"- Finished item {i}: shipped a change and wrote notes" for i in range(done_items)]
+    out += ["", "## Log", ""]
+    i = 0
+    while len(out) < total_lines:
+        out.append(f"{i % 24:02d}:{i % 60:02d} note {i} | CC touched, HA: pending, some (text) here")
+        i += 1
+    return "\n".join(out) + "\n"
+
+
+def tasks_md(tasks: int = 500) -> str:
+    """TASKS.md with a mix of checked, P1, P2 and untagged tasks."""
+    out = ["# TASKS", "", "## High Priority", ""]
+    for i in range(tasks):
+        box = "x" if i % 5 == 0 else " "
+        tag = ("[P1]", "[P2]", "")[i % 3]
+        out.append(f"- [{box}] Task {i} needs doing {tag} (30m) #ctx{i % 4}".replace("  ", " "))
+    return "\n".join(out) + "\n"
+
+
+def daily_log_md(lines: int = 5000) -> str:
+    """A large daily log with wins, open items, blockers and prose."""
+    out = ["# Daily Log", ""]
+    for i in range(lines):
+        kind = i % 7
+        if kind == 0:
+            out.append(f"- [x] Win {i}: closed out a task")
+        elif kind == 1:
+            out.append(f"- [ ] Open item {i}")
+        elif kind == 2:
+            out.append(f"- BLOCKED on dependency {i % 10}")
+        else:
+            out.append(f"{i}: free-form note about the day, nothing to parse here")
+    return "\n".join(out) + "\n"
+
+
+def build_vault(home: Path, blocks: int = 40, today_lines: int = 5000, tasks: int = 500,
+                videos_per_channel: int = 50, log_lines: int = 5000) -> None:
+    """Write a complete synthetic vault (and YouTube-Ops tree) under home."""
+    claude = home / ".claude"
+    active = claude / "claude-vault" / "_active"
+    active.mkdir(parents=True, exist_ok=True)
+    (claude / "claude-vault" / "daily").mkdir(parents=True, exist_ok=True)
+    (claude / "timekeeper").mkdir(parents=True, exist_ok=True)
+    (claude / "daily").mkdir(parents=True, exist_ok=True)
+    (claude / "pi").mkdir(parents=True, exist_ok=True)
+
+    (active / "TODAY.md").write_text(today_md(blocks, today_lines), encoding="utf-8")
+    (active / "TASKS.md").write_text(tasks_md(tasks), encoding="utf-8")
+    qw = ["## Available"] + [f"- [ ] Quick win {i}" for i in range(20)] + ["", "## Done"]
+    (active / "QUICK-WINS.md").write_text("\n".join(qw) + "\n", encoding="utf-8")
+    (claude / "claude-vault" / "daily" / "focus.md").write_text(
+        "**Video:** CC-014\n**Action:** Record\n**File:** CC-014.md\n\n"
+        "## The ONE Thing\n\n**Ship the thing**\n", encoding="utf-8")
+    keystones = ["keystones:"] + [f"  {k}:\n    name: {k.title()}"
+                                  for k in ("RISE", "CREATE", "POWER", "BUILD", "GROUND")]
+    keystones += ["tracking:", "  critical_keystones: [RISE, BUILD]"]
+    (claude / "timekeeper" / "keystones.yaml").write_text("\n".join(keystones) + "\n", encoding="utf-8")
+    (claude / "timekeeper" / "philosophy.md").write_text(
+        "# Philosophy\n\n> \"Structure creates freedom. Trust the stacks.\"\n", encoding="utf-8")
+    (claude / "daily" / "current.md").write_text(daily_log_md(log_lines), encoding="utf-8")
+
+    ops = home / "Documents" / "Projects" / "Claude" / "terminal" / "YouTube-Ops"
+    for c, channel in enumerate(CHANNELS):
+        prefix = channel.split("-")[1][:2].upper()
+        for v in range(videos_per_channel):
+            video = ops / channel / "active" / f"{prefix}-{v:03d}-synthetic-video-{v}"
+            video.mkdir(parents=True, exist_ok=True)
+            (video / "state.yaml").write_text(
+                f"title: Synthetic video {v}\nstage: {STAGES[(v + c) % len(STAGES)]}\n"
+                f"notes:\n  - one\n  - two\nassets:\n  thumbnail: done\n  script: draft\n",
+                encoding="utf-8")
+
+
+def calendar_events(count: int = 60, now: datetime | None = None) -> list[dict]:
+    """Timed and all-day events around now, shaped like fetch_google_calendar() output."""
+    now = now or datetime.now().astimezone()
+    events = []
+    for i in range(count):
+        start = now + timedelta(minutes=30 * (i - count // 4))
+        end = start + timedelta(minutes=45 if i % 9 else 24 * 60)
+        events.append({
+            "title": f"Event {i} deep work",
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "all_day": i % 13 == 0,
+            "location": "",
+            "description": f"Description {i}",
+            "full_description": f"Description {i}",
+            "calendar_label": ("Personal", "Work", "Family")[i % 3],
+            "calendar_emoji": "",
+            "calendar_color": "#3498db",
+        })
+    return events
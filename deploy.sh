@@ -35,5 +35,8 @@ echo "Restarting focusboard service..."
 ssh -o ConnectTimeout=5 "$PI_HOST" "sudo systemctl restart focusboard" 2>/dev/null \
     && echo "  focusboard (kiosk): restarted" \
     || echo "  Warning: focusboard restart failed"
+ssh -o ConnectTimeout=5 "$PI_HOST" "sudo systemctl restart focusboard-push" 2>/dev/null \
+    && echo "  focusboard-push (events): restarted" \
+    || echo "  Warning: focusboard-push restart failed (run pi/install.sh to add it)"
 
 echo "Done. Dashboard is live."
@@ -1,55 +1,19 @@
 """FocusBoard external API calls and streak tracking."""
 
-import json
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from pathlib import Path
 
+from cache import cached
+from calendar_sync import event_bounds, sync_calendar
 from config import OWM_ICON_MAP
+from http_client import get_json, session as _session
 from log import get_logger
+from oauth import get_access_token, invalidate
 
 logger = get_logger("api")
 
-# ─── Cache ────────────────────────────────────────────────────────────────────
-
-CACHE_DIR = Path.home() / ".claude" / "pi" / "cache"
-
-# TTLs in seconds
-CACHE_TTLS = {
-    "weather": 30 * 60,    # 30 minutes
-    "calendar": 15 * 60,   # 15 minutes
-}
-
-
-def _read_cache(name: str) -> dict | None:
-    """Read cached data if file exists and TTL hasn't expired. Returns None on miss."""
-    cache_file = CACHE_DIR / f"{name}.json"
-    try:
-        if not cache_file.exists():
-            return None
-        data = json.loads(cache_file.read_text(encoding="utf-8"))
-        cached_at = data.get("_cached_at", 0)
-        ttl = CACHE_TTLS.get(name, 300)
-        if datetime.now().timestamp() - cached_at > ttl:
-            return None  # expired
-        return data.get("payload")
-    except (json.JSONDecodeError, PermissionError, OSError):
-        return None
-
-
-def _write_cache(name: str, payload) -> None:
-    """Write data to cache file with timestamp."""
-    cache_file = CACHE_DIR / f"{name}.json"
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        cache_file.write_text(
-            json.dumps({"_cached_at": datetime.now().timestamp(), "payload": payload},
-                       ensure_ascii=True),
-            encoding="utf-8",
-        )
-    except (PermissionError, OSError):
-        pass  # Non-critical
-
+# Days shown from the synced week: today and tomorrow
+DEFAULT_LOOKAHEAD_DAYS = 2
 
 DEFAULT_CALENDAR = {"id": "primary", "label": "Personal", "emoji": "\U0001f535", "color": "#3498db"}
 
@@ -57,21 +21,15 @@ DEFAULT_CALENDAR = {"id": "primary", "label": "Personal", "emoji": "\U0001f535",
 def fetch_google_calendar(config: dict) -> tuple[list[dict], list[dict]]:
     """Fetch upcoming events from multiple Google Calendars.
 
-    Uses OAuth2 refresh token flow. Returns (events, legend).
+    Uses OAuth2 refresh token flow, with access tokens reused from the
+    token store until shortly before they expire. Returns (events, legend).
     Supports up to 3 calendars via config 'calendars' array.
     Backward compatible: if no 'calendars' array, fetches from 'primary'.
-    Caches results for 15 minutes.
+    Events come from an incrementally synced local store (calendar_sync.py)
+    covering a week; 'lookahead_days' in the google_calendar config (default
+    2: today and tomorrow) picks how much of it is shown. Served through the
+    stale-while-revalidate cache.
     """
-    cached = _read_cache("calendar")
-    if cached is not None:
-        logger.info("Using cached calendar data")
-        if isinstance(cached, list):
-            # Old cache format (pre-multi-calendar): plain event list
-            return cached, []
-        events = cached.get("events", [])
-        legend = cached.get("legend", [])
-        return events, legend
-
     gc = config.get("google_calendar", {})
     client_id = gc.get("client_id", "")
     client_secret = gc.get("client_secret", "")
@@ -83,195 +41,164 @@ def fetch_google_calendar(config: dict) -> tuple[list[dict], list[dict]]:
     if client_id == "FROM_ZSHRC":
         return [], []
 
+    data = cached("calendar", lambda: _load_google_calendar(gc, _session))
+    lookahead = gc.get("lookahead_days", DEFAULT_LOOKAHEAD_DAYS)
+    return _upcoming(data.get("events", []), lookahead), data.get("legend", [])
+
+
+def _upcoming(events: list[dict], lookahead_days: int) -> list[dict]:
+    """Events still running or starting before the end of the lookahead.
+
+    The synced store covers a week; filtering here against the current time
+    keeps a cached payload correct for as long as it's served.
+    """
+    now = datetime.now().astimezone()
+    until = (now + timedelta(days=lookahead_days)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    upcoming = []
+    for event in events:
+        bounds = event_bounds(event, now.tzinfo)
+        if bounds is None or (bounds[1] > now and bounds[0] < until):
+            upcoming.append(event)
+    return upcoming
+
+
+def _load_google_calendar(gc: dict, session) -> dict:
+    """Sync all configured calendars. Raises if none could be synced.
+
+    session is the HTTP session to use (injectable for a local stand-in).
+    """
+    client_id = gc["client_id"]
+    client_secret = gc["client_secret"]
+    refresh_token = gc["refresh_token"]
+
     # Determine calendars to fetch (max 3)
     calendars = gc.get("calendars", [DEFAULT_CALENDAR])[:3]
     if not calendars:
         calendars = [DEFAULT_CALENDAR]
 
-    try:
-        # Get default access token
-        token_resp = requests.post(
-            "https://oauth2.googleapis.com/token",
-            data={
-                "client_id": client_id,
-                "client_secret": client_secret,
-                "refresh_token": refresh_token,
-                "grant_type": "refresh_token",
-            },
-            timeout=10,
-        )
-        token_resp.raise_for_status()
-        default_access_token = token_resp.json()["access_token"]
-
-        # Cache for per-calendar access tokens (keyed by refresh_token)
-        token_cache = {refresh_token: default_access_token}
-
-        # Fetch events: now through end of tomorrow
-        now = datetime.now().astimezone()
-        tomorrow_end = (now + timedelta(days=2)).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-
-        params = {
-            "timeMin": now.isoformat(),
-            "timeMax": tomorrow_end.isoformat(),
-            "singleEvents": "true",
-            "orderBy": "startTime",
-            "maxResults": "20",
-        }
-
-        all_events = []
-        for cal in calendars:
-            cal_id = cal.get("id", "primary")
-            cal_label = cal.get("label", "")
-            cal_emoji = cal.get("emoji", "")
-            cal_color = cal.get("color", "#3498db")
-            cal_refresh = cal.get("refresh_token", refresh_token)
-
-            # Get or create access token for this calendar's account
-            if cal_refresh not in token_cache:
-                try:
-                    tr = requests.post(
-                        "https://oauth2.googleapis.com/token",
-                        data={
-                            "client_id": client_id,
-                            "client_secret": client_secret,
-                            "refresh_token": cal_refresh,
-                            "grant_type": "refresh_token",
-                        },
-                        timeout=10,
-                    )
-                    tr.raise_for_status()
-                    token_cache[cal_refresh] = tr.json()["access_token"]
-                except Exception as exc:
-                    logger.error("Token exchange failed for calendar '%s': %s", cal_label, exc)
-                    continue
-
-            headers = {"Authorization": f"Bearer {token_cache[cal_refresh]}"}
-
+    # Calendars are fetched concurrently over the shared session's pool;
+    # results are merged in config order so the stable sort below keeps the
+    # same tie order as a sequential fetch.
+    all_events = []
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=len(calendars), thread_name_prefix="calendar") as pool:
+        futures = [
+            pool.submit(_fetch_calendar_events, session, cal, client_id, client_secret,
+                        cal.get("refresh_token", refresh_token))
+            for cal in calendars
+        ]
+        for cal, future in zip(calendars, futures):
             try:
-                events_resp = requests.get(
-                    f"https://www.googleapis.com/calendar/v3/calendars/{cal_id}/events",
-                    params=params,
-                    headers=headers,
-                    timeout=10,
-                )
-                events_resp.raise_for_status()
-
-                for item in events_resp.json().get("items", []):
-                    start = item.get("start", {})
-                    end = item.get("end", {})
-                    all_day = "date" in start and "dateTime" not in start
-
-                    full_desc = item.get("description", "").strip()
-                    # Truncate long descriptions for calendar list display
-                    desc = full_desc[:117] + "..." if len(full_desc) > 120 else full_desc
-
-                    event_data = {
-                        "title": item.get("summary", "(No title)"),
-                        "start": start.get("dateTime", start.get("date", "")),
-                        "end": end.get("dateTime", end.get("date", "")),
-                        "all_day": all_day,
-                        "location": item.get("location", ""),
-                        "description": desc,
-                        "full_description": full_desc,
-                        "calendar_label": cal_label,
-                        "calendar_emoji": cal_emoji,
-                        "calendar_color": cal_color,
-                    }
-                    if cal.get("bold"):
-                        event_data["bold"] = True
-                    all_events.append(event_data)
+                all_events.extend(future.result())
+                fetched += 1
             except Exception as exc:
-                logger.error("Calendar fetch failed for '%s': %s", cal_id, exc)
-                # Continue with other calendars
-
-        # Sort merged events by start time
-        all_events.sort(key=lambda e: e.get("start", ""))
-
-        # Build legend
-        legend = [{"label": c.get("label", ""), "emoji": c.get("emoji", ""), "color": c.get("color", "#3498db")} for c in calendars]
-
-        _write_cache("calendar", {"events": all_events, "legend": legend})
-        return all_events, legend
-
-    except Exception as exc:
-        logger.error("Google Calendar fetch failed: %s", exc)
-        return [], []
+                # One calendar failing doesn't hold up or drop the others
+                logger.error("Calendar fetch failed for '%s': %s", cal.get("label") or cal.get("id"), exc)
+
+    if not fetched:
+        raise RuntimeError("no calendar could be fetched")
+
+    # Sort merged events by start time
+    all_events.sort(key=lambda e: e.get("start", ""))
+
+    # Build legend
+    legend = [{"label": c.get("label", ""), "emoji": c.get("emoji", ""), "color": c.get("color", "#3498db")} for c in calendars]
+
+    return {"events": all_events, "legend": legend}
+
+
+def _fetch_calendar_events(session, cal: dict, client_id: str, client_secret: str,
+                           cal_refresh: str) -> list[dict]:
+    """Sync and shape one calendar's events. Raises on failure."""
+
+    def authorize(force: bool) -> str:
+        # Access tokens are shared per account and reused until near expiry
+        if force:
+            invalidate(cal_refresh)
+        return get_access_token(session, client_id, client_secret, cal_refresh)
+
+    items = sync_calendar(session, cal.get("id", "primary"), cal_refresh, authorize)
+
+    events = []
+    for item in items:
+        start = item.get("start", {})
+        end = item.get("end", {})
+        all_day = "date" in start and "dateTime" not in start
+
+        full_desc = item.get("description", "").strip()
+        # Truncate long descriptions for calendar list display
+        desc = full_desc[:117] + "..." if len(full_desc) > 120 else full_desc
+
+        event_data = {
+            "title": item.get("summary", "(No title)"),
+            "start": start.get("dateTime", start.get("date", "")),
+            "end": end.get("dateTime", end.get("date", "")),
+            "all_day": all_day,
+            "location": item.get("location", ""),
+            "description": desc,
+            "full_description": full_desc,
+            "calendar_label": cal.get("label", ""),
+            "calendar_emoji": cal.get("emoji", ""),
+            "calendar_color": cal.get("color", "#3498db"),
+        }
+        if cal.get("bold"):
+            event_data["bold"] = True
+        events.append(event_data)
+    return events
 
 
 def fetch_weather(config: dict) -> dict:
-    """Fetch current weather from OpenWeatherMap. Returns {} on failure.
+    """Fetch current weather from OpenWeatherMap ({} if not configured).
 
-    Caches results for 30 minutes.
+    Served through the stale-while-revalidate cache (fresh for 30 minutes),
+    revalidated with a conditional GET.
     """
-    cached = _read_cache("weather")
-    if cached is not None:
-        logger.info("Using cached weather data")
-        return cached
-
     wc = config.get("weather", {})
     api_key = wc.get("api_key", "")
-    zip_code = wc.get("zip", "34465")
-    country = wc.get("country", "US")
 
     if not api_key or api_key == "SIGNUP_AT_OPENWEATHERMAP":
         return {}
 
-    try:
-        resp = requests.get(
-            "https://api.openweathermap.org/data/2.5/weather",
-            params={
-                "zip": f"{zip_code},{country}",
-                "units": "imperial",
-                "appid": api_key,
-            },
-            timeout=10,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        main = data.get("main", {})
-        weather = data.get("weather", [{}])[0]
-        icon_code = weather.get("icon", "01d")
-
-        result = {
-            "temp": round(main.get("temp", 0)),
-            "feels_like": round(main.get("feels_like", 0)),
-            "high": round(main.get("temp_max", 0)),
-            "low": round(main.get("temp_min", 0)),
-            "condition": weather.get("main", ""),
-            "description": weather.get("description", ""),
-            "icon_char": OWM_ICON_MAP.get(icon_code, "\u2600"),
-            "humidity": main.get("humidity", 0),
-        }
-        _write_cache("weather", result)
-        return result
-
-    except Exception as exc:
-        logger.error("Weather fetch failed: %s", exc)
-        return {}
+    return cached("weather", lambda validators: _load_weather(wc, validators),
+                  conditional=True)
 
 
-PIPULSE_STREAKS_URL = "http://10.0.0.103:5055/api/keystones/streaks"
-
-
-def fetch_keystone_streaks(keystones: list[dict]) -> None:
-    """Fetch keystone streaks from PiPulse API, enrich keystones in-place.
-
-    Hits GET /api/keystones/streaks which returns:
-    {"RISE": {"current": 5, "best": 12}, "CREATE": {...}, ...}
-
-    Falls back to 0/0 if Pi is offline.
-    """
-    streaks = {}
-    try:
-        resp = requests.get(PIPULSE_STREAKS_URL, timeout=3)
-        resp.raise_for_status()
-        streaks = resp.json()
-    except Exception as exc:
-        logger.warning("Keystone streaks fetch failed (Pi offline?): %s", exc)
+def _load_weather(wc: dict, validators: dict) -> tuple[dict, dict]:
+    """Fetch and shape current conditions. Raises on failure (NotModified on 304)."""
+    zip_code = wc.get("zip", "34465")
+    country = wc.get("country", "US")
 
+    data, validators = get_json(
+        "https://api.openweathermap.org/data/2.5/weather",
+        validators,
+        params={
+            "zip": f"{zip_code},{country}",
+            "units": "imperial",
+            "appid": wc["api_key"],
+        },
+        timeout=10,
+    )
+
+    main = data.get("main", {})
+    weather = data.get("weather", [{}])[0]
+    icon_code = weather.get("icon", "01d")
+
+    return {
+        "temp": round(main.get("temp", 0)),
+        "feels_like": round(main.get("feels_like", 0)),
+        "high": round(main.get("temp_max", 0)),
+        "low": round(main.get("temp_min", 0)),
+        "condition": weather.get("main", ""),
+        "description": weather.get("description", ""),
+        "icon_char": OWM_ICON_MAP.get(icon_code, "\u2600"),
+        "humidity": main.get("humidity", 0),
+    }, validators
+
+
+def apply_keystone_streaks(keystones: list[dict], streaks: dict) -> None:
+    """Enrich keystones in-place with current/best streaks (0/0 if unknown)."""
     for ks in keystones:
         kid = ks.get("id", "")
         ks_streaks = streaks.get(kid, {})
@@ -0,0 +1,127 @@
+"""Circuit breaker for flaky upstream hosts (PiPulse).
+
+closed    -> calls go through; FAILURE_THRESHOLD consecutive failures open it.
+open      -> calls fail immediately with CircuitOpen until the backoff ends.
+half-open -> one probe call is let through: success closes the circuit,
+             failure re-opens it with the backoff doubled (up to MAX_BACKOFF).
+
+State is persisted in the cache store's "breaker" namespace, so a one-shot
+generator respects a backoff started by an earlier run. Callers pair this
+with the stale-while-revalidate cache: an open circuit makes the loader fail
+instantly and the cached value is served without waiting on a timeout.
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+from cache_store import get_store
+from http_client import NotModified
+from log import get_logger
+
+logger = get_logger("breaker")
+
+NAMESPACE = "breaker"
+
+FAILURE_THRESHOLD = 2
+BASE_BACKOFF_SEC = 30
+MAX_BACKOFF_SEC = 30 * 60
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpen(Exception):
+    """The circuit is open: the call was skipped without touching the network."""
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker with exponential backoff."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._probing = False
+        self._loaded = False
+        self.state = CLOSED
+        self.failures = 0
+        self.backoff = BASE_BACKOFF_SEC
+        self.open_until = 0.0
+
+    def _load(self) -> None:
+        """Restore persisted state on first use (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        entry = get_store().get(NAMESPACE, self.name, count=False)
+        saved = entry.value if entry is not None and entry.has_value else {}
+        self.state = saved.get("state", CLOSED)
+        self.failures = saved.get("failures", 0)
+        self.backoff = saved.get("backoff", BASE_BACKOFF_SEC)
+        self.open_until = saved.get("open_until", 0.0)
+
+    def _save(self) -> None:
+        get_store().put(NAMESPACE, self.name, {
+            "state": self.state, "failures": self.failures,
+            "backoff": self.backoff, "open_until": self.open_until,
+        })
+
+    def _allow(self) -> bool:
+        with self._lock:
+            self._load()
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if time.time() < self.open_until:
+                    return False
+                self.state = HALF_OPEN
+                self._probing = False
+            # Half-open: exactly one probe at a time
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def _record(self, ok: bool) -> None:
+        with self._lock:
+            was = self.state
+            self._probing = False
+            if ok:
+                self.state, self.failures, self.backoff = CLOSED, 0, BASE_BACKOFF_SEC
+            else:
+                self.failures += 1
+                if was == HALF_OPEN:
+                    self.backoff = min(self.backoff * 2, MAX_BACKOFF_SEC)
+                if was == HALF_OPEN or self.failures >= FAILURE_THRESHOLD:
+                    self.state = OPEN
+                    self.open_until = time.time() + self.backoff
+            if self.state != was:
+                logger.info("Circuit '%s' %s -> %s", self.name, was, self.state)
+            if self.state != was or not ok:
+                self._save()
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """Run fn() through the breaker.
+
+        Raises CircuitOpen without calling fn while open. Any exception from
+        fn counts as a failure, except NotModified, which proves the host is
+        up.
+        """
+        if not self._allow():
+            raise CircuitOpen(self.name)
+        try:
+            result = fn()
+        except NotModified:
+            self._record(True)
+            raise
+        except Exception:
+            self._record(False)
+            raise
+        self._record(True)
+        return result
+
+    def status(self) -> dict:
+        """Snapshot for state["system"]: {"state", "failures", "retry_in_sec"}."""
+        with self._lock:
+            self._load()
+            retry = max(0, round(self.open_until - time.time())) if self.state == OPEN else 0
+            return {"state": self.state, "failures": self.failures, "retry_in_sec": retry}
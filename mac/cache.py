@@ -0,0 +1,150 @@
+"""Stale-while-revalidate cache for FocusBoard's network sources.
+
+Each source has three windows:
+- fresh:    served as-is, no network;
+- stale:    served immediately while a background thread refreshes it;
+- negative: after a failed fetch, no new attempt is made for this long, so a
+            dead upstream doesn't cost a timeout every cycle.
+
+Only a cold cache (nothing stored, or older than the stale window) blocks
+on the upstream, so generation latency no longer tracks API latency.
+Entries live in the "swr" namespace of the unified cache store and expire
+there with the stale window. Sources fetched with conditional GETs keep
+their ETag/Last-Modified in the entry's meta, and a 304 only restarts the
+fresh window.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from breaker import CircuitOpen
+from cache_store import get_store
+from fanout import SourceUnavailable
+from http_client import NotModified
+from log import get_logger, annotate
+
+logger = get_logger("cache")
+
+
+@dataclass(frozen=True)
+class Policy:
+    fresh: float     # seconds an entry is served without revalidating
+    stale: float     # seconds an entry may still be served while refreshing
+    negative: float  # seconds to back off after a failed fetch
+
+
+POLICIES = {
+    "weather": Policy(fresh=30 * 60, stale=6 * 3600, negative=5 * 60),
+    # Incremental calendar syncs are cheap, and the payload covers a week
+    # that's filtered against the clock on every read, so it can be polled
+    # often and still served for days when Google is unreachable
+    "calendar": Policy(fresh=5 * 60, stale=3 * 24 * 3600, negative=2 * 60),
+    # Habits and streaks from PiPulse (LAN, conditional GETs). Habits change
+    # when boxes are ticked on the Pi: revalidate every cycle
+    "pipulse": Policy(fresh=30, stale=24 * 3600, negative=60),
+}
+DEFAULT_POLICY = Policy(fresh=5 * 60, stale=3600, negative=60)
+
+NAMESPACE = "swr"
+
+_lock = threading.Lock()
+_refreshing: dict[str, threading.Thread] = {}
+
+
+def _fetch(name: str, loader: Callable, conditional: bool = False) -> tuple[bool, Any]:
+    """Run loader and record the outcome. Returns (ok, value).
+
+    A conditional loader is called with the stored validators and returns
+    (value, validators); NotModified keeps the stored payload and restarts
+    its fresh window.
+    """
+    store = get_store()
+    policy = POLICIES.get(name, DEFAULT_POLICY)
+    entry = store.get(NAMESPACE, name, count=False) if conditional else None
+    try:
+        if conditional:
+            value, validators = loader(entry.meta if entry and entry.has_value else {})
+        else:
+            value, validators = loader(), {}
+    except NotModified:
+        store.touch(NAMESPACE, name, ttl=policy.stale)
+        return True, entry.value if entry else None
+    except CircuitOpen:
+        # Skipped, not failed: the breaker already tracks the outage
+        return False, None
+    except Exception as exc:
+        logger.warning("Refresh of '%s' failed: %s", name, exc)
+        store.mark_failed(NAMESPACE, name, ttl=policy.negative)
+        return False, None
+    store.put(NAMESPACE, name, value, ttl=policy.stale, meta=validators or None)
+    return True, value
+
+
+def _refresh_in_background(name: str, loader: Callable, conditional: bool) -> None:
+    """Start one background refresh per source (no-op if one is running)."""
+    with _lock:
+        running = _refreshing.get(name)
+        if running is not None and running.is_alive():
+            return
+
+        def run():
+            ok, _ = _fetch(name, loader, conditional)
+            if ok:
+                logger.info("Refreshed '%s' in background", name)
+
+        t = threading.Thread(target=run, name=f"refresh-{name}", daemon=True)
+        _refreshing[name] = t
+        t.start()
+
+
+def cached(name: str, loader: Callable, conditional: bool = False) -> Any:
+    """Return name's value under its stale-while-revalidate policy.
+
+    loader() fetches a fresh value and raises on failure. With
+    conditional=True it's called as loader(validators) and returns
+    (value, validators), raising http_client.NotModified on a 304.
+    Raises SourceUnavailable when nothing is cached and the fetch failed
+    (or is backing off). Annotates the current span with cache="fresh",
+    "stale", "negative" or "miss".
+    """
+    policy = POLICIES.get(name, DEFAULT_POLICY)
+    now = time.time()
+    entry = get_store().get(NAMESPACE, name)
+    age = now - entry.updated_at if entry and entry.has_value else None
+    backing_off = entry is not None and now - entry.failed_at < policy.negative
+
+    if age is not None and age < policy.fresh:
+        annotate(cache="fresh")
+        return entry.value
+
+    if age is not None and age < policy.stale:
+        annotate(cache="stale")
+        if not backing_off:
+            _refresh_in_background(name, loader, conditional)
+        return entry.value
+
+    if backing_off:
+        annotate(cache="negative")
+        raise SourceUnavailable(f"'{name}' backing off after a failed fetch")
+
+    annotate(cache="miss")
+    ok, value = _fetch(name, loader, conditional)
+    if not ok:
+        annotate(outcome="error")
+        raise SourceUnavailable(f"'{name}' fetch failed")
+    return value
+
+
+def wait_for_refreshes(timeout: float) -> None:
+    """Give in-flight background refreshes up to timeout seconds to land.
+
+    A one-shot generator calls this before exiting so its refreshes aren't
+    cut off with the process; the resident daemon never needs to.
+    """
+    with _lock:
+        threads = list(_refreshing.values())
+    deadline = time.monotonic() + timeout
+    for t in threads:
+        t.join(max(0.0, deadline - time.monotonic()))
@@ -0,0 +1,295 @@
+"""Unified on-disk cache store for FocusBoard (SQLite).
+
+Every persisted cache — stale-while-revalidate source payloads, last-good
+fan-out values, OAuth access tokens, per-calendar event stores — lives in one
+SQLite database as (namespace, key) rows. That gives:
+- atomic writes: each put is a transaction, so a crash mid-write leaves the
+  previous value, never a truncated file;
+- per-key TTLs: rows carry expires_at and are invisible once past it;
+- size-bounded eviction: past MAX_BYTES, expired rows go first, then the
+  least recently used;
+- schema versioning via PRAGMA user_version (a mismatch rebuilds the cache,
+  which is always safe to lose, and deletes the JSON cache files the store
+  replaced, OAuth access tokens among them);
+- hit/miss counters per namespace, persisted alongside the data and logged
+  with each cycle's timings in metrics.jsonl.
+
+The store is safe to share between threads and between the daemon and a
+one-shot generator process (WAL mode, busy timeout).
+"""
+
+import functools
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from config import CACHE_DB_PATH, CACHE_DIR
+from log import get_logger
+
+logger = get_logger("store")
+
+# 2: first build also removes the legacy JSON caches
+SCHEMA_VERSION = 2
+
+# Per-file caches that predate the store: the swr entries, last-good.json and
+# oauth-tokens.json in CACHE_DIR, the calendar event stores, the habits cache
+LEGACY_CACHE_GLOBS = ((CACHE_DIR, "*.json"), (CACHE_DIR / "calendar-sync", "*.json"))
+LEGACY_CACHE_FILES = (CACHE_DIR.parent / "habits-api-cache.json",)
+
+# Total payload bytes kept before eviction kicks in
+MAX_BYTES = 20_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT,
+    meta        TEXT,
+    size        INTEGER NOT NULL DEFAULT 0,
+    updated_at  REAL,
+    expires_at  REAL,
+    failed_at   REAL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE TABLE IF NOT EXISTS counters (
+    namespace TEXT PRIMARY KEY,
+    hits      INTEGER NOT NULL DEFAULT 0,
+    misses    INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _safe(default=None):
+    """Degrade a store method to a miss/no-op on SQLite errors (disk full, locked)."""
+    def wrap(method):
+        @functools.wraps(method)
+        def inner(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except sqlite3.Error as exc:
+                logger.warning("Cache store %s failed: %s", method.__name__, exc)
+                return default
+        return inner
+    return wrap
+
+
+def _remove_legacy_caches() -> None:
+    """Delete the JSON cache files the store replaced (run once, on migration)."""
+    paths = list(LEGACY_CACHE_FILES)
+    for directory, pattern in LEGACY_CACHE_GLOBS:
+        paths.extend(directory.glob(pattern))
+    removed = 0
+    for path in paths:
+        try:
+            path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+        except OSError as exc:
+            logger.warning("Can't remove legacy cache %s: %s", path, exc)
+    try:
+        (CACHE_DIR / "calendar-sync").rmdir()
+    except OSError:
+        pass
+    if removed:
+        logger.info("Removed %d legacy cache files", removed)
+
+
+@dataclass
+class Entry:
+    value: Any            # None when only a failure has been recorded
+    has_value: bool
+    updated_at: float     # when value was stored (0 if never)
+    failed_at: float      # last recorded failure (0 if none)
+    meta: dict            # small side data, e.g. HTTP validators
+
+
+class CacheStore:
+    """Namespaced key/value cache backed by one SQLite file."""
+
+    def __init__(self, path=CACHE_DB_PATH, max_bytes: int = MAX_BYTES):
+        """path=None keeps the store in memory."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        if self.path is not None:
+            # Holds OAuth access tokens, in the -wal/-shm sidecars too (created
+            # with the default umask): keep the whole directory private
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.parent.chmod(0o700)
+        db = sqlite3.connect(str(self.path) if self.path is not None else ":memory:",
+                             timeout=5, check_same_thread=False, isolation_level=None)
+        if self.path is not None:
+            self.path.chmod(0o600)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        version = db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            if version:
+                logger.info("Cache schema %d -> %d, rebuilding", version, SCHEMA_VERSION)
+            db.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS counters;")
+            db.executescript(_SCHEMA)
+            db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            if self.path is not None:
+                _remove_legacy_caches()
+        return db
+
+    def _count(self, namespace: str, hit: bool) -> None:
+        column = "hits" if hit else "misses"
+        self._db.execute(
+            f"INSERT INTO counters (namespace, {column}) VALUES (?, 1) "
+            f"ON CONFLICT(namespace) DO UPDATE SET {column} = {column} + 1",
+            (namespace,),
+        )
+
+    @_safe()
+    def get(self, namespace: str, key: str, count: bool = True) -> Entry | None:
+        """Return the live entry for key, or None.
+
+        Counts a hit or miss for namespace unless count=False (internal
+        re-reads that aren't a lookup of their own).
+        """
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, meta, updated_at, failed_at FROM entries "
+                "WHERE namespace = ? AND key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (namespace, key, now),
+            ).fetchone()
+            if count:
+                self._count(namespace, row is not None and row[0] is not None)
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                (now, namespace, key),
+            )
+        value, meta, updated_at, failed_at = row
+        return Entry(
+            value=json.loads(value) if value is not None else None,
+            has_value=value is not None,
+            updated_at=updated_at or 0,
+            failed_at=failed_at or 0,
+            meta=json.loads(meta) if meta else {},
+        )
+
+    @_safe()
+    def put(self, namespace: str, key: str, value: Any, ttl: float | None = None,
+            meta: dict | None = None) -> None:
+        """Store value under key, replacing it atomically. ttl=None never expires."""
+        now = time.time()
+        blob = json.dumps(value, ensure_ascii=True)
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(namespace, key, value, meta, size, updated_at, expires_at, failed_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?)",
+                    (namespace, key, blob, json.dumps(meta) if meta else None, len(blob),
+                     now, now + ttl if ttl is not None else None, now),
+                )
+                self._evict(now)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    @_safe()
+    def touch(self, namespace: str, key: str, ttl: float | None = None) -> None:
+        """Mark an existing value as just revalidated (e.g. after an HTTP 304)."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE entries SET updated_at = ?, expires_at = ?, failed_at = NULL "
+                "WHERE namespace = ? AND key = ?",
+                (now, now + ttl if ttl is not None else None, namespace, key),
+            )
+
+    @_safe()
+    def mark_failed(self, namespace: str, key: str, ttl: float) -> None:
+        """Record a failed refresh, keeping any stored value.
+
+        The row is kept visible for at least ttl so the failure itself can be
+        cached (negative caching) even when the value has expired.
+        """
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO entries (namespace, key, failed_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(namespace, key) DO UPDATE SET failed_at = excluded.failed_at, "
+                "expires_at = CASE WHEN expires_at IS NULL THEN NULL "
+                "ELSE MAX(expires_at, excluded.expires_at) END",
+                (namespace, key, now, now + ttl, now),
+            )
+
+    @_safe()
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?",
+                             (namespace, key))
+
+    @_safe(default={})
+    def stats(self) -> dict:
+        """{namespace: {"hits", "misses", "entries", "bytes"}}."""
+        with self._lock:
+            counters = self._db.execute("SELECT namespace, hits, misses FROM counters").fetchall()
+            sizes = self._db.execute(
+                "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace"
+            ).fetchall()
+        out: dict[str, dict] = {}
+        for ns, hits, misses in counters:
+            out[ns] = {"hits": hits, "misses": misses, "entries": 0, "bytes": 0}
+        for ns, count, size in sizes:
+            out.setdefault(ns, {"hits": 0, "misses": 0})
+            out[ns].update(entries=count, bytes=size or 0)
+        return out
+
+    def _evict(self, now: float) -> None:
+        """Drop expired rows, then least recently used ones, down to max_bytes."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._db.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for namespace, key, size in self._db.execute(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((namespace, key))
+            total -= size
+        self._db.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", victims)
+        logger.info("Evicted %d cache entries", len(victims))
+
+
+_store: CacheStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> CacheStore:
+    """The process-wide store, opened on first use.
+
+    Falls back to an in-memory database if the file can't be opened, so a
+    broken cache costs freshness, never a sync.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            try:
+                _store = CacheStore()
+            except (sqlite3.Error, OSError) as exc:
+                logger.warning("Cache store unavailable (%s), using memory", exc)
+                _store = CacheStore(path=None)
+        return _store
@@ -0,0 +1,204 @@
+"""Incremental Google Calendar sync with a local per-calendar event store.
+
+Each calendar keeps a store of raw events covering a wide window (start of
+today through WINDOW_DAYS ahead), saved as one entry in the cache store. The
+first sync of a day pulls the whole window; later syncs ask only for events
+changed since the last one (updatedMin, using the server's own "updated"
+stamp, with showDeleted so cancellations arrive as status="cancelled" and are
+dropped). That query isn't limited to the window, or an event moved out of it
+would never come back and would linger at its old time; changed events that no
+longer overlap the window are dropped locally instead. When nothing changed,
+the next incremental query is identical, so it's sent with the previous
+response's ETag and usually answered 304. Calendar's syncToken would be
+tighter, but its initial sync can't be bounded by timeMin/timeMax, which would
+mean mirroring the calendar's entire history.
+
+A full resync happens when the day (and so the window) changes, when the
+store is missing or from an older version, or when Google answers 410 Gone
+because updatedMin is too far back.
+
+The HTTP session is injectable, so anything with requests' get() signature
+(e.g. a local fake) can stand in for Google.
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Callable
+
+from cache_store import get_store
+from http_client import NotModified, conditional_headers, response_validators
+from log import get_logger, annotate, span
+
+logger = get_logger("calendar")
+
+NAMESPACE = "calendar_sync"
+STORE_VERSION = 1
+STORE_TTL_SEC = 2 * 24 * 3600
+
+# Days of events kept locally, starting at today's midnight
+WINDOW_DAYS = 7
+
+EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/{}/events"
+PAGE_SIZE = 250
+
+# Raw fields kept per event; everything else in the API response is dropped
+_KEEP = ("id", "status", "summary", "description", "location", "start", "end")
+
+
+class SyncExpired(Exception):
+    """Google rejected the incremental query (410 Gone): resync fully."""
+
+
+def _store_key(cal_id: str, account: str) -> str:
+    return hashlib.sha256(f"{account}:{cal_id}".encode("utf-8")).hexdigest()[:16]
+
+
+def _load_store(key: str) -> dict:
+    entry = get_store().get(NAMESPACE, key)
+    if entry is not None and entry.has_value and entry.value.get("version") == STORE_VERSION:
+        return entry.value
+    return {}
+
+
+def _window(now: datetime) -> tuple[datetime, datetime]:
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return start, start + timedelta(days=WINDOW_DAYS)
+
+
+def _list_events(session, url: str, params: dict, authorize: Callable[[bool], str],
+                 validators: dict | None = None) -> tuple[list[dict], str, dict]:
+    """Fetch all pages of an events query.
+
+    Returns (items, server "updated", first-page validators). authorize(force)
+    returns a bearer token; force=True after a 401 asks for a freshly
+    exchanged one. validators make the first page conditional; raises
+    NotModified on 304 and SyncExpired on 410.
+    """
+    items, updated, page_token, first = [], "", None, {}
+    token = authorize(False)
+    while True:
+        page_params = dict(params, pageToken=page_token) if page_token else params
+        headers = {} if page_token else conditional_headers(validators or {})
+        resp = session.get(url, params=page_params, timeout=10,
+                           headers={**headers, "Authorization": f"Bearer {token}"})
+        if resp.status_code == 401:
+            # Revoked or expired early: exchange once more and retry
+            token = authorize(True)
+            resp = session.get(url, params=page_params, timeout=10,
+                               headers={**headers, "Authorization": f"Bearer {token}"})
+        if resp.status_code == 304:
+            raise NotModified(url)
+        if resp.status_code == 410:
+            raise SyncExpired(url)
+        resp.raise_for_status()
+        if not page_token:
+            first = response_validators(resp)
+
+        body = resp.json()
+        items.extend(body.get("items", []))
+        updated = body.get("updated", updated)
+        page_token = body.get("nextPageToken")
+        if not page_token:
+            return items, updated, first
+
+
+def sync_calendar(session, cal_id: str, account: str,
+                  authorize: Callable[[bool], str],
+                  now: datetime | None = None) -> list[dict]:
+    """Bring one calendar's local store up to date and return its events.
+
+    Args:
+        session: requests.Session (or a stand-in with the same get()).
+        cal_id: Google calendar ID.
+        account: Stable per-account key (keeps stores of the same calendar
+                 ID on different accounts apart).
+        authorize: authorize(force) -> access token.
+        now: Current time (tz-aware); defaults to the local clock.
+
+    Returns:
+        Raw event dicts in the stored window, sorted by start. Raises on
+        network/HTTP failure; the previous store is left untouched.
+    """
+    now = now or datetime.now().astimezone()
+    window_start, window_end = _window(now)
+    key = _store_key(cal_id, account)
+    store = _load_store(key)
+    url = EVENTS_URL.format(cal_id)
+
+    params = {
+        "singleEvents": "true",
+        "showDeleted": "true",
+        "maxResults": str(PAGE_SIZE),
+    }
+    full_params = dict(params, timeMin=window_start.isoformat(), timeMax=window_end.isoformat())
+
+    incremental = store.get("window_start") == window_start.isoformat() and store.get("updated")
+    validators = {}
+    with span("calendar.events"):
+        if incremental:
+            since = store["updated"]
+            # An unchanged calendar repeats the same query: revalidate it
+            conditional = store.get("validators", {}) if store.get("validators_for") == since else {}
+            try:
+                changes, updated, validators = _list_events(
+                    session, url, dict(params, updatedMin=since), authorize, conditional)
+            except NotModified:
+                changes, updated, validators = [], since, conditional
+            except SyncExpired:
+                logger.info("Incremental sync expired for '%s', resyncing", cal_id)
+                incremental = False
+            store["validators_for"] = since
+        if not incremental:
+            changes, updated, _ = _list_events(session, url, full_params, authorize)
+            store = {"version": STORE_VERSION, "window_start": window_start.isoformat(),
+                     "events": {}}
+        annotate(sync="incremental" if incremental else "full", changes=len(changes))
+
+    events = store["events"]
+    for item in changes:
+        event_id = item.get("id")
+        if not event_id:
+            continue
+        if item.get("status") == "cancelled" or not _in_window(item, window_start, window_end):
+            events.pop(event_id, None)
+        else:
+            events[event_id] = {k: item[k] for k in _KEEP if k in item}
+    store["updated"] = updated or store.get("updated", "")
+    store["validators"] = validators
+    # A stored window is useless after tomorrow: let it expire
+    get_store().put(NAMESPACE, key, store, ttl=STORE_TTL_SEC)
+
+    return sorted(events.values(), key=_start_key)
+
+
+def _in_window(item: dict, window_start: datetime, window_end: datetime) -> bool:
+    """True if a raw event overlaps [window_start, window_end), as timeMin/timeMax select."""
+    start, end = item.get("start", {}), item.get("end", {})
+    bounds = event_bounds({"start": start.get("dateTime", start.get("date", "")),
+                           "end": end.get("dateTime", end.get("date", ""))},
+                          window_start.tzinfo)
+    if bounds is None:
+        return True
+    return bounds[1] > window_start and bounds[0] < window_end
+
+
+def _start_key(item: dict) -> str:
+    start = item.get("start", {})
+    return start.get("dateTime", start.get("date", ""))
+
+
+def event_bounds(event: dict, tz) -> tuple[datetime, datetime] | None:
+    """(start, end) of a shaped event as tz-aware datetimes; None if unparseable.
+
+    All-day events ("YYYY-MM-DD") span local midnights, end exclusive.
+    """
+    try:
+        start = datetime.fromisoformat(event["start"])
+        end = datetime.fromisoformat(event["end"]) if event.get("end") else start
+    except (KeyError, ValueError):
+        return None
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=tz)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=tz)
+    return start, end
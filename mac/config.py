@@ -14,10 +14,34 @@ PHILOSOPHY_PATH = Path.home() / ".claude" / "timekeeper" / "philosophy.md"
 CONFIG_PATH = Path.home() / ".claude" / "pi" / "focusboard-config.json"
 DAILY_LOG_PATH = Path.home() / ".claude" / "daily" / "current.md"
 QUICK_WINS_PATH = VAULT_ACTIVE / "QUICK-WINS.md"
+TASKS_PATH = VAULT_ACTIVE / "TASKS.md"
 SYNC_LOG_PATH = Path.home() / ".claude" / "pi" / "sync.log"
-HABITS_API_URL = "http://10.0.0.103:5055/api/habits/state"
-HABITS_API_CACHE = Path.home() / ".claude" / "pi" / "habits-api-cache.json"
+PIPULSE_URL = "http://10.0.0.103:5055"
 YOUTUBE_OPS_PATH = Path.home() / "Documents" / "Projects" / "Claude" / "terminal" / "YouTube-Ops"
+CACHE_DIR = Path.home() / ".claude" / "pi" / "cache"
+CACHE_DB_PATH = CACHE_DIR / "cache.sqlite3"
+
+# Reminders' Core Data stores (current, then pre-Catalina layout): any local
+# edit or iCloud sync bumps an mtime in here
+REMINDERS_STORE_DIRS = (
+    Path.home() / "Library" / "Group Containers" / "group.com.apple.reminders" / "Container_v1" / "Stores",
+    Path.home() / "Library" / "Reminders" / "Container_v1" / "Stores",
+)
+
+# ─── Sync ────────────────────────────────────────────────────────────────────
+
+# Global deadline for the concurrent source fan-out. Must stay well under the
+# 30s timeout sync_runner.py gives generate_state.py.
+SOURCE_DEADLINE_SEC = 20
+
+# Watch-triggered cycles trade network freshness for latency: sources that
+# can't answer this fast fall back to their last good value.
+WATCH_DEADLINE_SEC = 1.0
+
+# Vault inputs whose edits trigger an immediate regeneration in --watch mode
+WATCH_PATHS = (
+    TODAY_PATH, TASKS_PATH, QUICK_WINS_PATH, FOCUS_PATH, KEYSTONES_PATH, DAILY_LOG_PATH,
+)
 
 # Block type mapping derived from philosophy.md
 BLOCK_TYPES = {
@@ -162,11 +186,26 @@ def _validate_config(config: dict) -> None:
             logger.warning("Config missing or placeholder: %s", field)
 
 
+_config_cache: tuple[int, dict] | None = None
+
+
 def load_config() -> dict:
-    """Load focusboard-config.json, validate, return {} on failure."""
+    """Load focusboard-config.json, validate, return {} on failure.
+
+    Cached by file mtime so a resident sync daemon only re-parses after edits.
+    """
+    global _config_cache
+    try:
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _config_cache is not None and _config_cache[0] == mtime:
+        return _config_cache[1]
+
     try:
         config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
     except (FileNotFoundError, PermissionError, json.JSONDecodeError):
         return {}
     _validate_config(config)
+    _config_cache = (mtime, config)
     return config
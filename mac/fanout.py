@@ -0,0 +1,112 @@
+"""Concurrent fan-out for FocusBoard's independent data sources.
+
+Each source runs on its own daemon thread under one global deadline. A source
+that misses the deadline (or raises) falls back to its last good value, which
+is persisted between runs (in the cache store's "last_good" namespace) so a
+one-shot generator still has something to show. A source with nothing real to
+return raises SourceUnavailable rather than returning an empty default, so
+the empty value never replaces the last good one.
+"""
+
+import threading
+import time
+from typing import Any, Callable
+
+from cache_store import get_store
+from log import discard, get_logger, record_span, span
+
+logger = get_logger("fanout")
+
+NAMESPACE = "last_good"
+
+
+class SourceUnavailable(Exception):
+    """Raised by a source that failed and has no real value to return.
+
+    The source has already logged why; fan_out serves the last good value.
+    """
+
+
+def _load_last_good(names) -> dict:
+    """Persisted last-good values for names (missing ones omitted)."""
+    store = get_store()
+    values = {}
+    for name in names:
+        entry = store.get(NAMESPACE, name)
+        if entry is not None and entry.has_value:
+            values[name] = entry.value
+    return values
+
+
+def fan_out(sources: dict[str, tuple[Callable[[], Any], Any]],
+            deadline_sec: float) -> dict:
+    """Run all sources concurrently and collect results by a single deadline.
+
+    Args:
+        sources: name -> (zero-arg callable, default value).
+        deadline_sec: Wall-clock budget shared by every source.
+
+    Returns:
+        name -> value. Timed-out or failed sources get their last good value,
+        else the default. Each source is timed as a span under its own name;
+        one that misses the deadline is recorded with outcome="timeout".
+
+    Threads are daemonic, so a source still hanging past the deadline never
+    blocks interpreter exit.
+    """
+    outcomes: dict[str, tuple[str, Any]] = {}
+    timed_out: set[str] = set()
+    lock = threading.Lock()
+
+    def run(name: str, fn: Callable[[], Any]) -> None:
+        with span(name) as record:
+            try:
+                outcome = ("ok", fn())
+            except SourceUnavailable as exc:
+                logger.info("Source '%s' unavailable: %s", name, exc)
+                record["outcome"] = "error"
+                outcome = ("error", None)
+            except Exception as exc:
+                logger.error("Source '%s' failed: %s", name, exc)
+                record["outcome"] = "error"
+                outcome = ("error", None)
+            with lock:
+                # Already recorded as a timeout span: don't count it twice
+                if name in timed_out:
+                    discard(record)
+                outcomes[name] = outcome
+
+    started = time.monotonic()
+    threads = []
+    for name, (fn, _default) in sources.items():
+        t = threading.Thread(target=run, args=(name, fn), name=f"source-{name}", daemon=True)
+        t.start()
+        threads.append(t)
+
+    deadline = started + deadline_sec
+    for t in threads:
+        t.join(max(0.0, deadline - time.monotonic()))
+
+    with lock:
+        finished = dict(outcomes)
+        timed_out.update(n for n in sources if n not in finished)
+
+    failed = [n for n in sources if n not in finished or finished[n][0] != "ok"]
+    last_good = _load_last_good(failed)
+    store = get_store()
+    results = {}
+    for name, (_fn, default) in sources.items():
+        if name in finished:
+            status, value = finished[name]
+        else:
+            status, value = "timeout", None
+            record_span(name, (time.monotonic() - started) * 1000, outcome="timeout")
+            logger.warning("Source '%s' missed the %.0fs deadline", name, deadline_sec)
+
+        if status == "ok":
+            results[name] = value
+            store.put(NAMESPACE, name, value)
+        else:
+            results[name] = last_good.get(name, default)
+
+    return results
@@ -11,6 +11,8 @@ STATE_FILE="$STATE_DIR/state.json"
 PI_USER="${FOCUSBOARD_USER:-jopi}"
 PI_HOST="${FOCUSBOARD_HOST:-focusboard}"
 PI_DEST="/home/${PI_USER}/focusboard/dashboard/state.json"
+# scp lands here first; a rename then swaps it in atomically
+PI_STAGING="/home/${PI_USER}/focusboard/dashboard/.state.json.upload"
 LOG_FILE="$STATE_DIR/sync.log"
 
 # Ensure state directory exists
@@ -24,13 +26,22 @@ if [ $? -ne 0 ]; then
     exit 1
 fi
 
-# SCP to Pi (timeout 5s, no strict host checking for local network)
-scp -o ConnectTimeout=5 \
-    -o StrictHostKeyChecking=no \
-    -o BatchMode=yes \
-    "$STATE_FILE" "$PI_HOST:$PI_DEST" 2>/dev/null
-
-if [ $? -eq 0 ]; then
+# SCP to Pi (timeout 5s, no strict host checking for local network).
+# Reuses the sync daemon's multiplexed connection if one is up, and leaves
+# one behind for the next run (ControlPersist). The copy goes to a staging
+# file and is renamed over state.json, so the dashboard never reads a
+# half-copied file.
+SSH_OPTS=(
+    -o ConnectTimeout=5
+    -o StrictHostKeyChecking=no
+    -o BatchMode=yes
+    -o ControlMaster=auto
+    -o ControlPath="$STATE_DIR/cm-%C"
+    -o ControlPersist=10m
+)
+
+if scp "${SSH_OPTS[@]}" "$STATE_FILE" "$PI_HOST:$PI_STAGING" 2>/dev/null &&
+   ssh "${SSH_OPTS[@]}" "$PI_HOST" "sync $PI_STAGING && mv -f $PI_STAGING $PI_DEST" 2>/dev/null; then
     echo "$(date -Iseconds) OK: synced to Pi" >> "$LOG_FILE"
 else
     echo "$(date -Iseconds) WARN: scp failed (Pi offline?)" >> "$LOG_FILE"
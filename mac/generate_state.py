@@ -16,21 +16,27 @@ from datetime import datetime
 from pathlib import Path
 
 from config import (
-    TODAY_PATH, FOCUS_PATH, KEYSTONES_PATH, PHILOSOPHY_PATH, VAULT_ACTIVE,
-    DAILY_LOG_PATH, QUICK_WINS_PATH, SYNC_LOG_PATH,
+    TODAY_PATH, FOCUS_PATH, KEYSTONES_PATH, PHILOSOPHY_PATH,
+    DAILY_LOG_PATH, QUICK_WINS_PATH, TASKS_PATH, SYNC_LOG_PATH, SOURCE_DEADLINE_SEC,
     load_config,
 )
-from utils import read_file, get_quote
+from utils import atomic_write, read_file, get_quote
+from memo import memoize
 from parsers import (
-    parse_day_overview, parse_block_tracker, parse_recording_ready,
-    parse_done_today, parse_date_label, parse_focus, parse_keystones_yaml,
+    TodayDocument, parse_today, parse_focus, parse_keystones_yaml,
     extract_sop_tasks, match_keystones_to_blocks, parse_backlog_next,
-    parse_task_counts, parse_daily_log, fetch_reminders, fetch_system_data,
+    parse_task_counts, parse_daily_log, fetch_system_data,
 )
-from api import fetch_google_calendar, fetch_weather, fetch_keystone_streaks
-from habits_reader import read_habits_state
+from api import fetch_google_calendar, fetch_weather, apply_keystone_streaks
+from cache import wait_for_refreshes
+from cache_store import get_store
+from fanout import fan_out
+from pipulse import fetch_pipulse, pipulse_breaker
+from reminders import fetch_reminders
+from wire import encode as encode_wire
+from state_push import content_hash, section_hashes
 from pipeline_reader import read_pipeline_state
-from log import get_logger
+from log import get_logger, span, start_cycle, cycle_summary, append_metrics
 
 logger = get_logger("main")
 
@@ -202,40 +208,110 @@ def _parse_block_minutes(blocks: list[dict]) -> list[int]:
     return result
 
 
+# ─── File Inputs ─────────────────────────────────────────────────────────────
+
+def _parse_today_file() -> TodayDocument | None:
+    """Parse TODAY.md in one pass. Returns None if it is missing or empty."""
+    content = read_file(TODAY_PATH)
+    if not content:
+        return None
+    return parse_today(content)
+
+
+def _parse_focus_file() -> dict:
+    """Parse focus.md, with a placeholder when tomorrow isn't planned."""
+    content = read_file(FOCUS_PATH)
+    if not content:
+        return {"task": "", "action": "", "one_thing": "Not planned yet", "file": ""}
+    return parse_focus(content)
+
+
+def _parse_keystones_file() -> list[dict]:
+    """Parse keystones.yaml. Returns [] if missing."""
+    content = read_file(KEYSTONES_PATH)
+    return parse_keystones_yaml(content) if content else []
+
+
 # ─── Main ────────────────────────────────────────────────────────────────────
 
-def generate_state() -> dict:
-    """Generate the full state.json structure."""
+def generate_state(source_deadline: float | None = None) -> dict:
+    """Generate the full state.json structure.
+
+    source_deadline overrides the fan-out deadline (seconds) for this run.
+    Per-stage timings land in meta.timings and the rolling metrics file;
+    the metrics file also gets the cache store's hit/miss counters.
+    """
     logger.info("Starting state generation")
+    start_cycle()
+    with span("generate"):
+        state = _build_state(source_deadline)
+
+    # Per-section hashes let the dashboard skip widgets whose data is unchanged
+    state["meta"]["sections"] = section_hashes(state)
+
+    timings = cycle_summary()
+    state["meta"]["timings"] = timings
+    append_metrics(timings, cache=get_store().stats())
+    slowest = timings["slowest"]
+    if slowest:
+        logger.info("Cycle %.0f ms, slowest stage: %s (%.0f ms)",
+                    timings["total_ms"], slowest, timings["stages"][slowest]["ms"])
+    return state
+
+
+def _build_state(source_deadline: float | None) -> dict:
+    """Read every source and assemble the state dict (see generate_state)."""
     now = datetime.now().astimezone()
 
-    # Read source files
-    today_content = read_file(TODAY_PATH)
-    focus_content = read_file(FOCUS_PATH)
-    keystones_content = read_file(KEYSTONES_PATH)
-    philosophy_content = read_file(PHILOSOPHY_PATH)
+    # Parse source files, reusing last cycle's results for unchanged inputs.
+    # TODAY.md parsing also depends on the date (workout rotation, year).
+    today = memoize("today", [TODAY_PATH], _parse_today_file,
+                    extra=(now.date().isoformat(),))
+    tomorrow_focus = memoize("focus", [FOCUS_PATH], _parse_focus_file)
+    keystones = memoize("keystones", [KEYSTONES_PATH], _parse_keystones_file)
+    quote = memoize("quote", [PHILOSOPHY_PATH],
+                    lambda: get_quote(read_file(PHILOSOPHY_PATH)))
 
     # Load config for API calls
     config = load_config()
 
     # Parse backlog next item (independent of TODAY.md)
-    tasks_path = VAULT_ACTIVE / "TASKS.md"
-    backlog_next = parse_backlog_next(tasks_path)
+    backlog_next = memoize("backlog_next", [TASKS_PATH], parse_backlog_next, TASKS_PATH)
 
     # Parse task counts and additional data sources
-    task_counts = parse_task_counts(tasks_path, QUICK_WINS_PATH)
-    daily_log = parse_daily_log(DAILY_LOG_PATH)
-    reminders = fetch_reminders(config.get("reminders", {}).get("lists"))
-    system_data = fetch_system_data(SYNC_LOG_PATH)
-
-    # Read habits and pipeline data
-    habits = read_habits_state()
-    pipeline = read_pipeline_state()
+    task_counts = memoize("task_counts", [TASKS_PATH, QUICK_WINS_PATH],
+                          parse_task_counts, TASKS_PATH, QUICK_WINS_PATH)
+    daily_log = memoize("daily_log", [DAILY_LOG_PATH], parse_daily_log, DAILY_LOG_PATH)
+    with span("system"):
+        system_data = fetch_system_data(SYNC_LOG_PATH)
+
+    # Fan out slow, independent sources concurrently under one deadline.
+    # Anything that misses it falls back to its last good value.
+    reminder_lists = config.get("reminders", {}).get("lists")
+    deadline = source_deadline
+    if deadline is None:
+        deadline = config.get("sync", {}).get("source_deadline_sec", SOURCE_DEADLINE_SEC)
+    sources = fan_out({
+        "reminders": (lambda: fetch_reminders(reminder_lists), {"count": 0, "items": []}),
+        "pipulse": (fetch_pipulse, {}),
+        "pipeline": (read_pipeline_state, {}),
+        "calendar": (lambda: fetch_google_calendar(config), ([], [])),
+        "weather": (lambda: fetch_weather(config), {}),
+    }, deadline)
+
+    # PiPulse circuit state (closed/open/half_open), after this cycle's calls
+    system_data["pipulse"] = pipulse_breaker.status()
+
+    reminders = sources["reminders"]
+    habits = sources["pipulse"].get("habits", {})
+    pipeline = sources["pipeline"]
+    calendar_events, calendar_legend = sources["calendar"]
+    weather = sources["weather"]
 
     # Handle missing TODAY.md
-    if not today_content:
-        cal_events, cal_legend = fetch_google_calendar(config)
-        calendar_now = compute_calendar_now(cal_events, now)
+    if today is None:
+        with span("calendar_now"):
+            calendar_now = compute_calendar_now(calendar_events, now)
         return {
             "generated_at": now.isoformat(),
             "date": now.strftime("%Y-%m-%d"),
@@ -245,9 +321,7 @@ def generate_state() -> dict:
             "keystones": [],
             "sop_tasks": [],
             "done_today": [],
-            "tomorrow_focus": parse_focus(focus_content) if focus_content else {
-                "task": "", "action": "", "one_thing": "Not planned yet", "file": ""
-            },
+            "tomorrow_focus": tomorrow_focus,
             "recording_ready": {"cc": 0, "pioneers": 0, "ha": 0, "zendo": 0, "total": 0},
             "backlog_next": backlog_next,
             "tasks": task_counts,
@@ -256,12 +330,12 @@ def generate_state() -> dict:
             "system": system_data,
             "habits": habits,
             "pipeline": pipeline,
-            "quote": get_quote(philosophy_content),
-            "calendar": cal_events,
-            "calendar_legend": cal_legend,
+            "quote": quote,
+            "calendar": calendar_events,
+            "calendar_legend": calendar_legend,
             "calendar_now": calendar_now,
             "hero_calendar_event": _get_hero_personal_event(calendar_now),
-            "weather": fetch_weather(config),
+            "weather": weather,
             "meta": {
                 "sync_version": 2,
                 "no_schedule": True,
@@ -271,11 +345,11 @@ def generate_state() -> dict:
         }
 
     # Parse TODAY.md sections
-    date_iso, day_label = parse_date_label(today_content)
-    blocks = parse_day_overview(today_content)
-    tracker = parse_block_tracker(today_content)
-    recording_ready = parse_recording_ready(today_content)
-    done_today = parse_done_today(today_content)
+    date_iso, day_label = today.date_iso, today.day_label
+    blocks = today.blocks
+    tracker = today.tracker
+    recording_ready = today.recording_ready
+    done_today = today.done_today
 
     # Apply block tracker state to blocks
     for block in blocks:
@@ -365,27 +439,17 @@ def generate_state() -> dict:
         }
 
     # Parse keystones and match to block completion
-    keystones = parse_keystones_yaml(keystones_content) if keystones_content else []
     keystones = match_keystones_to_blocks(keystones, blocks)
 
     # Extract SOP tasks
     sop_tasks = extract_sop_tasks(blocks)
 
-    # Parse tomorrow focus
-    tomorrow_focus = parse_focus(focus_content) if focus_content else {
-        "task": "", "action": "", "one_thing": "Not planned yet", "file": ""
-    }
-
-    # Get quote
-    quote = get_quote(philosophy_content)
-
-    # Fetch external data
-    calendar_events, calendar_legend = fetch_google_calendar(config)
-    calendar_now = compute_calendar_now(calendar_events, now)
-    weather = fetch_weather(config)
+    # Calendar "now" view from the fanned-out events
+    with span("calendar_now"):
+        calendar_now = compute_calendar_now(calendar_events, now)
 
-    # Fetch keystone streaks from PiPulse API (enriches keystones in-place)
-    fetch_keystone_streaks(keystones)
+    # Enrich keystones in-place with PiPulse streaks
+    apply_keystone_streaks(keystones, sources["pipulse"].get("streaks", {}))
 
     # All blocks done?
     all_done = all(b["done"] for b in blocks) if blocks else False
@@ -425,8 +489,45 @@ def generate_state() -> dict:
     }
 
 
+def _previous_state(path: Path) -> dict | None:
+    try:
+        previous = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return previous if isinstance(previous, dict) else None
+
+
+def write_state(state: dict, output_path) -> bool:
+    """Publish state in the compact wire format (wire.py) at output_path.
+
+    meta.generation counts content changes and goes up by one with each.
+    A state whose content matches the file's (only generated_at and timings
+    moved) isn't written at all; the push heartbeat carries liveness instead
+    (state_push.py). Otherwise the file is replaced atomically. Returns True
+    if it was written.
+    """
+    path = Path(output_path)
+    wire = encode_wire(state)
+    previous = _previous_state(path)
+    generation, unchanged = 0, False
+    if previous is not None:
+        generation = (previous.get("meta") or {}).get("generation", 0)
+        unchanged = content_hash(previous) == content_hash(wire)
+    if not unchanged:
+        generation += 1
+    # wire shares state's meta, so the caller sees the generation too
+    wire["meta"]["generation"] = generation
+    if unchanged:
+        return False
+
+    json_str = json.dumps(wire, separators=(",", ":"), ensure_ascii=False)
+    return atomic_write(path, json_str)
+
+
 def main():
     state = generate_state()
+    # Let background cache refreshes started this run finish before exit
+    wait_for_refreshes(timeout=5)
 
     # Output destination
     output_path = None
@@ -435,13 +536,10 @@ def main():
         if idx + 1 < len(sys.argv):
             output_path = sys.argv[idx + 1]
 
-    json_str = json.dumps(state, indent=2, ensure_ascii=True)
-
     if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        Path(output_path).write_text(json_str, encoding="utf-8")
+        write_state(state, output_path)
     else:
-        print(json_str)
+        print(json.dumps(state, indent=2, ensure_ascii=True))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,62 @@
+"""Shared HTTP client for FocusBoard's external fetchers.
+
+One keep-alive requests.Session for every upstream, plus conditional GETs:
+validators (ETag, Last-Modified) from the previous response are sent back as
+If-None-Match / If-Modified-Since, and a 304 raises NotModified so the cache
+can extend the stored payload's lifetime without downloading or parsing the
+body again. The validators themselves live in the cache entry next to the
+payload (see cache.cached(..., conditional=True)).
+"""
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive session: a resident sync daemon reuses TLS connections
+# across cycles instead of handshaking on every call. The pool is sized for
+# the concurrent per-calendar fetches plus a token exchange.
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+
+class NotModified(Exception):
+    """The upstream answered 304: the cached payload is still current."""
+
+
+def conditional_headers(validators: dict) -> dict:
+    """Request headers that make a GET conditional on validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(resp) -> dict:
+    """Validators to store from a 200 response ({} if it sent none)."""
+    validators = {}
+    if resp.headers.get("ETag"):
+        validators["etag"] = resp.headers["ETag"]
+    if resp.headers.get("Last-Modified"):
+        validators["last_modified"] = resp.headers["Last-Modified"]
+    return validators
+
+
+def get_json(url: str, validators: dict, *, params: dict | None = None,
+             headers: dict | None = None, timeout: float = 10,
+             http=None) -> tuple[Any, dict]:
+    """Conditional GET of a JSON resource.
+
+    Returns (parsed body, new validators). Raises NotModified on 304 and
+    requests' exceptions on transport or HTTP errors. http defaults to the
+    shared session.
+    """
+    http = http or session
+    resp = http.get(url, params=params, timeout=timeout,
+                    headers={**(headers or {}), **conditional_headers(validators)})
+    if resp.status_code == 304:
+        raise NotModified(url)
+    resp.raise_for_status()
+    return resp.json(), response_validators(resp)
@@ -1,9 +1,11 @@
 #!/bin/bash
 # Install FocusBoard Mac sync job
-# Installs the launchd job that generates state.json and scp's it to the Pi every 2 min
+# Installs the launchd job that runs the resident sync daemon (generates state.json
+# and scp's it to the Pi every 60s, or immediately on sync_runner.py --sync-now)
 #
 # Prerequisites:
 #   - Python 3 with: requests, pyyaml (pip3 install requests pyyaml)
+#   - Optional: watchdog (FSEvents file watching; polling fallback without it)
 #   - SSH key access to Pi (run setup-ssh.sh first)
 #   - focusboard-config.json with API keys
 set -euo pipefail
@@ -68,7 +70,7 @@ launchctl load "$PLIST_DEST"
 
 echo ""
 echo "=== Installed ==="
-echo "Sync runs every 2 minutes."
+echo "Sync daemon runs every 60 seconds (kept alive by launchd)."
 echo "Check status:  launchctl list | grep focusboard"
 echo "View logs:     cat ~/.claude/pi/sync.log"
-echo "Test now:      bash $SCRIPT_DIR/generate-state.sh"
+echo "Sync now:      python3 $SCRIPT_DIR/sync_runner.py --sync-now"
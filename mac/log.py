@@ -1,7 +1,12 @@
-"""FocusBoard logging configuration."""
+"""FocusBoard logging configuration and per-stage timing spans."""
 
+import json
 import logging
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -38,3 +43,123 @@ def get_logger(name: str) -> logging.Logger:
         _configured = True
 
     return logger
+
+
+# ─── Spans ───────────────────────────────────────────────────────────────────
+
+METRICS_PATH = Path.home() / ".claude" / "pi" / "metrics.jsonl"
+METRICS_MAX_BYTES = 2_000_000  # trimmed to the newest half past this size
+
+_span_lock = threading.Lock()
+_spans: list[dict] = []
+_cycle = 0  # bumped by start_cycle(); spans opened in an older cycle are dropped
+_local = threading.local()
+
+
+@contextmanager
+def span(name: str, **fields):
+    """Time a stage of the current sync cycle.
+
+    Yields the span record; callers (or anything they call, via annotate())
+    can set fields such as cache="hit"/"miss" or outcome. An exception marks
+    the span outcome="error" and propagates. Dotted names ("calendar.token")
+    are sub-stages of the part before the dot. A span still open when the
+    next cycle starts (a straggling source thread) isn't recorded, nor is
+    one passed to discard().
+    """
+    cycle = _cycle
+    record = {"name": name, "outcome": "ok", **fields}
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        yield record
+    except Exception:
+        record["outcome"] = "error"
+        raise
+    finally:
+        record["ms"] = round((time.perf_counter() - start) * 1000, 1)
+        stack.pop()
+        discarded = record.pop("_discard", False)
+        with _span_lock:
+            if not discarded and cycle == _cycle:
+                _spans.append(record)
+
+
+def discard(record: dict) -> None:
+    """Don't record an open span (e.g. its stage was already recorded as timed out)."""
+    record["_discard"] = True
+
+
+def annotate(**fields) -> None:
+    """Set fields on the innermost open span in this thread (no-op outside one)."""
+    stack = getattr(_local, "stack", None)
+    if stack:
+        stack[-1].update(fields)
+
+
+def record_span(name: str, ms: float, **fields) -> None:
+    """Record a span measured elsewhere (e.g. a source that missed its deadline)."""
+    with _span_lock:
+        _spans.append({"name": name, "outcome": "ok", **fields, "ms": round(ms, 1)})
+
+
+def start_cycle() -> None:
+    """Discard spans from the previous cycle, and any still open from it."""
+    global _cycle
+    with _span_lock:
+        _cycle += 1
+        _spans.clear()
+
+
+def cycle_summary(total: str = "generate") -> dict:
+    """Summarize this cycle's spans for state["meta"]["timings"].
+
+    Returns {"total_ms", "slowest", "stages": {name: {"ms", "outcome", ...}}}.
+    Repeated names are summed. "slowest" is the slowest top-level stage
+    (no dot in its name), excluding the total span itself.
+    """
+    with _span_lock:
+        spans = list(_spans)
+
+    stages: dict[str, dict] = {}
+    for rec in spans:
+        entry = stages.get(rec["name"])
+        if entry is None:
+            stages[rec["name"]] = {k: v for k, v in rec.items() if k != "name"}
+        else:
+            entry["ms"] = round(entry["ms"] + rec["ms"], 1)
+            if rec["outcome"] != "ok":
+                entry["outcome"] = rec["outcome"]
+
+    total_ms = stages.pop(total, {}).get("ms", 0)
+    top = {n: s for n, s in stages.items() if "." not in n}
+    slowest = max(top, key=lambda n: top[n]["ms"]) if top else ""
+    return {"total_ms": total_ms, "slowest": slowest, "stages": stages}
+
+
+def append_metrics(summary: dict, cache: dict | None = None) -> None:
+    """Append a compact cycle record to the rolling metrics file. Non-critical.
+
+    cache is the cache store's stats(); its running hit/miss counters are
+    recorded per namespace as [hits, misses].
+    """
+    record = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "total_ms": summary.get("total_ms", 0),
+        "stages": {n: s["ms"] for n, s in summary.get("stages", {}).items()},
+    }
+    if cache:
+        record["cache"] = {ns: [c["hits"], c["misses"]] for ns, c in cache.items()}
+    line = json.dumps(record, separators=(",", ":"))
+    try:
+        METRICS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(METRICS_PATH, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+        if METRICS_PATH.stat().st_size > METRICS_MAX_BYTES:
+            lines = METRICS_PATH.read_text(encoding="utf-8").splitlines()
+            METRICS_PATH.write_text("\n".join(lines[len(lines) // 2:]) + "\n", encoding="utf-8")
+    except OSError:
+        pass
@@ -0,0 +1,80 @@
+"""Fingerprint-keyed memoization for FocusBoard's file parsers.
+
+Each input is fingerprinted by (mtime, size) and a content hash. The hash is
+only recomputed when the stat changes, so an untouched file costs one stat()
+per cycle. Parsed results are kept in memory (the resident sync daemon is
+what benefits) and handed out as deep copies because generate_state() mutates
+blocks and keystones in place.
+"""
+
+import copy
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from log import span
+
+_lock = threading.Lock()
+_digests: dict[Path, tuple[tuple[int, int], str]] = {}
+_entries: dict[str, tuple[tuple, Any]] = {}
+
+
+def fingerprint(path: Path) -> str | None:
+    """Return a content hash for path, or None if it can't be read.
+
+    Re-reads the file only when its (mtime, size) differs from the last call.
+    """
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    stat_key = (st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        cached = _digests.get(path)
+    if cached is not None and cached[0] == stat_key:
+        return cached[1]
+
+    try:
+        digest = hashlib.sha1(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+    with _lock:
+        _digests[path] = (stat_key, digest)
+    return digest
+
+
+def memoize(name: str, paths: Iterable[Path], fn: Callable[..., Any], *args,
+            extra: tuple = ()) -> Any:
+    """Return fn(*args), reusing the last result while inputs are unchanged.
+
+    Args:
+        name: Cache slot (one result is kept per name).
+        paths: Files fn reads; their fingerprints form the cache key.
+        extra: Additional key parts for inputs that aren't files (e.g. the
+               date, for parsers that depend on the current day).
+
+    Timed as a span under name, annotated cache="hit" or "miss".
+    """
+    with span(name) as s:
+        key = tuple(fingerprint(p) for p in paths) + tuple(extra)
+        with _lock:
+            entry = _entries.get(name)
+        if entry is not None and entry[0] == key:
+            s["cache"] = "hit"
+            return copy.deepcopy(entry[1])
+
+        s["cache"] = "miss"
+        result = fn(*args)
+        with _lock:
+            _entries[name] = (key, copy.deepcopy(result))
+        return result
+
+
+def clear() -> None:
+    """Drop all memoized results and fingerprints."""
+    with _lock:
+        _digests.clear()
+        _entries.clear()
@@ -0,0 +1,76 @@
+"""Google OAuth access-token store.
+
+Access tokens last about an hour, so exchanging the refresh token on every
+calendar refresh is wasted round trips. Tokens are kept with their expiry,
+shared by every calendar on the same account, persisted across runs (the
+cache store's "oauth" namespace, with the token's own expiry as TTL), and
+only re-exchanged shortly before they expire (or when Google rejects one).
+Entries are keyed by a hash of the refresh token so the store never holds
+the long-lived secret itself.
+"""
+
+import hashlib
+import threading
+
+from cache_store import get_store
+from log import get_logger, span
+
+logger = get_logger("oauth")
+
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+
+# Re-exchange this long before the stated expiry
+REFRESH_MARGIN_SEC = 5 * 60
+
+NAMESPACE = "oauth"
+
+_lock = threading.Lock()
+_key_locks: dict[str, threading.Lock] = {}
+
+
+def _key(refresh_token: str) -> str:
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()[:16]
+
+
+def get_access_token(session, client_id: str, client_secret: str,
+                     refresh_token: str) -> str:
+    """Return a valid access token for refresh_token, exchanging only if needed.
+
+    Raises on a failed exchange (HTTP error or malformed response).
+    """
+    key = _key(refresh_token)
+    # One exchange per account at a time; other accounts aren't held up
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    store = get_store()
+    with key_lock:
+        # Stored with a TTL that ends REFRESH_MARGIN_SEC before the real expiry
+        entry = store.get(NAMESPACE, key)
+        if entry is not None and entry.has_value:
+            return entry.value
+
+        with span("calendar.token"):
+            resp = session.post(
+                TOKEN_URL,
+                data={
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "refresh_token": refresh_token,
+                    "grant_type": "refresh_token",
+                },
+                timeout=10,
+            )
+            resp.raise_for_status()
+            body = resp.json()
+
+        token = body["access_token"]
+        expires_in = int(body.get("expires_in", 3600))
+        store.put(NAMESPACE, key, token, ttl=max(0, expires_in - REFRESH_MARGIN_SEC))
+        logger.info("Exchanged refresh token (expires in %ss)", body.get("expires_in", 3600))
+        return token
+
+
+def invalidate(refresh_token: str) -> None:
+    """Forget the access token for refresh_token (e.g. after a 401)."""
+    get_store().delete(NAMESPACE, _key(refresh_token))
@@ -2,8 +2,8 @@
 
 import re
 import shutil
-import subprocess
 import yaml
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from config import (
@@ -14,173 +14,234 @@ from log import get_logger
 
 logger = get_logger("parsers")
 
+# ─── Compiled patterns ───────────────────────────────────────────────────────
+
+_DATE_LABEL_RE = re.compile(r"\|\s*(.+)$")
+_TRACKER_RE = re.compile(r"- \[[xX ]\]\s+(\d{1,2}:\d{2})\s+")
+# One scan for every counter on "CC: 8 | Pioneers: 12 | HA: 7 | Zendo: 16 (43 total)"
+_RECORDING_RE = re.compile(r"(CC|Pioneers|HA|Zendo):\s*(\d+)|\((\d+)\s+total\)")
+_RECORDING_KEYS = {"CC": "cc", "Pioneers": "pioneers", "HA": "ha", "Zendo": "zendo"}
+_BACKLOG_RE = re.compile(r"- \[ \]\s+(.+?)\s+\[P([12])\]\s*(?:\((\w+)\))?\s*(?:#(\w+))?")
+_TOP_P1_RE = re.compile(r"- \[ \]\s+(.+?)\s+\[P1\]")
+_CHECKED_PREFIX_RE = re.compile(r"^- \[[xX]\]\s*")
+_CHECKBOX_PREFIX_RE = re.compile(r"^- \[[xX ]\]\s*")
+
+
+# ─── TODAY.md ────────────────────────────────────────────────────────────────
+
+@dataclass
+class TodayDocument:
+    """Every TODAY.md section FocusBoard uses, produced by one pass over the file."""
+    date_iso: str
+    day_label: str
+    blocks: list[dict] = field(default_factory=list)
+    tracker: dict[str, bool] = field(default_factory=dict)
+    recording_ready: dict = field(default_factory=lambda: {
+        "cc": 0, "pioneers": 0, "ha": 0, "zendo": 0, "total": 0,
+    })
+    done_today: list[str] = field(default_factory=list)
+
+
+def _build_block(cells: list[str]) -> dict:
+    """Build a block dict from a Day Overview row: [time, block, file, task, source]."""
+    time_val = cells[0]
+    block_name = cells[1]
+    file_ref = cells[2]
+    task = cells[3]
+    source = cells[4]
+
+    # Clean up file ref
+    if file_ref in ("(no file)", "(browser)", "\u2014", "-"):
+        file_ref = ""
+
+    # Workout day rotation: A-DAY, B-DAY, V-DAY
+    if block_name in ("Workout", "Power Hour") and task == "(fixed)":
+        day_of_year = datetime.now().timetuple().tm_yday
+        workout_labels = ["A-DAY", "B-DAY", "V-DAY"]
+        task = workout_labels[day_of_year % 3]
+
+    visual = BLOCK_VISUALS.get(block_name, DEFAULT_VISUAL)
+    return {
+        "time": time_val,
+        "block": block_name,
+        "task": task,
+        "file": file_ref,
+        "source": source if source not in ("\u2014", "-") else "",
+        "done": False,
+        "is_current": False,
+        "type": get_block_type(block_name),
+        "required": is_required_block(block_name, file_ref),
+        "icon": visual["icon"],
+        "color": visual["color"],
+        "label": visual["label"],
+        "details": BLOCK_DETAILS.get(block_name, []),
+    }
 
-def parse_day_overview(content: str) -> list[dict]:
-    """Parse the Day Overview markdown table into block dicts."""
-    blocks = []
-    in_table = False
-    header_seen = False
 
-    for line in content.splitlines():
-        stripped = line.strip()
+def _split_row(row: str) -> list[str]:
+    """Split a markdown table row into its non-empty, stripped cells.
+
+    Empty cells are dropped (including the ones produced by the leading and
+    trailing pipes), matching the original filter without its per-cell
+    list.index() scan.
+    """
+    return [cell for cell in (c.strip() for c in row.split("|")) if cell]
+
+
+class _TodayTokenizer:
+    """Single-pass TODAY.md walker.
+
+    Every stripped line is offered to each still-active section handler; a
+    handler returns True once its section is complete and stops receiving
+    lines. Handlers keep the exact semantics of the original per-section
+    scans (first match wins, sections end at the next "## " heading).
+    """
 
+    def __init__(self):
+        self.doc = TodayDocument(date_iso="", day_label="")
+        self._header_found = False
+        self._in_table = False
+        self._header_seen = False
+        self._in_tracker = False
+        self._in_done = False
+
+    def _header(self, stripped: str) -> bool:
+        """'# TODAY | Fri Feb 7' -> date_iso, day_label."""
+        if not stripped.startswith("# TODAY"):
+            return False
+        match = _DATE_LABEL_RE.search(stripped)
+        if not match:
+            return False
+        label = match.group(1).strip()
+        now = datetime.now()
+        try:
+            # Parse "Fri Feb 7" style
+            parsed = datetime.strptime(f"{label} {now.year}", "%a %b %d %Y")
+            self.doc.date_iso = parsed.strftime("%Y-%m-%d")
+        except ValueError:
+            self.doc.date_iso = now.strftime("%Y-%m-%d")
+        self.doc.day_label = label
+        self._header_found = True
+        return True
+
+    def _overview(self, stripped: str) -> bool:
+        """Day Overview markdown table -> blocks."""
         # Detect table start
         if stripped.startswith("| Time") and "Block" in stripped:
-            in_table = True
-            continue
+            self._in_table = True
+            return False
 
         # Skip separator row
-        if in_table and stripped.startswith("|---"):
-            header_seen = True
-            continue
+        if self._in_table and stripped.startswith("|---"):
+            self._header_seen = True
+            return False
 
         # Parse data rows
-        if in_table and header_seen and stripped.startswith("|"):
-            cells = [c.strip() for c in stripped.split("|")]
-            # Filter empty strings from split
-            cells = [c for c in cells if c or cells.index(c) > 0]
-            # cells: [time, block, file, task, source]
+        if self._in_table and self._header_seen and stripped.startswith("|"):
+            cells = _split_row(stripped)
             if len(cells) >= 5:
-                time_val = cells[0]
-                block_name = cells[1]
-                file_ref = cells[2]
-                task = cells[3]
-                source = cells[4]
-
-                # Clean up file ref
-                if file_ref in ("(no file)", "(browser)", "\u2014", "-"):
-                    file_ref = ""
-
-                # Workout day rotation: A-DAY, B-DAY, V-DAY
-                if block_name in ("Workout", "Power Hour") and task == "(fixed)":
-                    day_of_year = datetime.now().timetuple().tm_yday
-                    workout_labels = ["A-DAY", "B-DAY", "V-DAY"]
-                    task = workout_labels[day_of_year % 3]
-
-                visual = BLOCK_VISUALS.get(block_name, DEFAULT_VISUAL)
-                block = {
-                    "time": time_val,
-                    "block": block_name,
-                    "task": task,
-                    "file": file_ref,
-                    "source": source if source not in ("\u2014", "-") else "",
-                    "done": False,
-                    "is_current": False,
-                    "type": get_block_type(block_name),
-                    "required": is_required_block(block_name, file_ref),
-                    "icon": visual["icon"],
-                    "color": visual["color"],
-                    "label": visual["label"],
-                    "details": BLOCK_DETAILS.get(block_name, []),
-                }
-                blocks.append(block)
+                self.doc.blocks.append(_build_block(cells))
+            return False
 
         # End of table
-        elif in_table and header_seen and not stripped.startswith("|"):
-            break
-
-    return blocks
-
-
-def parse_block_tracker(content: str) -> dict[str, bool]:
-    """Parse Block Tracker checkboxes into {time: done} map."""
-    tracker = {}
-    in_tracker = False
-
-    for line in content.splitlines():
-        stripped = line.strip()
+        return self._in_table and self._header_seen
 
+    def _tracker(self, stripped: str) -> bool:
+        """## Block Tracker checkboxes -> {time: done}."""
         if stripped == "## Block Tracker":
-            in_tracker = True
-            continue
-
-        if in_tracker and stripped.startswith("## "):
-            break
-
-        if in_tracker and stripped.startswith("- ["):
+            self._in_tracker = True
+            return False
+        if not self._in_tracker:
+            return False
+        if stripped.startswith("## "):
+            return True
+        if stripped.startswith("- ["):
             done = stripped.startswith("- [x]") or stripped.startswith("- [X]")
             # Extract time from "- [x] 6:30 Creation"
-            match = re.match(r"- \[[xX ]\]\s+(\d{1,2}:\d{2})\s+", stripped)
+            match = _TRACKER_RE.match(stripped)
             if match:
-                tracker[match.group(1)] = done
+                self.doc.tracker[match.group(1)] = done
+        return False
+
+    def _recording(self, stripped: str) -> bool:
+        """First 'CC: 8 | Pioneers: 12 | HA: 7 | Zendo: 16 (43 total)' line."""
+        if not (stripped.startswith("CC:") or "total)" in stripped):
+            return False
+        result = self.doc.recording_ready
+        seen = set()
+        for match in _RECORDING_RE.finditer(stripped):
+            key = _RECORDING_KEYS[match.group(1)] if match.group(1) else "total"
+            if key in seen:
+                continue  # first occurrence wins
+            seen.add(key)
+            result[key] = int(match.group(2) or match.group(3))
+        return True
 
-    return tracker
+    def _done(self, stripped: str) -> bool:
+        """## Done Today list items."""
+        if stripped == "## Done Today":
+            self._in_done = True
+            return False
+        if not self._in_done:
+            return False
+        if stripped.startswith("## "):
+            return True
+        if stripped.startswith("- ") and len(stripped) > 2:
+            item = stripped[2:].strip()
+            if item:
+                self.doc.done_today.append(item)
+        return False
 
+    def feed(self, content: str) -> TodayDocument:
+        handlers = [self._header, self._overview, self._tracker, self._recording, self._done]
+        for line in content.splitlines():
+            stripped = line.strip()
+            handlers = [h for h in handlers if not h(stripped)]
+            if not handlers:
+                break
 
-def parse_recording_ready(content: str) -> dict:
-    """Parse Recording Ready section."""
-    result = {"cc": 0, "pioneers": 0, "ha": 0, "zendo": 0, "total": 0}
+        if not self._header_found:
+            now = datetime.now()
+            self.doc.date_iso = now.strftime("%Y-%m-%d")
+            self.doc.day_label = now.strftime("%a %b %-d")
+        return self.doc
 
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("CC:") or "total)" in stripped:
-            # Format: CC: 8 | Pioneers: 12 | HA: 7 | Zendo: 16 (43 total)
-            match = re.search(r"CC:\s*(\d+)", stripped)
-            if match:
-                result["cc"] = int(match.group(1))
-            match = re.search(r"Pioneers:\s*(\d+)", stripped)
-            if match:
-                result["pioneers"] = int(match.group(1))
-            match = re.search(r"HA:\s*(\d+)", stripped)
-            if match:
-                result["ha"] = int(match.group(1))
-            match = re.search(r"Zendo:\s*(\d+)", stripped)
-            if match:
-                result["zendo"] = int(match.group(1))
-            match = re.search(r"\((\d+)\s+total\)", stripped)
-            if match:
-                result["total"] = int(match.group(1))
-            break
 
-    return result
+def parse_today(content: str) -> TodayDocument:
+    """Parse every TODAY.md section in a single pass over the file."""
+    return _TodayTokenizer().feed(content)
 
 
-def parse_done_today(content: str) -> list[str]:
-    """Parse Done Today section items."""
-    items = []
-    in_done = False
+def parse_day_overview(content: str) -> list[dict]:
+    """Parse the Day Overview markdown table into block dicts."""
+    return parse_today(content).blocks
 
-    for line in content.splitlines():
-        stripped = line.strip()
 
-        if stripped == "## Done Today":
-            in_done = True
-            continue
+def parse_block_tracker(content: str) -> dict[str, bool]:
+    """Parse Block Tracker checkboxes into {time: done} map."""
+    return parse_today(content).tracker
 
-        if in_done and stripped.startswith("## "):
-            break
 
-        if in_done and stripped.startswith("- ") and len(stripped) > 2:
-            item = stripped[2:].strip()
-            if item:
-                items.append(item)
+def parse_recording_ready(content: str) -> dict:
+    """Parse Recording Ready section."""
+    return parse_today(content).recording_ready
 
-    return items
+
+def parse_done_today(content: str) -> list[str]:
+    """Parse Done Today section items."""
+    return parse_today(content).done_today
 
 
 def parse_date_label(content: str) -> tuple[str, str]:
     """Parse date from TODAY.md header: '# TODAY | Fri Feb 7'."""
-    for line in content.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("# TODAY"):
-            # Extract date part after |
-            match = re.search(r"\|\s*(.+)$", stripped)
-            if match:
-                label = match.group(1).strip()
-                # Try to parse into ISO date
-                now = datetime.now()
-                try:
-                    # Parse "Fri Feb 7" style
-                    parsed = datetime.strptime(f"{label} {now.year}", "%a %b %d %Y")
-                    return parsed.strftime("%Y-%m-%d"), label
-                except ValueError:
-                    return now.strftime("%Y-%m-%d"), label
-    now = datetime.now()
-    return now.strftime("%Y-%m-%d"), now.strftime("%a %b %-d")
+    doc = parse_today(content)
+    return doc.date_iso, doc.day_label
+
 
+# ─── focus.md ────────────────────────────────────────────────────────────────
 
 def parse_focus(content: str) -> dict:
-    """Parse focus.md for tomorrow's focus."""
+    """Parse focus.md for tomorrow's focus (single pass)."""
     result = {
         "task": "",
         "action": "",
@@ -191,6 +252,10 @@ def parse_focus(content: str) -> dict:
     if not content:
         return result
 
+    # "The ONE Thing": first bold line after its heading
+    in_one_thing = False
+    one_thing_found = False
+
     for line in content.splitlines():
         stripped = line.strip()
         if stripped.startswith("**Video:**"):
@@ -200,20 +265,20 @@ def parse_focus(content: str) -> dict:
         elif stripped.startswith("**File:**"):
             result["file"] = stripped.replace("**File:**", "").strip()
 
-    # Parse "The ONE Thing" section
-    in_one_thing = False
-    for line in content.splitlines():
-        stripped = line.strip()
+        if one_thing_found:
+            continue
         if "## The ONE Thing" in stripped:
             in_one_thing = True
             continue
         if in_one_thing and stripped.startswith("**") and stripped.endswith("**"):
             result["one_thing"] = stripped.strip("*").strip()
-            break
+            one_thing_found = True
 
     return result
 
 
+# ─── keystones.yaml / TASKS.md / daily log ───────────────────────────────────
+
 def parse_keystones_yaml(content: str) -> list[dict]:
     """Parse keystones.yaml into keystone status list."""
     if not content:
@@ -270,10 +335,7 @@ def parse_backlog_next(tasks_path) -> dict:
             continue
 
         # Match: - [ ] Task text [P1] (30m) #context @block
-        match = re.match(
-            r"- \[ \]\s+(.+?)\s+\[P([12])\]\s*(?:\((\w+)\))?\s*(?:#(\w+))?",
-            stripped,
-        )
+        match = _BACKLOG_RE.match(stripped)
         if match:
             result["task"] = match.group(1).strip()
             result["priority"] = "P" + match.group(2)
@@ -302,7 +364,7 @@ def parse_task_counts(tasks_path, quick_wins_path) -> dict:
             result["p1_count"] += 1
             if not result["top_p1"]:
                 # Extract task text before the [P1] tag
-                match = re.match(r"- \[ \]\s+(.+?)\s+\[P1\]", stripped)
+                match = _TOP_P1_RE.match(stripped)
                 if match:
                     result["top_p1"] = match.group(1).strip()
         elif "[P2]" in stripped:
@@ -342,7 +404,7 @@ def parse_daily_log(log_path) -> dict:
 
         # Count checked items as wins
         if stripped.startswith("- [x]") or stripped.startswith("- [X]"):
-            text = re.sub(r"^- \[[xX]\]\s*", "", stripped).strip()
+            text = _CHECKED_PREFIX_RE.sub("", stripped).strip()
             if text:
                 result["wins"].append(text)
                 result["entry_count"] += 1
@@ -353,7 +415,7 @@ def parse_daily_log(log_path) -> dict:
 
         # Blockers: list items containing BLOCKED, WAITING, or flagged
         if stripped.startswith("- ") and any(kw in stripped.upper() for kw in ("BLOCKED", "WAITING ON", "BLOCKER")):
-            text = re.sub(r"^- \[[xX ]\]\s*", "", stripped).lstrip("- ").strip()
+            text = _CHECKBOX_PREFIX_RE.sub("", stripped).lstrip("- ").strip()
             if text and text not in result["blockers"] and not text.endswith(":"):
                 result["blockers"].append(text)
 
@@ -364,71 +426,6 @@ def parse_daily_log(log_path) -> dict:
     return result
 
 
-def fetch_reminders(lists: list[str] | None = None) -> dict:
-    """Fetch uncompleted reminders from Apple Reminders via osascript.
-
-    Args:
-        lists: List names to query (e.g. ["Groceries", "To-Do"]).
-               If None, fetches from all lists.
-
-    Returns:
-        {"count": N, "items": [{"title": ..., "list": ..., "due": ...}, ...]}
-    """
-    result = {"count": 0, "items": []}
-
-    if lists is None:
-        lists = ["Reminders"]  # Default list
-
-    for list_name in lists:
-        script = f'''
-        tell application "Reminders"
-            try
-                set theList to list "{list_name}"
-                set output to ""
-                repeat with r in (reminders of theList whose completed is false)
-                    set rName to name of r
-                    set rDue to ""
-                    try
-                        set rDue to (due date of r) as «class isot» as string
-                    end try
-                    set output to output & rName & "\\t" & rDue & "\\n"
-                end repeat
-                return output
-            on error
-                return ""
-            end try
-        end tell
-        '''
-        try:
-            proc = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True, text=True, timeout=10,
-            )
-            if proc.returncode != 0:
-                logger.warning("Reminders fetch failed for '%s': %s", list_name, proc.stderr.strip())
-                continue
-
-            for line in proc.stdout.strip().splitlines():
-                if not line.strip():
-                    continue
-                parts = line.split("\t", 1)
-                title = parts[0].strip()
-                due = parts[1].strip() if len(parts) > 1 else ""
-                if title:
-                    result["items"].append({
-                        "title": title,
-                        "list": list_name,
-                        "due": due[:10] if due else "",  # YYYY-MM-DD
-                    })
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError) as exc:
-            logger.warning("Reminders osascript failed: %s", exc)
-
-    result["count"] = len(result["items"])
-    # Cap at 8 items for display
-    result["items"] = result["items"][:8]
-    return result
-
-
 def fetch_system_data(sync_log_path=None) -> dict:
     """Collect system health data: disk space and sync log status."""
     result = {"disk_free_pct": 100, "disk_warning": False, "sync_ok": True, "sync_age_min": 0}
@@ -1,13 +1,34 @@
-"""Read YouTube-Ops state.yaml files and produce pipeline status for FocusBoard."""
+"""Read YouTube-Ops state.yaml files and produce pipeline status for FocusBoard.
+
+A persistent index (PipelineIndex) keeps one summary per video folder, keyed
+by path, plus running totals. Each read costs one stat per channel's active/
+directory and one per state.yaml:
+- a changed directory mtime means folders were added or removed, so only
+  that directory is re-listed;
+- a changed state.yaml (mtime, size) is the only thing re-parsed;
+- totals, by_stage, by_channel and the ready-to-record set are adjusted by
+  each changed video's old and new contribution.
+The index lives in memory for the resident daemon and in the cache store for
+one-shot runs, so a full scan happens only on cold start.
+"""
+
+import os
+import threading
 
 import yaml
 from pathlib import Path
 
+from cache_store import get_store
 from config import YOUTUBE_OPS_PATH
-from log import get_logger
+from fanout import SourceUnavailable
+from log import get_logger, annotate
 
 logger = get_logger("pipeline")
 
+NAMESPACE = "pipeline"
+INDEX_KEY = "index"
+INDEX_VERSION = 1
+
 # Channels to scan (directory name -> display code)
 CHANNELS = {
     "channel-curator": "cc",
@@ -24,10 +45,14 @@ def _read_state_yaml(path: Path) -> dict | None:
     """Read and parse a single state.yaml. Returns None on failure."""
     try:
         content = path.read_text(encoding="utf-8")
-        return yaml.safe_load(content) or {}
-    except (FileNotFoundError, PermissionError, yaml.YAMLError) as exc:
+        data = yaml.safe_load(content) or {}
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as exc:
         logger.debug("Failed to read %s: %s", path, exc)
         return None
+    if not isinstance(data, dict):
+        logger.debug("Ignoring %s: not a mapping", path)
+        return None
+    return data
 
 
 def _get_stage(data: dict) -> str:
@@ -48,73 +73,178 @@ def _get_video_id(folder_name: str) -> str:
     return folder_name
 
 
-def read_pipeline_state() -> dict:
-    """Scan YouTube-Ops active folders and return pipeline summary.
+# ─── Index ───────────────────────────────────────────────────────────────────
 
-    Returns {} on any failure so FocusBoard renders without pipeline data.
-    """
-    ops_path = YOUTUBE_OPS_PATH
-    if not ops_path.exists():
-        logger.warning("YouTube-Ops not found at %s", ops_path)
-        return {}
+class PipelineIndex:
+    """Per-video summaries for every channel's active/ folder, with running totals.
 
-    try:
-        total_active = 0
-        ready_to_record = 0
-        by_stage = {}
-        by_channel = {}
-        next_to_record = []
+    channels: {channel_dir: {"mtime": active/ mtime_ns,
+                             "videos": {folder: {"stat": [mtime_ns, size] | None,
+                                                 "video": {"stage", "title"} | None}}}}
+    A video counts toward the totals only while its state.yaml parses.
+    """
 
+    def __init__(self, root: Path, channels: dict | None = None):
+        self.root = root
+        self.channels = channels or {}
+        self.dirty = channels is None
+        self.total_active = 0
+        self.by_stage: dict[str, int] = {}
+        self.by_channel: dict[str, int] = {}
+        self.ready: dict[str, dict] = {}
+        for channel_dir, channel in self.channels.items():
+            code = CHANNELS[channel_dir]
+            self.by_channel[code] = 0
+            for folder, record in channel["videos"].items():
+                self._count(code, channel_dir, folder, record["video"], 1)
+
+    @classmethod
+    def from_saved(cls, root: Path, saved) -> "PipelineIndex | None":
+        """Rebuild a persisted index; None if it's from another version or root."""
+        if (not isinstance(saved, dict) or saved.get("version") != INDEX_VERSION
+                or saved.get("root") != str(root)):
+            return None
+        channels = {k: v for k, v in saved.get("channels", {}).items() if k in CHANNELS}
+        return cls(root, channels)
+
+    def to_saved(self) -> dict:
+        return {"version": INDEX_VERSION, "root": str(self.root), "channels": self.channels}
+
+    def _count(self, code: str, channel_dir: str, folder: str, video: dict | None,
+               sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) one video's contribution to the totals."""
+        if video is None:
+            return
+        stage = video["stage"]
+        self.total_active += sign
+        self.by_channel[code] += sign
+        self.by_stage[stage] = self.by_stage.get(stage, 0) + sign
+        if not self.by_stage[stage]:
+            del self.by_stage[stage]
+        if stage == "recording_ready":
+            key = f"{channel_dir}/{folder}"
+            if sign > 0:
+                self.ready[key] = {"id": _get_video_id(folder), "title": video["title"],
+                                   "channel": code}
+            else:
+                self.ready.pop(key, None)
+
+    def _drop_channel(self, channel_dir: str) -> None:
+        code = CHANNELS[channel_dir]
+        for folder, record in self.channels.pop(channel_dir)["videos"].items():
+            self._count(code, channel_dir, folder, record["video"], -1)
+        del self.by_channel[code]
+        self.dirty = True
+
+    def refresh(self) -> int:
+        """Bring the index up to date with the tree; returns state.yaml files parsed."""
+        parsed = 0
         for channel_dir, code in CHANNELS.items():
-            active_path = ops_path / channel_dir / "active"
-            if not active_path.exists():
+            active_path = self.root / channel_dir / "active"
+            try:
+                mtime = os.stat(active_path).st_mtime_ns
+            except OSError:
+                if channel_dir in self.channels:
+                    self._drop_channel(channel_dir)
                 continue
 
-            channel_count = 0
-
-            for video_dir in sorted(active_path.iterdir()):
-                if not video_dir.is_dir() or video_dir.name.startswith("_"):
+            channel = self.channels.get(channel_dir)
+            if channel is None:
+                channel = self.channels[channel_dir] = {"mtime": None, "videos": {}}
+                self.by_channel[code] = 0
+            videos = channel["videos"]
+
+            # Folders come and go only when the directory's own mtime moves
+            if channel["mtime"] != mtime:
+                with os.scandir(active_path) as entries:
+                    folders = {e.name for e in entries
+                               if not e.name.startswith("_") and e.is_dir()}
+                for folder in videos.keys() - folders:
+                    self._count(code, channel_dir, folder, videos.pop(folder)["video"], -1)
+                for folder in folders - videos.keys():
+                    videos[folder] = {"stat": None, "video": None}
+                channel["mtime"] = mtime
+                self.dirty = True
+
+            for folder, record in videos.items():
+                state_file = active_path / folder / "state.yaml"
+                try:
+                    st = os.stat(state_file)
+                    stat = [st.st_mtime_ns, st.st_size]
+                except OSError:
+                    stat = None
+                if stat == record["stat"]:
                     continue
 
-                state_file = video_dir / "state.yaml"
-                if not state_file.exists():
-                    continue
-
-                data = _read_state_yaml(state_file)
-                if data is None:
-                    continue
+                video = None
+                if stat is not None:
+                    data = _read_state_yaml(state_file)
+                    parsed += 1
+                    if data is not None:
+                        video = {"stage": _get_stage(data), "title": _get_title(data)}
+                self._count(code, channel_dir, folder, record["video"], -1)
+                self._count(code, channel_dir, folder, video, 1)
+                record["stat"], record["video"] = stat, video
+                self.dirty = True
+        return parsed
+
+    def summary(self) -> dict:
+        # Sort next_to_record by ID for consistent ordering
+        next_to_record = [self.ready[k] for k in sorted(
+            self.ready, key=lambda k: (self.ready[k]["id"], k))]
+        return {
+            "total_active": self.total_active,
+            "ready_to_record": len(self.ready),
+            "by_stage": dict(self.by_stage),
+            "by_channel": dict(self.by_channel),
+            "next_to_record": next_to_record[:5],  # Cap at 5 for display
+        }
 
-                stage = _get_stage(data)
-                total_active += 1
-                channel_count += 1
 
-                # Count by stage
-                by_stage[stage] = by_stage.get(stage, 0) + 1
+_index: PipelineIndex | None = None
+_index_lock = threading.Lock()
 
-                # Check if recording_ready
-                if stage == "recording_ready":
-                    ready_to_record += 1
-                    video_id = _get_video_id(video_dir.name)
-                    title = _get_title(data)
-                    next_to_record.append({
-                        "id": video_id,
-                        "title": title,
-                        "channel": code,
-                    })
 
-            by_channel[code] = channel_count
+def _load_index(root: Path) -> PipelineIndex:
+    entry = get_store().get(NAMESPACE, INDEX_KEY)
+    index = PipelineIndex.from_saved(root, entry.value) if entry is not None and entry.has_value else None
+    annotate(index="cold" if index is None else "warm")
+    return index or PipelineIndex(root)
 
-        # Sort next_to_record by ID for consistent ordering
-        next_to_record.sort(key=lambda v: v["id"])
 
-        return {
-            "total_active": total_active,
-            "ready_to_record": ready_to_record,
-            "by_stage": by_stage,
-            "by_channel": by_channel,
-            "next_to_record": next_to_record[:5],  # Cap at 5 for display
-        }
+def read_pipeline_state() -> dict:
+    """Scan YouTube-Ops active folders and return pipeline summary.
 
-    except Exception as exc:
-        logger.warning("Error reading pipeline state: %s", exc)
+    Only folders and state.yaml files changed since the last call are
+    re-read. Returns {} if YouTube-Ops doesn't exist; raises
+    SourceUnavailable if reading it fails, so fan-out keeps the last good
+    summary.
+    """
+    global _index
+    ops_path = YOUTUBE_OPS_PATH
+    if not ops_path.exists():
+        logger.warning("YouTube-Ops not found at %s", ops_path)
         return {}
+
+    with _index_lock:
+        try:
+            if _index is None or _index.root != ops_path:
+                _index = _load_index(ops_path)
+            parsed = _index.refresh()
+            annotate(parsed=parsed)
+            if _index.dirty:
+                get_store().put(NAMESPACE, INDEX_KEY, _index.to_saved())
+                _index.dirty = False
+            return _index.summary()
+        except Exception as exc:
+            logger.warning("Error reading pipeline state: %s", exc)
+            _index = None
+            raise SourceUnavailable(f"pipeline read failed: {exc}") from exc
+
+
+def clear() -> None:
+    """Forget the in-memory and persisted index: the next read is a full scan."""
+    global _index
+    with _index_lock:
+        _index = None
+        get_store().delete(NAMESPACE, INDEX_KEY)
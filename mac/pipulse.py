@@ -0,0 +1,65 @@
+"""PiPulse client: habits and keystone streaks in one exchange.
+
+Both endpoints live on the same Pi, so they're fetched together over one
+reused keep-alive connection (the shared http_client session), behind one
+circuit breaker, into one stale-while-revalidate cache entry. PiPulse has no
+batch endpoint and neither requests nor http.client pipelines, so the
+second request rides the already-open socket: one extra round trip, no
+extra handshake.
+
+Revalidation is conditional: when both endpoints answer 304 the cached pair
+is kept as-is. If only one changed, the other is re-fetched in full so the
+entry is always a consistent pair.
+"""
+
+from breaker import CircuitBreaker
+from cache import cached
+from config import PIPULSE_URL
+from http_client import NotModified, get_json
+from log import get_logger
+
+logger = get_logger("pipulse")
+
+ENDPOINTS = {
+    "habits": "/api/habits/state",
+    "streaks": "/api/keystones/streaks",
+}
+TIMEOUT_SEC = 3
+
+# Shared by every PiPulse call: they all go to one host
+pipulse_breaker = CircuitBreaker("pipulse")
+
+
+def fetch_pipulse() -> dict:
+    """Return {"habits": {...}, "streaks": {...}} from PiPulse.
+
+    Served stale-while-revalidate; raises SourceUnavailable if the Pi is
+    unreachable and nothing is cached.
+    """
+    return cached("pipulse", _load, conditional=True)
+
+
+def _load(validators: dict) -> tuple[dict, dict]:
+    return pipulse_breaker.call(lambda: _exchange(validators))
+
+
+def _exchange(validators: dict) -> tuple[dict, dict]:
+    """Fetch every endpoint; raise NotModified only if all of them are."""
+    # Only revalidate when we hold validators for the whole pair
+    conditional = all(validators.get(name) for name in ENDPOINTS)
+    payload, new_validators, unchanged = {}, {}, []
+    for name, path in ENDPOINTS.items():
+        try:
+            payload[name], new_validators[name] = get_json(
+                PIPULSE_URL + path, validators.get(name, {}) if conditional else {},
+                timeout=TIMEOUT_SEC,
+            )
+        except NotModified:
+            unchanged.append(name)
+
+    if len(unchanged) == len(ENDPOINTS):
+        raise NotModified(PIPULSE_URL)
+    for name in unchanged:
+        payload[name], new_validators[name] = get_json(
+            PIPULSE_URL + ENDPOINTS[name], {}, timeout=TIMEOUT_SEC)
+    return payload, new_validators
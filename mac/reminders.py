@@ -0,0 +1,242 @@
+"""Apple Reminders source for FocusBoard.
+
+One long-lived helper (reminders_bridge.js under `osascript -l JavaScript`)
+answers every configured list in a single stdin/stdout round trip, instead of
+spawning osascript once per list. The resident daemon keeps the helper across
+cycles; a one-shot run pays one spawn.
+
+Answers are cached in the cache store with a change stamp: the newest mtime
+in Reminders' Core Data store directory, which any local edit or iCloud sync
+bumps. While the stamp is unchanged the cached answer is served without
+asking Reminders at all; entries expire after MAX_AGE_SEC as a safety net for
+a missed bump.
+
+Backends share one interface, query(lists) and stamp(). Setting
+FOCUSBOARD_REMINDERS_FAKE=/path/to/reminders.json swaps in FileBackend, which
+serves {"List": [{"title": ..., "due": ...}]} from that file (stamp = its
+mtime), so the source can be exercised on Linux.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import select
+import subprocess
+import threading
+from pathlib import Path
+
+from cache_store import get_store
+from config import REMINDERS_STORE_DIRS
+from fanout import SourceUnavailable
+from log import get_logger, annotate, span
+
+logger = get_logger("reminders")
+
+NAMESPACE = "reminders"
+BRIDGE_SCRIPT = Path(__file__).resolve().parent / "reminders_bridge.js"
+DEFAULT_LISTS = ["Reminders"]
+
+# Per request, covering every list (was 10s per list with one osascript each)
+REQUEST_TIMEOUT_SEC = 10
+
+# Re-query after this long even if the stamp hasn't moved
+MAX_AGE_SEC = 15 * 60
+
+# Items kept for display
+MAX_ITEMS = 8
+
+
+class BridgeError(Exception):
+    """The backend couldn't answer (helper died, timed out, bad reply)."""
+
+
+# ─── Backends ────────────────────────────────────────────────────────────────
+
+class JXABridge:
+    """Persistent osascript helper speaking line-delimited JSON."""
+
+    def __init__(self, script: Path = BRIDGE_SCRIPT, store_dirs=REMINDERS_STORE_DIRS,
+                 timeout: float = REQUEST_TIMEOUT_SEC):
+        self.script = script
+        self.store_dirs = store_dirs
+        self.timeout = timeout
+        self._proc: subprocess.Popen | None = None
+        self._buffer = b""
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", str(self.script)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+            self._buffer = b""
+        return self._proc
+
+    def _readline(self, proc: subprocess.Popen) -> bytes:
+        fd = proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            if not select.select([fd], [], [], self.timeout)[0]:
+                raise BridgeError(f"no answer within {self.timeout}s")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise BridgeError(f"helper exited ({proc.poll()})")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line
+
+    def query(self, lists: list[str]) -> dict:
+        """{"lists": {name: [{"title", "due"}]}, "errors": {name: message}}."""
+        with self._lock:
+            try:
+                proc = self._spawn()
+                proc.stdin.write(json.dumps({"lists": lists}).encode("utf-8") + b"\n")
+                proc.stdin.flush()
+                return json.loads(self._readline(proc))
+            except (OSError, ValueError, BridgeError) as exc:
+                # Start from a clean helper next time
+                self._kill()
+                raise BridgeError(str(exc)) from exc
+
+    def stamp(self) -> int | None:
+        """Newest mtime (ns) across the Reminders stores; None if none found."""
+        newest = None
+        for directory in self.store_dirs:
+            try:
+                mtimes = [os.stat(directory).st_mtime_ns]
+                with os.scandir(directory) as entries:
+                    mtimes.extend(entry.stat().st_mtime_ns for entry in entries)
+            except OSError:
+                continue
+            newest = max(mtimes) if newest is None else max(newest, *mtimes)
+        return newest
+
+    def _kill(self) -> None:
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._proc is not None and self._proc.poll() is None:
+                # Closing stdin is the helper's cue to exit
+                self._proc.stdin.close()
+                try:
+                    self._proc.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    pass
+            self._kill()
+
+
+class FileBackend:
+    """Fake backend: lists from a JSON file, stamped with its mtime."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def query(self, lists: list[str]) -> dict:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError) as exc:
+            raise BridgeError(str(exc)) from exc
+        return {
+            "lists": {name: data[name] for name in lists if name in data},
+            "errors": {name: "no such list" for name in lists if name not in data},
+        }
+
+    def stamp(self) -> int | None:
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """The process-wide backend: FileBackend if FOCUSBOARD_REMINDERS_FAKE is set."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            fake = os.environ.get("FOCUSBOARD_REMINDERS_FAKE")
+            _backend = FileBackend(fake) if fake else JXABridge()
+        return _backend
+
+
+def set_backend(backend) -> None:
+    """Replace the backend (tests, benchmarks), closing the previous one."""
+    global _backend
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+        _backend = backend
+
+
+@atexit.register
+def _close_backend() -> None:
+    if _backend is not None:
+        _backend.close()
+
+
+# ─── Source ──────────────────────────────────────────────────────────────────
+
+def fetch_reminders(lists: list[str] | None = None) -> dict:
+    """Fetch uncompleted reminders.
+
+    Args:
+        lists: List names to query (e.g. ["Groceries", "To-Do"]).
+               If None, fetches the default "Reminders" list.
+
+    Returns:
+        {"count": N, "items": [{"title": ..., "list": ..., "due": ...}, ...]}
+
+    Raises SourceUnavailable if the bridge fails with nothing cached.
+    """
+    if lists is None:
+        lists = DEFAULT_LISTS
+    backend = get_backend()
+    store = get_store()
+    key = hashlib.sha256(json.dumps(lists).encode("utf-8")).hexdigest()[:16]
+
+    # Stamp first: a change landing mid-query makes the next cycle re-query
+    stamp = backend.stamp()
+    entry = store.get(NAMESPACE, key)
+    if (entry is not None and entry.has_value and stamp is not None
+            and entry.meta.get("stamp") == stamp):
+        annotate(cache="unchanged")
+        return entry.value
+
+    try:
+        with span("reminders.query", lists=len(lists)):
+            answer = backend.query(lists)
+    except BridgeError as exc:
+        logger.warning("Reminders bridge failed: %s", exc)
+        if entry is not None and entry.has_value:
+            return entry.value
+        raise SourceUnavailable(f"Reminders bridge failed: {exc}") from exc
+
+    errors = answer.get("errors") or {}
+    for name, message in errors.items():
+        logger.warning("Reminders fetch failed for '%s': %s", name, message)
+
+    items = []
+    for name in lists:
+        for reminder in answer.get("lists", {}).get(name, []):
+            title = str(reminder.get("title") or "").strip()
+            if title:
+                due = reminder.get("due") or ""
+                items.append({"title": title, "list": name, "due": due[:10]})  # YYYY-MM-DD
+    result = {"count": len(items), "items": items[:MAX_ITEMS]}
+
+    # Partial answers aren't pinned: retry the failed lists next cycle
+    if not errors:
+        store.put(NAMESPACE, key, result, ttl=MAX_AGE_SEC,
+                  meta={"stamp": stamp} if stamp is not None else None)
+    return result
@@ -0,0 +1,63 @@
+// FocusBoard Reminders bridge (JXA): run with `osascript -l JavaScript`.
+//
+// Long-lived helper for mac/reminders.py. Reads one JSON request per line on
+// stdin, {"lists": ["Groceries", ...]}, and answers each with one JSON line
+// on stdout:
+//   {"lists": {"Groceries": [{"title": "...", "due": "YYYY-MM-DD"}]},
+//    "errors": {"Missing": "..."}}
+// Properties are fetched in bulk (rs.name(), rs.dueDate()): two Apple events
+// per list instead of two per reminder. Exits when stdin closes.
+
+ObjC.import('Foundation');
+
+function pad(n) {
+  return n < 10 ? '0' + n : String(n);
+}
+
+function localDate(d) {
+  return d ? d.getFullYear() + '-' + pad(d.getMonth() + 1) + '-' + pad(d.getDate()) : '';
+}
+
+function answer(app, request) {
+  var lists = {}, errors = {};
+  (request.lists || []).forEach(function (name) {
+    try {
+      var rs = app.lists.byName(name).reminders.whose({ completed: false });
+      var titles = rs.name(), dues = rs.dueDate();
+      lists[name] = titles.map(function (title, i) {
+        return { title: title, due: localDate(dues[i]) };
+      });
+    } catch (e) {
+      errors[name] = String(e);
+    }
+  });
+  return { lists: lists, errors: errors };
+}
+
+function write(handle, obj) {
+  var line = $.NSString.alloc.initWithUTF8String(JSON.stringify(obj) + '\n');
+  handle.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+}
+
+function run() {
+  var app = Application('Reminders');
+  var stdin = $.NSFileHandle.fileHandleWithStandardInput;
+  var stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+  var buffer = '';
+  while (true) {
+    var data = stdin.availableData;
+    if (data.length === 0) return;  // EOF: the parent went away
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    var nl;
+    while ((nl = buffer.indexOf('\n')) >= 0) {
+      var line = buffer.slice(0, nl);
+      buffer = buffer.slice(nl + 1);
+      if (!line) continue;
+      try {
+        write(stdout, answer(app, JSON.parse(line)));
+      } catch (e) {
+        write(stdout, { lists: {}, errors: { '*': String(e) } });
+      }
+    }
+  }
+}
@@ -0,0 +1,128 @@
+"""Persistent SSH channel to the Pi.
+
+Uses OpenSSH connection multiplexing: one backgrounded master connection
+(ControlMaster) owns the TCP session and auth, and every push runs as a mux
+client over its Unix socket, skipping key exchange entirely. The master is
+health-checked with `ssh -O check` before use and torn down and re-opened
+when it dies (Wi-Fi flap, Pi reboot). ControlPersist keeps it alive between
+one-shot runs as well as across daemon cycles; the daemon closes it on exit.
+"""
+
+import subprocess
+import threading
+from pathlib import Path
+
+from log import get_logger
+
+logger = get_logger("ssh")
+
+CONTROL_DIR = Path.home() / ".claude" / "pi"
+
+# How long an idle master survives after the last client disconnects
+CONTROL_PERSIST = "10m"
+
+# Keep the master responsive to dead links instead of hanging on them
+BASE_OPTS = [
+    "-o", "ConnectTimeout=5",
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "BatchMode=yes",
+    "-o", "ServerAliveInterval=15",
+    "-o", "ServerAliveCountMax=2",
+]
+
+# ssh's own exit code for connection/auth failures
+EXIT_SSH_ERROR = 255
+
+
+class SSHChannel:
+    """Multiplexed SSH connection to one host, reopened on failure."""
+
+    def __init__(self, host: str, control_dir: Path = CONTROL_DIR):
+        self.host = host
+        # %C is a hash of (local host, remote host, port, user): short enough
+        # for macOS's 104-byte socket path limit
+        self.control_path = Path(control_dir) / "cm-%C"
+        self._control_dir = Path(control_dir)
+        self._lock = threading.Lock()
+
+    def options(self) -> list[str]:
+        """ssh/scp options that route through this channel's master."""
+        return BASE_OPTS + [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self.control_path}",
+            "-o", f"ControlPersist={CONTROL_PERSIST}",
+        ]
+
+    def _control(self, command: str, timeout: float = 5) -> bool:
+        try:
+            result = subprocess.run(
+                ["ssh", *self.options(), "-O", command, self.host],
+                capture_output=True, text=True, timeout=timeout,
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return False
+        return result.returncode == 0
+
+    def check(self) -> bool:
+        """True if a live master is accepting clients."""
+        return self._control("check")
+
+    def connect(self, timeout: float = 10) -> bool:
+        """Start a backgrounded master. Returns True once it's up."""
+        self._control_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            result = subprocess.run(
+                ["ssh", *self.options(), "-o", "ControlMaster=yes", "-f", "-N", self.host],
+                capture_output=True, text=True, timeout=timeout,
+            )
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            logger.warning("SSH master to %s failed: %s", self.host, exc)
+            return False
+        if result.returncode != 0:
+            logger.warning("SSH master to %s failed: %s", self.host,
+                           result.stderr.strip() or f"exit {result.returncode}")
+            return False
+        logger.info("SSH master to %s established", self.host)
+        return True
+
+    def ensure(self) -> bool:
+        """Health-check the master, (re)connecting if needed."""
+        with self._lock:
+            if self.check():
+                return True
+            return self.connect()
+
+    def reset(self) -> None:
+        """Tear down the master so the next ensure() opens a fresh one."""
+        with self._lock:
+            self._control("exit")
+
+    def close(self) -> None:
+        """Shut the master down for good (daemon exit); ssh removes its socket."""
+        with self._lock:
+            if self._control("exit"):
+                logger.info("SSH master to %s closed", self.host)
+
+    def run(self, remote: str, input: str | None = None,
+            timeout: float = 15) -> subprocess.CompletedProcess:
+        """Run a remote command over the channel, retrying once on a dead link.
+
+        Returns ssh's exit code 255 without running anything if no master can
+        be established, so an offline Pi costs one connect timeout per push.
+        """
+        if not self.ensure():
+            return subprocess.CompletedProcess(remote, EXIT_SSH_ERROR, "", "Pi unreachable")
+        result = self._run(remote, input, timeout)
+        if result.returncode == EXIT_SSH_ERROR:
+            logger.info("SSH channel to %s dropped, reconnecting", self.host)
+            self.reset()
+            if self.ensure():
+                result = self._run(remote, input, timeout)
+        return result
+
+    def _run(self, remote: str, input: str | None,
+             timeout: float) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["ssh", *self.options(), self.host, remote],
+            input=input, capture_output=True, text=True, timeout=timeout,
+        )
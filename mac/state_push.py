@@ -0,0 +1,227 @@
+"""Delta-encoded state delivery to the Pi.
+
+Keeps a copy of the last state the Pi acknowledged. Each push:
+- skips the transfer entirely if the content (ignoring generated_at and
+  timings) is unchanged and a heartbeat isn't due yet;
+- sends only a heartbeat (the sync time) if the content is unchanged and one
+  is due: the Pi keeps it in tmpfs, outside state.json, so an unchanged
+  state is never rewritten on the SD card;
+- otherwise sends an RFC 6902 JSON patch against the acknowledged state over
+  the persistent SSH channel to pi/scripts/focusboard-state.py, which
+  verifies the base hash, applies it and atomically replaces
+  dashboard/state.json;
+- falls back to sending the full state when there is no acknowledged base,
+  the Pi reports a base mismatch, or the patch isn't meaningfully smaller.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+
+from log import get_logger
+from ssh_channel import EXIT_SSH_ERROR, SSHChannel
+
+logger = get_logger("push")
+
+ACKED_PATH = Path.home() / ".claude" / "pi" / "state.acked.json"
+
+# Send a heartbeat at least this often so the dashboard's "Synced N min ago"
+# (and its 5-minute offline banner) reflects a live Mac even when nothing
+# changed.
+HEARTBEAT_SEC = 120
+
+# Send the full state when a patch would be at least this fraction of it
+FULL_STATE_RATIO = 0.7
+
+# Exit code focusboard-state.py uses when the Pi's state.json isn't our base
+EXIT_BASE_MISMATCH = 3
+
+
+class PiUnreachable(RuntimeError):
+    """SSH couldn't reach the Pi, so no other transport will either."""
+
+
+# ─── Hashing ─────────────────────────────────────────────────────────────────
+
+def canonical(obj) -> str:
+    """Canonical JSON (sorted keys, no whitespace). The Pi side uses the same form."""
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def state_hash(state: dict) -> str:
+    """Hash of the exact state, used as the patch base on both ends."""
+    return hashlib.sha256(canonical(state).encode("ascii")).hexdigest()
+
+
+# meta fields that change every cycle (or are derived from the rest)
+META_VOLATILE = ("timings", "sections", "generation")
+
+
+def _stable_meta(meta):
+    if not isinstance(meta, dict):
+        return meta
+    return {k: v for k, v in meta.items() if k not in META_VOLATILE}
+
+
+def content_hash(state: dict) -> str:
+    """Hash of the state minus fields that change every cycle regardless of content."""
+    trimmed = {k: v for k, v in state.items() if k != "generated_at"}
+    if "meta" in trimmed:
+        trimmed["meta"] = _stable_meta(trimmed["meta"])
+    return state_hash(trimmed)
+
+
+def section_hashes(state: dict) -> dict[str, str]:
+    """Short content hash per top-level section, for meta.sections.
+
+    The dashboard re-renders a widget only when one of the sections it reads
+    changed hash. Hashing here, over the same canonical JSON as the push,
+    keeps every section hashed the same way. meta is hashed without its
+    volatile fields; generated_at isn't a section.
+    """
+    hashes = {}
+    for key, value in state.items():
+        if key == "generated_at":
+            continue
+        if key == "meta":
+            value = _stable_meta(value)
+        hashes[key] = hashlib.sha256(canonical(value).encode("ascii")).hexdigest()[:12]
+    return hashes
+
+
+# ─── JSON Patch ──────────────────────────────────────────────────────────────
+
+def _same(a, b) -> bool:
+    """Equal as JSON: unlike ==, 0 vs False and 1 vs 1.0 differ (at any depth)."""
+    return a == b and canonical(a) == canonical(b)
+
+
+def _pointer(path: str, key) -> str:
+    return path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def json_diff(old, new, path: str = "") -> list[dict]:
+    """RFC 6902 operations (add/remove/replace) that turn old into new.
+
+    Dicts are diffed key by key. Lists of equal length are diffed element by
+    element, pure appends become "add" ops at "-", anything else replaces the
+    whole list.
+    """
+    if type(old) is not type(new):
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if isinstance(old, dict):
+        ops = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": _pointer(path, key)})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": _pointer(path, key), "value": value})
+            elif not _same(old[key], value):
+                ops.extend(json_diff(old[key], value, _pointer(path, key)))
+        return ops
+
+    if isinstance(old, list):
+        if len(old) == len(new):
+            ops = []
+            for i, (a, b) in enumerate(zip(old, new)):
+                if not _same(a, b):
+                    ops.extend(json_diff(a, b, _pointer(path, i)))
+            return ops
+        if len(new) > len(old) and _same(new[:len(old)], old):
+            return [{"op": "add", "path": path + "/-", "value": v} for v in new[len(old):]]
+        return [{"op": "replace", "path": path, "value": new}]
+
+    if old != new:
+        return [{"op": "replace", "path": path, "value": new}]
+    return []
+
+
+# ─── Push ────────────────────────────────────────────────────────────────────
+
+def _load_acked() -> dict | None:
+    try:
+        return json.loads(ACKED_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, PermissionError, json.JSONDecodeError, OSError):
+        return None
+
+
+def _save_acked(state: dict) -> None:
+    try:
+        ACKED_PATH.parent.mkdir(parents=True, exist_ok=True)
+        ACKED_PATH.write_text(canonical(state), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _touch_acked() -> None:
+    """Restart the heartbeat clock (the acked file's mtime)."""
+    try:
+        os.utime(ACKED_PATH)
+    except OSError:
+        pass
+
+
+def _heartbeat(channel: SSHChannel, script: str, timeout: float) -> subprocess.CompletedProcess:
+    """Tell the Pi the Mac synced just now, without touching its state.json."""
+    now = datetime.now().astimezone().isoformat(timespec="seconds")
+    return channel.run(f"python3 {script} heartbeat {now}", timeout=timeout)
+
+
+def _send(channel: SSHChannel, script: str, payload: str, base: str | None,
+          timeout: float) -> subprocess.CompletedProcess:
+    """Run the Pi-side apply script over the channel with payload on stdin."""
+    remote = f"python3 {script} apply"
+    remote += f" --base {base}" if base else " --full"
+    return channel.run(remote, input=payload, timeout=timeout)
+
+
+def push_state(state: dict, channel: SSHChannel, script: str, timeout: float = 15) -> str:
+    """Deliver state to the Pi as a patch, a full copy, a heartbeat, or not at all.
+
+    Returns "unchanged", "heartbeat", "patch" or "full". Raises PiUnreachable
+    if SSH can't reach the Pi, RuntimeError if it rejected the full state or
+    the heartbeat (e.g. the apply script isn't deployed yet); SSH timeouts
+    and OSErrors propagate as-is.
+    """
+    acked = _load_acked()
+    if acked is not None and content_hash(acked) == content_hash(state):
+        if time.time() - ACKED_PATH.stat().st_mtime < HEARTBEAT_SEC:
+            return "unchanged"
+        result = _heartbeat(channel, script, timeout)
+        if result.returncode == 0:
+            _touch_acked()
+            return "heartbeat"
+        if result.returncode == EXIT_SSH_ERROR:
+            raise PiUnreachable(result.stderr.strip() or "ssh failed")
+        raise RuntimeError(result.stderr.strip() or f"heartbeat exited {result.returncode}")
+
+    new_hash = state_hash(state)
+    full = canonical(state)
+    if acked is not None:
+        patch = canonical(json_diff(acked, state))
+        if len(patch) < len(full) * FULL_STATE_RATIO:
+            result = _send(channel, script, patch, state_hash(acked), timeout)
+            if result.returncode == 0 and result.stdout.strip() == new_hash:
+                _save_acked(state)
+                logger.info("Pushed patch (%d bytes, full would be %d)", len(patch), len(full))
+                return "patch"
+            if result.returncode == EXIT_SSH_ERROR:
+                raise PiUnreachable(result.stderr.strip() or "ssh failed")
+            if result.returncode == EXIT_BASE_MISMATCH:
+                logger.info("Pi state diverged from acknowledged base, sending full state")
+            else:
+                logger.warning("Patch push failed (%d): %s", result.returncode, result.stderr.strip())
+
+    result = _send(channel, script, full, None, timeout)
+    if result.returncode == 0 and result.stdout.strip() == new_hash:
+        _save_acked(state)
+        return "full"
+    if result.returncode == EXIT_SSH_ERROR:
+        raise PiUnreachable(result.stderr.strip() or "ssh failed")
+    raise RuntimeError(result.stderr.strip() or f"apply exited {result.returncode}")
@@ -1,22 +1,54 @@
 #!/usr/bin/env python3
 """
-FocusBoard Sync Runner - called by launchd every 2 min.
-Generates state.json and scp's to Pi. Pure Python, no shell wrapper.
+FocusBoard Sync Runner - generates state.json and pushes it to the Pi.
+
+Usage:
+    python3 sync_runner.py                  # One cycle (fresh generator process)
+    python3 sync_runner.py --daemon         # Resident daemon, cycle every DAEMON_INTERVAL_SEC
+    python3 sync_runner.py --daemon --interval 30
+    python3 sync_runner.py --daemon --watch # Also regenerate as soon as a vault input changes
+    python3 sync_runner.py --sync-now       # Wake a running daemon (or run one cycle)
+
+Daemon mode keeps modules, parsed config and HTTP sessions warm between
+cycles, so each cycle costs only the actual reads and fetches. SIGUSR1 (or
+--sync-now) triggers an immediate cycle. With --watch, edits to TODAY.md and
+the other vault inputs trigger a fast cycle within about a second.
+
+Pushes are delta-encoded (see state_push.py) and ride one multiplexed SSH
+connection (ssh_channel.py): only a JSON patch against the state the Pi last
+acknowledged goes over the wire, and cycles that changed nothing but the
+timestamp skip the push until a heartbeat is due. Pure Python, no shell
+wrapper.
 """
 
+import fcntl
+import json
+import os
+import select
+import signal
 import subprocess
 import sys
-import os
 from pathlib import Path
 from datetime import datetime
 
+from ssh_channel import SSHChannel
+from state_push import PiUnreachable, push_state as push_delta
+
 SCRIPT_DIR = Path(__file__).parent
 STATE_DIR = Path.home() / ".claude" / "pi"
 STATE_FILE = STATE_DIR / "state.json"
 _PI_USER = os.environ.get("FOCUSBOARD_USER", "jopi")
 PI_HOST = os.environ.get("FOCUSBOARD_HOST", "focusboard")
 PI_DEST = f"/home/{_PI_USER}/focusboard/dashboard/state.json"
+# scp lands here first; a rename then swaps it in atomically
+PI_STAGING = f"/home/{_PI_USER}/focusboard/dashboard/.state.json.upload"
+PI_APPLY_SCRIPT = f"/home/{_PI_USER}/focusboard/scripts/focusboard-state.py"
 LOG_FILE = STATE_DIR / "sync.log"
+PID_FILE = STATE_DIR / "sync-daemon.pid"
+DAEMON_INTERVAL_SEC = 60
+
+# Multiplexed connection shared by every push (and kept warm by ControlPersist)
+_channel = SSHChannel(PI_HOST, STATE_DIR)
 
 
 def log(msg: str):
@@ -33,6 +65,53 @@ def log(msg: str):
         pass
 
 
+def _scp_state() -> bool:
+    """SCP state.json to the Pi. Returns True on success.
+
+    The copy goes to a staging file next to the live one, is synced, and is
+    renamed over it, so the dashboard never reads a half-copied state.
+    """
+    result = subprocess.run(
+        ["scp", *_channel.options(), str(STATE_FILE), f"{PI_HOST}:{PI_STAGING}"],
+        capture_output=True, text=True, timeout=15
+    )
+    if result.returncode == 0:
+        result = _channel.run(f"sync {PI_STAGING} && mv -f {PI_STAGING} {PI_DEST}")
+    if result.returncode == 0:
+        log("OK: synced to Pi")
+        return True
+    log(f"WARN: scp failed ({result.stderr.strip() or 'Pi offline?'})")
+    return False
+
+
+def push_state() -> bool:
+    """Deliver state.json to the Pi as a JSON patch, or skip it if unchanged.
+
+    Falls back to a plain scp of the whole file when the Pi-side apply
+    script fails (e.g. not deployed yet), but not when the Pi is unreachable:
+    scp would only pay the same connect timeout again. Returns True on success.
+    """
+    try:
+        state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        log(f"ERROR: can't read {STATE_FILE.name}: {exc}")
+        return False
+
+    try:
+        mode = push_delta(state, _channel, PI_APPLY_SCRIPT)
+    except PiUnreachable as exc:
+        log(f"WARN: Pi unreachable ({str(exc) or 'Pi offline?'})")
+        return False
+    except RuntimeError as exc:
+        log(f"WARN: delta push failed ({str(exc) or 'Pi offline?'}), trying scp")
+        return _scp_state()
+    if mode == "unchanged":
+        log("OK: unchanged, skipped push")
+    else:
+        log(f"OK: synced to Pi ({mode})")
+    return True
+
+
 def main():
     STATE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -46,17 +125,169 @@ def main():
         log(f"ERROR: generate_state.py failed: {result.stderr.strip()}")
         return
 
-    # SCP to Pi
-    result = subprocess.run(
-        ["scp", "-o", "ConnectTimeout=5", "-o", "StrictHostKeyChecking=no",
-         "-o", "BatchMode=yes", str(STATE_FILE), f"{PI_HOST}:{PI_DEST}"],
-        capture_output=True, text=True, timeout=15
-    )
-    if result.returncode == 0:
-        log("OK: synced to Pi")
-    else:
-        log(f"WARN: scp failed ({result.stderr.strip() or 'Pi offline?'})")
+    push_state()
 
 
-if __name__ == "__main__":
+# ─── Daemon ──────────────────────────────────────────────────────────────────
+
+class SyncDaemon:
+    """Resident generate→push loop with an on-demand "sync now" trigger."""
+
+    def __init__(self, interval: float = DAEMON_INTERVAL_SEC):
+        self.interval = interval
+        # Self-pipe instead of a threading.Event: a signal handler runs on the
+        # main thread, which may be inside the Event's lock when the signal
+        # lands, so Event.set() from the handler could deadlock. A write to a
+        # non-blocking pipe takes no lock.
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._fast = False
+        self._stop = False
+
+    def trigger(self, fast: bool = False) -> None:
+        """Request an immediate cycle (safe from signal handlers and threads).
+
+        fast=True runs it with the short watch deadline so a vault edit isn't
+        held up by slow network sources.
+        """
+        self._fast = self._fast or fast
+        self._wake()
+
+    def stop(self) -> None:
+        self._stop = True
+        self._wake()
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"x")
+        except BlockingIOError:
+            pass  # Pipe full: a wake-up is already pending
+
+    def _sleep(self, timeout: float) -> None:
+        """Wait up to timeout for a trigger, then drain pending wake-ups."""
+        try:
+            select.select([self._wake_r], [], [], timeout)
+        except InterruptedError:
+            pass
+        try:
+            while os.read(self._wake_r, 512):
+                pass
+        except BlockingIOError:
+            pass
+
+    def cycle(self, fast: bool = False) -> None:
+        """Generate state in-process and push it. Never raises."""
+        # Imported here so --sync-now stays cheap; cached after the first cycle
+        from config import WATCH_DEADLINE_SEC
+        from generate_state import generate_state, write_state
+
+        try:
+            deadline = WATCH_DEADLINE_SEC if fast else None
+            write_state(generate_state(source_deadline=deadline), STATE_FILE)
+        except Exception as exc:
+            log(f"ERROR: generate_state failed: {exc}")
+            return
+        try:
+            push_state()
+        except (subprocess.TimeoutExpired, OSError) as exc:
+            log(f"WARN: push failed ({exc})")
+
+    def run(self) -> None:
+        STATE_DIR.mkdir(parents=True, exist_ok=True)
+        # Hold an exclusive lock on the pid file for our lifetime: a pid file
+        # left by a crash or reboot is unlocked, so it's never mistaken for us
+        pid_fd = os.open(PID_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(pid_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(pid_fd)
+            log("Daemon already running, exiting")
+            return
+        os.ftruncate(pid_fd, 0)
+        os.write(pid_fd, str(os.getpid()).encode())
+        log(f"Daemon started (pid={os.getpid()}, interval={self.interval:.0f}s)")
+        try:
+            while not self._stop:
+                fast, self._fast = self._fast, False
+                self.cycle(fast)
+                if not self._stop:
+                    self._sleep(self.interval)
+        finally:
+            # Only the daemon that held the lock owns the master
+            _channel.close()
+            try:
+                PID_FILE.unlink()
+            except OSError:
+                pass
+            os.close(pid_fd)
+            log("Daemon stopped")
+
+
+def _daemon_pid() -> int | None:
+    """Return the PID of a running daemon, or None.
+
+    A daemon holds an exclusive lock on its pid file. If we can take the lock,
+    the file is stale (the PID may belong to an unrelated process by now).
+    """
+    try:
+        fd = os.open(PID_FILE, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return int(os.read(fd, 32).decode().strip())
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        return None
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+
+def sync_now() -> None:
+    """Wake the resident daemon; fall back to a one-shot cycle if none runs."""
+    pid = _daemon_pid()
+    if pid is not None:
+        try:
+            os.kill(pid, signal.SIGUSR1)
+            return
+        except ProcessLookupError:
+            pass
     main()
+
+
+def run_daemon(interval: float, watch: bool = False) -> None:
+    daemon = SyncDaemon(interval)
+    signal.signal(signal.SIGUSR1, lambda signum, frame: daemon.trigger())
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: daemon.stop())
+
+    watcher = None
+    if watch:
+        from config import WATCH_PATHS
+        from watcher import InputWatcher
+
+        watcher = InputWatcher(WATCH_PATHS, lambda: daemon.trigger(fast=True))
+        watcher.start()
+    try:
+        daemon.run()
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+if __name__ == "__main__":
+    if "--sync-now" in sys.argv:
+        sync_now()
+    elif "--daemon" in sys.argv:
+        interval = DAEMON_INTERVAL_SEC
+        if "--interval" in sys.argv:
+            idx = sys.argv.index("--interval")
+            if idx + 1 < len(sys.argv):
+                interval = float(sys.argv[idx + 1])
+        run_daemon(interval, watch="--watch" in sys.argv)
+    else:
+        main()
@@ -1,5 +1,7 @@
 """FocusBoard utility helpers."""
 
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +14,46 @@ def read_file(path: Path) -> Optional[str]:
         return None
 
 
+def atomic_write(path: Path, data: str) -> bool:
+    """Publish data at path atomically and durably; skip it if already there.
+
+    Writes a temp file in the same directory, fsyncs it, renames it over path
+    and fsyncs the directory, so a reader sees the old file or the new one,
+    never a partial one, even across a power cut. Returns False without
+    touching the disk when path already holds exactly data.
+    """
+    path = Path(path)
+    encoded = data.encode("utf-8")
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return True
+
+
 def get_quote(philosophy_content: Optional[str]) -> str:
     """Extract quote from philosophy.md."""
     default = "Structure creates freedom. Trust the stacks."
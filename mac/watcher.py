@@ -0,0 +1,176 @@
+"""Watch FocusBoard vault inputs and fire a callback when one actually changes.
+
+Uses watchdog (FSEvents on macOS, inotify on Linux) when it is installed, on
+the resolved parent directories so symlinked files and folders are seen.
+Without watchdog a cheap stat poll every second is the only mechanism; with
+it, the same poll runs only every BACKSTOP_INTERVAL_SEC, to catch missed
+events and to start watching parent directories that appear later. Bursts
+of editor saves are debounced, and the callback only fires when a file's
+content differs from the last time it fired: a save that rewrites identical
+bytes (or just touches mtime) is ignored.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from log import get_logger
+from memo import fingerprint
+
+logger = get_logger("watcher")
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional dependency
+    FileSystemEventHandler = object
+    Observer = None
+
+DEBOUNCE_SEC = 0.3
+POLL_INTERVAL_SEC = 1.0
+# Stat poll interval while filesystem events are available
+BACKSTOP_INTERVAL_SEC = 30.0
+
+
+class _EventHandler(FileSystemEventHandler):
+    """Forward events for watched paths to the watcher's debounce timer."""
+
+    def __init__(self, watcher: "InputWatcher"):
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event):
+        for attr in ("src_path", "dest_path"):
+            path = getattr(event, attr, None)
+            if path and self._watcher.matches(path):
+                self._watcher.kick()
+                return
+
+
+class InputWatcher:
+    """Debounced, content-aware watcher for a fixed set of files."""
+
+    def __init__(self, paths: Iterable[Path], on_change: Callable[[], None],
+                 debounce: float = DEBOUNCE_SEC, poll_interval: float = POLL_INTERVAL_SEC):
+        self.paths = {Path(p) for p in paths}
+        self._on_change = on_change
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._digests: dict[Path, str | None] = {}
+        self._observer = None
+        self._handler = None
+        self._scheduled: set[str] = set()
+        self._targets: frozenset[str] = frozenset()
+        self._stop = threading.Event()
+        self._refresh_targets()
+        for path in self.paths:
+            self._check(path)  # baseline, no callback
+
+    # ─── Targets ─────────────────────────────────────────────────────────
+
+    def _refresh_targets(self) -> None:
+        """Recompute the paths events may carry, and watch any new parents.
+
+        Each input matches as configured and fully resolved (a symlinked
+        file or folder reports events under its real path).
+        """
+        targets = set()
+        for path in self.paths:
+            targets.add(os.path.abspath(path))
+            targets.add(os.path.realpath(path))
+        self._targets = frozenset(targets)
+        if self._observer is None:
+            return
+        # Watch parent dirs: editors often save via write-to-temp + rename
+        for target in targets:
+            parent = os.path.dirname(target)
+            if parent in self._scheduled or not os.path.isdir(parent):
+                continue
+            try:
+                self._observer.schedule(self._handler, parent, recursive=False)
+            except OSError as exc:
+                logger.warning("Can't watch %s: %s", parent, exc)
+                continue
+            self._scheduled.add(parent)
+
+    def matches(self, path: str) -> bool:
+        """True if an event for path concerns a watched input."""
+        targets = self._targets
+        return os.path.abspath(path) in targets or os.path.realpath(path) in targets
+
+    # ─── Change detection ────────────────────────────────────────────────
+
+    def _check(self, path: Path) -> bool:
+        """Refresh path's fingerprint. Returns True if its content changed."""
+        digest = fingerprint(path)
+        changed = path in self._digests and self._digests[path] != digest
+        self._digests[path] = digest
+        return changed
+
+    def _poll_stats(self) -> dict[Path, tuple[int, int] | None]:
+        """Cheap poll: current (mtime, size) of every watched path."""
+        stats = {}
+        for path in self.paths:
+            try:
+                st = path.stat()
+                stats[path] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stats[path] = None
+        return stats
+
+    def _fire(self) -> None:
+        with self._lock:
+            self._timer = None
+            changed = [p.name for p in self.paths if self._check(p)]
+        if changed:
+            logger.info("Inputs changed: %s", ", ".join(sorted(changed)))
+            try:
+                self._on_change()
+            except Exception as exc:
+                logger.error("Watch callback failed: %s", exc)
+
+    def kick(self) -> None:
+        """(Re)start the debounce timer; the check runs once the burst settles."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self._debounce, self._fire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    # ─── Lifecycle ───────────────────────────────────────────────────────
+
+    def _poll_loop(self) -> None:
+        last = self._poll_stats()
+        interval = self._poll_interval if self._observer is None else BACKSTOP_INTERVAL_SEC
+        while not self._stop.wait(interval):
+            self._refresh_targets()
+            current = self._poll_stats()
+            if current != last:
+                last = current
+                self.kick()
+
+    def start(self) -> None:
+        if Observer is not None:
+            self._observer = Observer()
+            self._handler = _EventHandler(self)
+            self._refresh_targets()
+            self._observer.daemon = True
+            self._observer.start()
+            logger.info("Watching %d inputs via %s, polling every %.0fs as backstop",
+                        len(self.paths), type(self._observer).__name__, BACKSTOP_INTERVAL_SEC)
+        else:
+            logger.info("Watching %d inputs by polling every %.1fs", len(self.paths), self._poll_interval)
+        threading.Thread(target=self._poll_loop, name="input-poll", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if self._observer is not None:
+            self._observer.stop()
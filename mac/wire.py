@@ -0,0 +1,246 @@
+"""Compact wire format for state.json (Mac -> Pi).
+
+generate_state() builds the full, self-describing state; write_state()
+stores it encoded, and the dashboard's wire.js expands it again (decode()
+here is the reference for that). Version WIRE_VERSION, marked by a
+top-level "wire" key:
+- minified UTF-8 JSON instead of indent=2 with escaped emoji;
+- static data lives once in "manifest": per-block-name visuals and details
+  (manifest.blocks) and each calendar's label/emoji/color
+  (manifest.calendars, referenced from events as "$src");
+- block and calendar event fields at their default value are omitted;
+- "now" is {"$block": i} plus its live fields when it mirrors blocks[i], and
+  sop_tasks entries are {"$block": i};
+- calendar_now entries are {"$cal": i} plus their own fields, pointing into
+  "calendar", and hero_calendar_event is {"$now": i} into calendar_now;
+- full_description, which the dashboard never shows, is dropped.
+Anything that doesn't fit a rule stays inline, so decode(encode(s)) == s
+apart from the dropped fields. A state without "wire" is the legacy format
+and is used as-is.
+"""
+
+from typing import Any
+
+WIRE_VERSION = 1
+
+# Block fields that depend only on the block name
+BLOCK_STATIC = ("icon", "color", "label", "type", "details")
+BLOCK_DEFAULTS = {
+    "task": "", "file": "", "source": "",
+    "done": False, "is_current": False, "required": False,
+}
+
+# "now" fields that mirror the hero block (now key -> block key)
+NOW_FROM_BLOCK = {
+    "block": "block", "task": "task", "file": "file", "source": "source",
+    "do": "file", "from_ref": "task", "duration": "source",
+    "icon": "icon", "color": "color", "label": "label",
+    "details": "details", "type": "type",
+}
+_NOW_IDENTITY = ("block", "task", "file", "source")
+
+# sop_tasks fields copied from their block (sop key -> block key)
+SOP_FROM_BLOCK = {"name": "task", "done": "done", "block": "block"}
+
+# Calendar event fields shared by every event of one calendar
+CAL_SOURCE_KEYS = ("calendar_label", "calendar_emoji", "calendar_color")
+CAL_DEFAULTS = {"all_day": False, "location": "", "description": ""}
+
+# calendar_now fields copied from the calendar event they describe
+CAL_REF_KEYS = (
+    "title", "description", "start", "end",
+    "calendar_label", "calendar_color", "calendar_emoji",
+)
+
+DROPPED = ("full_description",)
+
+_MISSING = object()
+
+
+def _same(a: Any, b: Any) -> bool:
+    # Strict: False and 0 (or 1 and True) must not stand in for each other
+    return type(a) is type(b) and a == b
+
+
+def _cal_key(event: dict) -> tuple:
+    return (event.get("title", ""), event.get("start", ""), event.get("end", ""),
+            event.get("calendar_label", ""))
+
+
+def _strip(event: dict) -> dict:
+    return {k: v for k, v in event.items() if k not in DROPPED}
+
+
+# ─── Encode ──────────────────────────────────────────────────────────────────
+
+def _encode_blocks(blocks: list[dict]) -> tuple[dict, list[dict]]:
+    manifest, out = {}, []
+    for block in blocks:
+        static = manifest.setdefault(
+            block.get("block", ""), {k: block[k] for k in BLOCK_STATIC if k in block})
+        compact = {}
+        for key, value in block.items():
+            if key in BLOCK_STATIC and _same(static.get(key, _MISSING), value):
+                continue
+            if key in BLOCK_DEFAULTS and _same(BLOCK_DEFAULTS[key], value):
+                continue
+            compact[key] = value
+        out.append(compact)
+    return manifest, out
+
+
+def _encode_sop_tasks(tasks: list, blocks: list[dict]) -> list:
+    out = []
+    for task in tasks:
+        ref = None
+        if isinstance(task, dict) and task.keys() == SOP_FROM_BLOCK.keys():
+            ref = next((i for i, block in enumerate(blocks)
+                        if all(_same(task[k], block.get(src, _MISSING))
+                               for k, src in SOP_FROM_BLOCK.items())), None)
+        out.append({"$block": ref} if ref is not None else task)
+    return out
+
+
+def _encode_calendar(events: list[dict]) -> tuple[list[dict], list[dict]]:
+    sources: list[dict] = []
+    index: dict[tuple, int] = {}
+    out = []
+    for event in events:
+        compact = {}
+        if all(k in event for k in CAL_SOURCE_KEYS):
+            key = tuple(event[k] for k in CAL_SOURCE_KEYS)
+            if key not in index:
+                index[key] = len(sources)
+                sources.append(dict(zip(CAL_SOURCE_KEYS, key)))
+            compact["$src"] = index[key]
+        for k, v in event.items():
+            if k in DROPPED or ("$src" in compact and k in CAL_SOURCE_KEYS):
+                continue
+            if k in CAL_DEFAULTS and _same(CAL_DEFAULTS[k], v):
+                continue
+            compact[k] = v
+        out.append(compact)
+    return sources, out
+
+
+def _encode_now(now: Any, blocks: list[dict]) -> Any:
+    if not isinstance(now, dict):
+        return now
+    for i, block in enumerate(blocks):
+        if not all(_same(now.get(k), block.get(k)) for k in _NOW_IDENTITY):
+            continue
+        compact = {"$block": i}
+        for key, value in now.items():
+            source = NOW_FROM_BLOCK.get(key)
+            if source is not None and _same(block.get(source, _MISSING), value):
+                continue
+            compact[key] = value
+        return compact
+    return now
+
+
+def _encode_calendar_now(entries: list[dict], calendar: list[dict]) -> list[dict]:
+    index: dict[tuple, int] = {}
+    for i, event in enumerate(calendar):
+        index.setdefault(_cal_key(event), i)
+
+    out = []
+    for entry in entries:
+        i = index.get(_cal_key(entry))
+        if i is None:
+            out.append(_strip(entry))
+            continue
+        event = calendar[i]
+        compact = {"$cal": i}
+        for key, value in entry.items():
+            if key in DROPPED:
+                continue
+            if key in CAL_REF_KEYS and _same(event.get(key, ""), value):
+                continue
+            compact[key] = value
+        out.append(compact)
+    return out
+
+
+def encode(state: dict) -> dict:
+    """Full state -> wire form (see module docstring)."""
+    wire = {"wire": WIRE_VERSION}
+    wire.update(state)
+    blocks = state.get("blocks") or []
+    calendar = state.get("calendar") or []
+    calendar_now = state.get("calendar_now") or []
+
+    manifest = {}
+    manifest["blocks"], wire["blocks"] = _encode_blocks(blocks)
+    if "now" in state:
+        wire["now"] = _encode_now(state["now"], blocks)
+    if "sop_tasks" in state:
+        wire["sop_tasks"] = _encode_sop_tasks(state["sop_tasks"] or [], blocks)
+    if "calendar" in state:
+        manifest["calendars"], wire["calendar"] = _encode_calendar(calendar)
+    wire["manifest"] = manifest
+    if "calendar_now" in state:
+        wire["calendar_now"] = _encode_calendar_now(calendar_now, calendar)
+
+    hero = state.get("hero_calendar_event")
+    if hero is not None:
+        for i, entry in enumerate(calendar_now):
+            if entry == hero:
+                wire["hero_calendar_event"] = {"$now": i}
+                break
+        else:
+            wire["hero_calendar_event"] = _strip(hero)
+    return wire
+
+
+# ─── Decode ──────────────────────────────────────────────────────────────────
+
+def decode(wire: dict) -> dict:
+    """Wire form -> full state (minus DROPPED); legacy states pass through."""
+    if not isinstance(wire, dict) or wire.get("wire") != WIRE_VERSION:
+        return wire
+    state = {k: v for k, v in wire.items() if k not in ("wire", "manifest")}
+    manifest = wire.get("manifest") or {}
+
+    statics = manifest.get("blocks") or {}
+    blocks = [{**BLOCK_DEFAULTS, **statics.get(b.get("block", ""), {}), **b}
+              for b in wire.get("blocks") or []]
+    state["blocks"] = blocks
+
+    now = wire.get("now")
+    if isinstance(now, dict) and "$block" in now:
+        block = blocks[now["$block"]]
+        full = {k: block[src] for k, src in NOW_FROM_BLOCK.items() if src in block}
+        full.update({k: v for k, v in now.items() if k != "$block"})
+        state["now"] = full
+
+    if "sop_tasks" in wire:
+        state["sop_tasks"] = [
+            {k: blocks[t["$block"]][src] for k, src in SOP_FROM_BLOCK.items()}
+            if isinstance(t, dict) and "$block" in t else t
+            for t in wire["sop_tasks"] or []
+        ]
+
+    sources = manifest.get("calendars") or []
+    calendar = []
+    for event in wire.get("calendar") or []:
+        full = {**CAL_DEFAULTS, **(sources[event["$src"]] if "$src" in event else {})}
+        full.update({k: v for k, v in event.items() if k != "$src"})
+        calendar.append(full)
+    if "calendar" in wire:
+        state["calendar"] = calendar
+    if "calendar_now" in wire:
+        entries = []
+        for entry in wire["calendar_now"]:
+            if "$cal" in entry:
+                event = calendar[entry["$cal"]]
+                full = {k: event.get(k, "") for k in CAL_REF_KEYS}
+                full.update({k: v for k, v in entry.items() if k != "$cal"})
+                entry = full
+            entries.append(entry)
+        state["calendar_now"] = entries
+
+    hero = wire.get("hero_calendar_event")
+    if isinstance(hero, dict) and "$now" in hero:
+        state["hero_calendar_event"] = state["calendar_now"][hero["$now"]]
+    return state
@@ -1,5 +1,12 @@
 // FocusBoard Dashboard V2 - app.js
-// Init, polling, state management. Modules loaded via separate scripts.
+// Init, live updates, state management. Modules loaded via separate scripts.
+//
+// Updates arrive over Server-Sent Events from focusboard-push.py (nginx
+// proxies /events), so the page does nothing until state.json or
+// override.json changes. The Mac's heartbeat (sync event, or sync.json when
+// polling) keeps "Synced N min ago" current while state.json is unchanged.
+// If the stream is unavailable it falls back to polling the files. Time-dependent widgets are re-rendered from memory at
+// each minute boundary.
 
 (function () {
     'use strict';
@@ -7,9 +14,17 @@
     var POLL_INTERVAL = 10000;
     var CLOCK_INTERVAL = 1000;
     var BG_ROTATE_INTERVAL = 5 * 60 * 1000;
+    var EVENTS_URL = 'events';
+    // After the stream gives up (e.g. receiver not installed), retry it this often
+    var STREAM_RETRY_INTERVAL = 60 * 1000;
 
     var OFFLINE_THRESHOLD = 5 * 60 * 1000;
+    var SLOW_STAGE_MS = 1000;
     var lastGeneratedAt = null;
+    var lastHeartbeatAt = null;
+    var lastStateText = null;
+    var lastOverrideText = null;
+    var pollTimer = null;
 
     var $syncDot = FocusBoard.$('sync-dot');
     var $syncText = FocusBoard.$('sync-text');
@@ -20,6 +35,49 @@
     FocusBoard.lastState = null;
     FocusBoard.override = { mode: 'auto' };
 
+    // ─── Apply updates ───────────────────────────────────────────────
+
+    // Identical payloads (reconnects, unchanged polls) are skipped unparsed
+    function applyOverride(text) {
+        if (text === lastOverrideText) return;
+        lastOverrideText = text;
+        try {
+            FocusBoard.override = JSON.parse(text);
+        } catch (e) {
+            FocusBoard.override = { mode: 'auto' };
+        }
+    }
+
+    function applyState(text) {
+        if (text === lastStateText) return;
+        try {
+            var state = FocusBoard.expandState(JSON.parse(text));
+            lastStateText = text;
+            FocusBoard.lastState = state;
+            lastGeneratedAt = new Date(state.generated_at);
+            FocusBoard.render(state);
+            updateSyncStatus();
+        } catch (e) {
+            updateSyncStatus();
+        }
+    }
+
+    function applySync(text) {
+        try {
+            var at = new Date(JSON.parse(text).at);
+            if (!isNaN(at)) lastHeartbeatAt = at;
+        } catch (e) { /* ignore */ }
+        updateSyncStatus();
+    }
+
+    // When the Mac last synced: a content change (generated_at) or a heartbeat
+    function lastSyncedAt() {
+        if (lastHeartbeatAt && (!lastGeneratedAt || lastHeartbeatAt > lastGeneratedAt)) {
+            return lastHeartbeatAt;
+        }
+        return lastGeneratedAt;
+    }
+
     // ─── Fetch override ──────────────────────────────────────────────
 
     function fetchOverride() {
@@ -27,14 +85,11 @@
         xhr.open('GET', 'override.json?t=' + Date.now());
         xhr.onload = function () {
             if (xhr.status >= 200 && xhr.status < 300) {
-                try {
-                    FocusBoard.override = JSON.parse(xhr.responseText);
-                } catch (e) {
-                    FocusBoard.override = { mode: 'auto' };
-                }
+                applyOverride(xhr.responseText);
             }
         };
         xhr.onerror = function () {
+            lastOverrideText = null;
             FocusBoard.override = { mode: 'auto' };
         };
         xhr.send();
@@ -47,53 +102,117 @@
         xhr.open('GET', 'state.json?t=' + Date.now());
         xhr.onload = function () {
             if (xhr.status >= 200 && xhr.status < 300) {
-                try {
-                    var state = JSON.parse(xhr.responseText);
-                    FocusBoard.lastState = state;
-                    lastGeneratedAt = new Date(state.generated_at);
-                    FocusBoard.render(state);
-                    updateSyncStatus();
-                } catch (e) {
-                    updateSyncStatus();
-                }
+                applyState(xhr.responseText);
             } else {
                 updateSyncStatus();
-                if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState);
             }
         };
         xhr.onerror = function () {
             updateSyncStatus();
-            if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState);
         };
         xhr.send();
     }
 
+    function fetchSync() {
+        var xhr = new XMLHttpRequest();
+        xhr.open('GET', 'sync.json?t=' + Date.now());
+        xhr.onload = function () {
+            if (xhr.status >= 200 && xhr.status < 300) {
+                applySync(xhr.responseText);
+            }
+        };
+        xhr.send();
+    }
+
+    // ─── Live updates ──────────────────────────────────────────────────
+
+    function poll() {
+        fetchOverride();
+        fetchState();
+        fetchSync();
+    }
+
+    function startPolling() {
+        if (pollTimer) return;
+        poll();
+        pollTimer = setInterval(poll, POLL_INTERVAL);
+    }
+
+    function stopPolling() {
+        if (!pollTimer) return;
+        clearInterval(pollTimer);
+        pollTimer = null;
+    }
+
+    function openStream() {
+        if (!window.EventSource) {
+            startPolling();
+            return;
+        }
+        var stream = new EventSource(EVENTS_URL);
+        stream.addEventListener('state', function (e) { applyState(e.data); });
+        stream.addEventListener('override', function (e) { applyOverride(e.data); });
+        stream.addEventListener('sync', function (e) { applySync(e.data); });
+        // The receiver sends both files on connect, so polling can stop at once
+        stream.onopen = stopPolling;
+        stream.onerror = function () {
+            // Reconnecting, or gone for good: keep the board fresh meanwhile
+            startPolling();
+            if (stream.readyState === EventSource.CLOSED) {
+                setTimeout(openStream, STREAM_RETRY_INTERVAL);
+            }
+        };
+    }
+
+    // Time moves even when state doesn't: repaint the time-dependent widgets each minute
+    function scheduleTick() {
+        var now = new Date();
+        var untilNextMinute = 60000 - (now.getSeconds() * 1000 + now.getMilliseconds());
+        setTimeout(function () {
+            if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState, { clock: true });
+            updateSyncStatus();
+            FocusBoard.updateLifeCounters();
+            scheduleTick();
+        }, untilNextMinute + 50);
+    }
+
     // ─── Sync status ───────────────────────────────────────────────────
 
+    // " · slowest: calendar 1.2s" when the last sync had a slow stage
+    function slowestStageText() {
+        var meta = FocusBoard.lastState && FocusBoard.lastState.meta;
+        var timings = meta && meta.timings;
+        if (!timings || !timings.slowest || !timings.stages) return '';
+        var stage = timings.stages[timings.slowest];
+        if (!stage || stage.ms < SLOW_STAGE_MS) return '';
+        return ' \u00B7 slowest: ' + timings.slowest + ' ' + (stage.ms / 1000).toFixed(1) + 's';
+    }
+
     function updateSyncStatus() {
         var now = new Date();
+        var syncedAt = lastSyncedAt();
 
-        if (!lastGeneratedAt) {
+        if (!syncedAt) {
             $syncDot.className = 'sync-dot offline';
             $syncText.textContent = 'Waiting for first sync...';
             $offlineBanner.classList.add('hidden');
             return;
         }
 
-        var age = now - lastGeneratedAt;
+        var age = now - syncedAt;
         var minutes = Math.floor(age / 60000);
 
         if (age < OFFLINE_THRESHOLD) {
             $syncDot.className = 'sync-dot';
-            $syncText.textContent = minutes < 1
+            $syncText.textContent = (minutes < 1
                 ? 'Synced just now'
-                : 'Synced ' + minutes + ' min ago';
+                : 'Synced ' + minutes + ' min ago') + slowestStageText();
             $offlineBanner.classList.add('hidden');
         } else {
             $syncDot.className = 'sync-dot offline';
             $syncText.textContent = 'Last sync ' + minutes + ' min ago';
             $offlineBanner.classList.remove('hidden');
-            $offlineTime.textContent = FocusBoard.formatTime(lastGeneratedAt);
+            $offlineTime.textContent = FocusBoard.formatTime(syncedAt);
         }
     }
 
@@ -103,11 +222,9 @@
     setInterval(FocusBoard.updateClock, CLOCK_INTERVAL);
 
     FocusBoard.updateLifeCounters();
-    setInterval(FocusBoard.updateLifeCounters, POLL_INTERVAL);
 
-    fetchOverride();
-    fetchState();
-    setInterval(function () { fetchOverride(); fetchState(); }, POLL_INTERVAL);
+    openStream();
+    scheduleTick();
 
     FocusBoard.loadBackgroundImage();
     setInterval(FocusBoard.rotateBackgroundImage, BG_ROTATE_INTERVAL);
@@ -130,7 +130,7 @@
                 enterNightMode();
             } else {
                 exitNightMode();
-                if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState);
+                if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState, { force: true });
             }
         }
     });
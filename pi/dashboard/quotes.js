@@ -15,7 +15,11 @@
                 try {
                     quotes = JSON.parse(xhr.responseText);
                     loaded = true;
-                } catch (e) { /* ignore */ }
+                } catch (e) { return; }
+                // Widgets that read quotes only repaint when their sections
+                // change, so a state rendered before this arrived would keep
+                // an empty quote bar all day
+                if (FocusBoard.lastState) FocusBoard.render(FocusBoard.lastState, { force: true });
             }
         };
         xhr.send();
@@ -55,7 +55,7 @@
         return h + ':' + m + ' ' + ampm;
     }
 
-    // Live countdown: recompute remaining_min client-side every render (~30s)
+    // Live countdown: recompute remaining_min client-side every render (each minute)
     function getLiveRemaining(blocks) {
         var blockMinutes = FocusBoard.parseBlockMinutes(blocks);
         var currentMin = FocusBoard.getCurrentMinutes();
@@ -206,14 +206,7 @@
         if ($heroPersonalEvent) $heroPersonalEvent.innerHTML = '';
     }
 
-    function render(state) {
-        $dateLabel.textContent = FocusBoard.formatShortDate(state.date) || state.day_label || '';
-
-        if (FocusBoard.isNightMode()) {
-            FocusBoard.updateNightCountdown();
-            return;
-        }
-
+    function renderHero(state) {
         var allDone = state.meta && state.meta.all_done;
         var noSchedule = state.meta && state.meta.no_schedule;
 
@@ -227,21 +220,78 @@
         } else {
             renderCurrentBlock(state);
         }
+    }
+
+    // Each widget with the state sections it reads. clock: it also depends on
+    // the time of day, so the minute tick repaints it even when its data didn't
+    // change.
+    var WIDGETS = [
+        { sections: ['date', 'day_label'], render: function (s) {
+            $dateLabel.textContent = FocusBoard.formatShortDate(s.date) || s.day_label || '';
+        } },
+        { sections: ['now', 'blocks', 'meta', 'hero_calendar_event', 'tomorrow_focus', 'quote', 'date'],
+          clock: true, render: renderHero },
+        { sections: ['blocks', 'habits'], clock: true, render: function (s) {
+            FocusBoard.renderSchedule(s.blocks || [], s.habits || {});
+        } },
+        { sections: ['calendar', 'calendar_legend', 'calendar_now'], clock: true, render: function (s) {
+            FocusBoard.renderCalendar(s.calendar || [], s.calendar_legend || [], s.calendar_now || []);
+        } },
+        { sections: ['weather'], render: function (s) { FocusBoard.renderWeather(s.weather || {}); } },
+        { sections: ['keystones'], render: function (s) { FocusBoard.renderKeystones(s.keystones || []); } },
+        { sections: ['done_today'], render: function (s) { FocusBoard.renderDoneToday(s.done_today || []); } },
+        { sections: ['date'], render: function (s) { FocusBoard.renderQuoteBar(s.date); } },
+        { sections: ['recording_ready'], render: function (s) {
+            FocusBoard.renderRecordingReady(s.recording_ready || {});
+        } },
+        { sections: ['backlog_next'], render: function (s) { FocusBoard.renderBacklog(s.backlog_next || {}); } },
+        { sections: ['tasks'], render: function (s) { FocusBoard.renderTasks(s.tasks || {}); } },
+        { sections: ['reminders'], render: function (s) { FocusBoard.renderReminders(s.reminders || {}); } },
+        { sections: ['daily_log'], render: function (s) { FocusBoard.renderDailyLog(s.daily_log || {}); } },
+        { sections: ['habits'], render: function (s) { FocusBoard.renderHabits(s.habits || {}); } },
+        { sections: ['meta'], render: function (s) { FocusBoard.renderPipeline(s.meta || {}); } },
+        { sections: ['blocks'], render: function (s) { FocusBoard.renderProgress(s.blocks || []); } }
+    ];
+
+    // Section-hash key each widget was last rendered with
+    var renderedKeys = [];
+
+    // The widget's key from meta.sections (the generator hashes each section),
+    // or null when the state carries no hashes and must always render
+    function widgetKey(widget, hashes) {
+        if (!hashes) return null;
+        var parts = [];
+        for (var i = 0; i < widget.sections.length; i++) {
+            var hash = hashes[widget.sections[i]];
+            if (hash === undefined) return null;
+            parts.push(hash);
+        }
+        return parts.join(':');
+    }
+
+    // Render the widgets whose sections changed since they were last drawn.
+    // opts.clock also repaints the time-dependent ones (minute tick);
+    // opts.force repaints everything.
+    function render(state, opts) {
+        opts = opts || {};
+        if (FocusBoard.isNightMode()) {
+            WIDGETS[0].render(state);
+            FocusBoard.updateNightCountdown();
+            // The dashboard is hidden; repaint it all once night ends
+            renderedKeys = [];
+            return;
+        }
 
-        FocusBoard.renderSchedule(state.blocks || [], state.habits || {});
-        FocusBoard.renderCalendar(state.calendar || [], state.calendar_legend || [], state.calendar_now || []);
-        FocusBoard.renderWeather(state.weather || {});
-        FocusBoard.renderKeystones(state.keystones || []);
-        FocusBoard.renderDoneToday(state.done_today || []);
-        FocusBoard.renderQuoteBar(state.date);
-        FocusBoard.renderRecordingReady(state.recording_ready || {});
-        FocusBoard.renderBacklog(state.backlog_next || {});
-        FocusBoard.renderTasks(state.tasks || {});
-        FocusBoard.renderReminders(state.reminders || {});
-        FocusBoard.renderDailyLog(state.daily_log || {});
-        FocusBoard.renderHabits(state.habits || {});
-        FocusBoard.renderPipeline(state.meta || {});
-        FocusBoard.renderProgress(state.blocks || []);
+        var hashes = state.meta && state.meta.sections;
+        for (var i = 0; i < WIDGETS.length; i++) {
+            var widget = WIDGETS[i];
+            var key = widgetKey(widget, hashes);
+            var dirty = opts.force || key === null || key !== renderedKeys[i] ||
+                (opts.clock && widget.clock);
+            if (!dirty) continue;
+            widget.render(state);
+            renderedKeys[i] = key;
+        }
     }
 
     FocusBoard.render = render;
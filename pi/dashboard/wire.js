@@ -0,0 +1,108 @@
+// FocusBoard - Wire format expansion
+// state.json arrives either in the legacy full format or in the compact wire
+// format written by mac/wire.py (top-level "wire": 1). expandState() turns
+// the latter back into the full shape the render modules expect: block
+// statics and calendar sources come from "manifest", omitted fields get
+// their defaults, and {"$block"}, {"$cal"}, {"$now"} references are resolved.
+// It works in place on the freshly parsed object: filling in fields is about
+// half the cost of copying every block and event, and the markers left
+// behind ("wire", "$block", ...) are ignored by the renderers.
+(function () {
+    'use strict';
+
+    var WIRE_VERSION = 1;
+
+    var BLOCK_DEFAULTS = {
+        task: '', file: '', source: '',
+        done: false, is_current: false, required: false
+    };
+
+    // "now" fields that mirror the hero block (now key -> block key)
+    var NOW_FROM_BLOCK = {
+        block: 'block', task: 'task', file: 'file', source: 'source',
+        'do': 'file', from_ref: 'task', duration: 'source',
+        icon: 'icon', color: 'color', label: 'label',
+        details: 'details', type: 'type'
+    };
+
+    // sop_tasks fields copied from their block (sop key -> block key)
+    var SOP_FROM_BLOCK = { name: 'task', done: 'done', block: 'block' };
+
+    var CAL_DEFAULTS = { all_day: false, location: '', description: '' };
+
+    // calendar_now fields copied from the calendar event they describe
+    var CAL_REF_KEYS = ['title', 'description', 'start', 'end',
+                        'calendar_label', 'calendar_color', 'calendar_emoji'];
+
+    // Set target's missing fields from src
+    function fill(target, src) {
+        if (!src) return target;
+        var keys = Object.keys(src);
+        for (var i = 0; i < keys.length; i++) {
+            if (target[keys[i]] === undefined) target[keys[i]] = src[keys[i]];
+        }
+        return target;
+    }
+
+    // Set target's missing fields from src through a key mapping
+    function fillMapped(target, src, mapping) {
+        for (var key in mapping) {
+            if (target[key] === undefined && src[mapping[key]] !== undefined) {
+                target[key] = src[mapping[key]];
+            }
+        }
+        return target;
+    }
+
+    function expandState(raw) {
+        if (!raw || raw.wire !== WIRE_VERSION) return raw;
+
+        var manifest = raw.manifest || {};
+        var statics = manifest.blocks || {};
+        var sources = manifest.calendars || [];
+        var i;
+
+        var blocks = raw.blocks || [];
+        for (i = 0; i < blocks.length; i++) {
+            fill(blocks[i], statics[blocks[i].block || '']);
+            fill(blocks[i], BLOCK_DEFAULTS);
+        }
+
+        var now = raw.now;
+        if (now && now.$block !== undefined) {
+            fillMapped(now, blocks[now.$block] || {}, NOW_FROM_BLOCK);
+        }
+
+        var sops = raw.sop_tasks || [];
+        for (i = 0; i < sops.length; i++) {
+            if (sops[i] && sops[i].$block !== undefined) {
+                sops[i] = fillMapped({}, blocks[sops[i].$block] || {}, SOP_FROM_BLOCK);
+            }
+        }
+
+        var calendar = raw.calendar || [];
+        for (i = 0; i < calendar.length; i++) {
+            if (calendar[i].$src !== undefined) fill(calendar[i], sources[calendar[i].$src]);
+            fill(calendar[i], CAL_DEFAULTS);
+        }
+
+        var calNow = raw.calendar_now || [];
+        for (i = 0; i < calNow.length; i++) {
+            var entry = calNow[i];
+            if (entry.$cal === undefined) continue;
+            var event = calendar[entry.$cal] || {};
+            for (var k = 0; k < CAL_REF_KEYS.length; k++) {
+                var key = CAL_REF_KEYS[k];
+                if (entry[key] === undefined) entry[key] = event[key] !== undefined ? event[key] : '';
+            }
+        }
+
+        var hero = raw.hero_calendar_event;
+        if (hero && hero.$now !== undefined) {
+            raw.hero_calendar_event = calNow[hero.$now] || null;
+        }
+        return raw;
+    }
+
+    FocusBoard.expandState = expandState;
+})();
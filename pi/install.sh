@@ -11,7 +11,7 @@
 #   1. Installs packages (chromium, nginx, unclutter)
 #   2. Creates directory structure
 #   3. Configures nginx on port 8080
-#   4. Configures Chromium kiosk via systemd
+#   4. Configures Chromium kiosk + push receiver via systemd
 #   5. Sets portrait display rotation
 #   6. Disables screen blanking
 #   7. Enables auto-login
@@ -28,7 +28,7 @@ echo "User: $PI_USER | Home: $PI_HOME"
 echo ""
 echo "[1/7] Installing packages..."
 sudo apt-get update -qq
-sudo apt-get install -y -qq chromium-browser nginx unclutter xdotool
+sudo apt-get install -y -qq chromium-browser nginx unclutter xdotool wlrctl
 
 # Create directory structure
 echo "[2/7] Creating directories..."
@@ -72,6 +72,22 @@ server {
         add_header Cache-Control "no-cache, no-store, must-revalidate";
     }
 
+    # Mac heartbeat (tmpfs, see focusboard-state.py), for the polling fallback
+    location = /sync.json {
+        alias /dev/shm/focusboard-sync.json;
+        add_header Cache-Control "no-cache, no-store, must-revalidate";
+    }
+
+    # Server-sent updates from focusboard-push.py (long-lived, unbuffered)
+    location /events {
+        proxy_pass http://127.0.0.1:8081/events;
+        proxy_http_version 1.1;
+        proxy_set_header Connection "";
+        proxy_buffering off;
+        proxy_cache off;
+        proxy_read_timeout 1h;
+    }
+
     # Disable access logging to reduce SD card writes
     access_log off;
 }
@@ -107,11 +123,13 @@ cat > "$PI_HOME/.config/lxsession/LXDE-pi/autostart" << 'AUTOSTART'
 @unclutter -idle 0.5 -root
 AUTOSTART
 
-# Install systemd service (substitute username)
-echo "[6/7] Installing systemd service..."
-sed "s|__USER__|$PI_USER|g" "$FB_DIR/config/focusboard.service" | sudo tee /etc/systemd/system/focusboard.service > /dev/null
+# Install systemd services (substitute username)
+echo "[6/7] Installing systemd services..."
+for unit in focusboard.service focusboard-push.service; do
+    sed "s|__USER__|$PI_USER|g" "$FB_DIR/config/$unit" | sudo tee "/etc/systemd/system/$unit" > /dev/null
+done
 sudo systemctl daemon-reload
-sudo systemctl enable focusboard.service
+sudo systemctl enable focusboard.service focusboard-push.service
 
 # Enable auto-login
 echo "[7/7] Enabling auto-login..."
@@ -2,24 +2,39 @@
 """FocusBoard camera controller — shows live camera feed on motion.
 
 Listens for Unix signals from the PiCam motion daemon (same Pi):
-    SIGUSR1  Show camera (spawn mpv fullscreen Wayland window)
-    SIGUSR2  Hide camera (kill mpv immediately)
+    SIGUSR1  Show camera (unhide the standby mpv, or spawn one)
+    SIGUSR2  Hide camera immediately
     SIGTERM  Clean shutdown
 
 Time-gated: only responds during night hours (18:00-05:00) unless
 override is enabled in cam-config.json. Override resets on service start.
 
 Screen wake: When the screen is off (marker file from monitor-schedule.sh),
-motion wakes the screen, shows the camera feed, and turns it back off
-after the revert timeout. No dashboard is ever shown — just camera → off.
+motion wakes the screen and shows the camera feed. The feed is hidden after
+the revert timeout, but the screen stays on until SCREEN_GRACE_SEC pass with
+no motion, so a re-trigger in between skips the 8-10s HDMI handshake.
 
 mpv runs as a Wayland client on top of labwc, so Chromium (night mode)
-stays running underneath. Killing mpv instantly reveals the dashboard.
+stays running underneath. Hiding mpv instantly reveals the dashboard.
+
+Warm standby: a cold mpv spends seconds starting up, probing and connecting
+to the RTSP stream before its first frame. So one mpv is kept playing: it
+reads and decodes the stream all along (keeping the RTSP session alive and
+a current picture ready), but its window is minimized. Hiding minimizes it
+over mpv's JSON IPC socket; showing raises it through the compositor with
+wlrctl (wlr-foreign-toplevel), since Wayland clients can't unminimize
+themselves. Without wlrctl no standby is kept. It is respawned if it dies
+and recycled every standby_recycle_minutes while hidden, so a long-idle
+connection never goes stale. It only runs while a trigger would be shown
+(night hours, override, or screen off); during the day it is retired. If it
+isn't ready, a trigger falls back to spawning a visible mpv the old way.
 """
 
 import json
 import os
+import shutil
 import signal
+import socket
 import subprocess
 import sys
 import threading
@@ -31,6 +46,29 @@ PIDFILE = "/tmp/focusboard-cam.pid"
 SCREEN_OFF_MARKER = "/tmp/focusboard-screen-off"
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "cam-config.json"
 RTSP_URL = "rtsp://localhost:8554/cam"
+MPV_SOCKET = "/tmp/focusboard-cam-mpv.sock"
+
+# Standby player supervision
+STANDBY_CHECK_SEC = 5
+# Wait this long before respawning a standby player that died young
+# (stream down), so a missing camera doesn't cost an mpv start every check
+STANDBY_RETRY_SEC = 60
+STANDBY_MIN_LIFE_SEC = 30
+IPC_TIMEOUT_SEC = 1.0
+
+# Keep a screen we woke on this long after the last revert before turning
+# it back off
+SCREEN_GRACE_SEC = 300
+
+# The standby player's window title, which the compositor matches on
+STANDBY_TITLE = "focusboard-cam-standby"
+# Activating a minimized toplevel makes labwc unminimize and raise it
+STANDBY_RAISE = ["wlrctl", "toplevel", "focus", f"title:{STANDBY_TITLE}"]
+RAISE_TIMEOUT_SEC = 2
+# IPC commands that hide the standby player (it keeps playing)
+STANDBY_HIDE = (
+    ["set_property", "window-minimized", True],
+)
 
 # Default config (used if file is missing or unreadable)
 DEFAULT_CONFIG = {
@@ -41,6 +79,8 @@ DEFAULT_CONFIG = {
     "revert_seconds": 30,
     "panscan": 0.3,
     "motion_threshold": 8.0,
+    "standby": True,
+    "standby_recycle_minutes": 15,
 }
 
 
@@ -85,14 +125,57 @@ def is_night_hour(cfg):
         return start <= hour < end
 
 
+def trigger_would_show(cfg):
+    """Whether a motion trigger would show the feed right now.
+
+    The screen being off (marker file) always qualifies: motion wakes it.
+    With the screen on, only night hours or the override do.
+    """
+    if not cfg.get("enabled", True):
+        return False
+    if os.path.exists(SCREEN_OFF_MARKER):
+        return True
+    return cfg.get("override", False) or is_night_hour(cfg)
+
+
+def mpv_command(sock_path, command, timeout=IPC_TIMEOUT_SEC):
+    """Send one JSON IPC command to mpv. Returns True if mpv reported success."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(sock_path)
+            sock.sendall(json.dumps({"command": command, "request_id": 1}).encode() + b"\n")
+            buf = b""
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    return False
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    try:
+                        msg = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Skip asynchronous events interleaved with the reply
+                    if msg.get("request_id") == 1:
+                        return msg.get("error") == "success"
+    except (OSError, ValueError):
+        return False
+
+
 class CamController:
     def __init__(self):
         self._lock = threading.Lock()
-        self._mpv_proc = None
+        self._mpv_proc = None      # Cold-spawned, visible mpv (fallback)
+        self._standby = None       # Warm standby mpv (hidden unless showing)
+        self._standby_since = 0.0
+        self._standby_visible = False
+        self._standby_retry_at = 0.0
         self._revert_timer = None
+        self._screen_timer = None  # Turns a screen we woke off once idle
         self._screen_woke = False  # True if WE turned the screen on
-        self._grace_timer = None   # Kills mpv after grace period
-        self._mpv_grace_sec = 300  # 5 minutes
+        self._stop = threading.Event()
 
     def _build_mpv_cmd(self, cfg):
         """Build mpv command with Wayland flags and low-latency RTSP."""
@@ -119,131 +202,249 @@ class CamController:
             RTSP_URL,
         ]
 
+    def _build_standby_cmd(self, cfg):
+        """mpv command for the standby player: playing, window minimized."""
+        cmd = self._build_mpv_cmd(cfg)
+        return cmd[:-1] + [
+            f"--input-ipc-server={MPV_SOCKET}",
+            f"--title={STANDBY_TITLE}",
+            "--window-minimized=yes",
+            "--aid=no",
+            cmd[-1],
+        ]
+
     def show(self):
         """Show camera feed (called from SIGUSR1 handler thread).
 
         If the screen is off (marker file exists), wakes the screen first,
-        shows the camera feed, and turns the screen back off on revert.
+        shows the camera feed, and turns the screen back off SCREEN_GRACE_SEC
+        after the revert.
         """
         cfg = load_config()
-
-        if not cfg.get("enabled", True):
+        if not trigger_would_show(cfg):
             return
 
         screen_off = os.path.exists(SCREEN_OFF_MARKER)
-
-        # If screen is off, motion always wakes it (bypass time gate).
-        # If screen is on, apply normal time gate.
-        if not screen_off:
-            if not cfg.get("override", False) and not is_night_hour(cfg):
-                return
-
         revert_sec = cfg.get("revert_seconds", 30)
 
         with self._lock:
-            # Cancel any pending revert timer
-            if self._revert_timer is not None:
-                self._revert_timer.cancel()
-                self._revert_timer = None
-
-            # Cancel grace timer (we're active again)
-            if self._grace_timer is not None:
-                self._grace_timer.cancel()
-                self._grace_timer = None
+            # Cancel any pending revert and screen-off timers
+            self._cancel_revert()
+            self._cancel_screen_off()
 
             # Wake screen if it was off
             if screen_off and not self._screen_woke:
                 self._screen_on()
                 self._screen_woke = True
 
-            if self._mpv_proc is not None and self._mpv_proc.poll() is None:
-                # mpv already running — just reset the revert timer
-                # (covers both "motion refresh" and "grace period re-trigger")
-                self._revert_timer = threading.Timer(revert_sec, self._revert)
-                self._revert_timer.daemon = True
-                self._revert_timer.start()
-                log(f"Motion refresh — mpv already running, revert reset to {revert_sec}s")
-                return
-
-            # Spawn mpv (only if not already running)
-            cmd = self._build_mpv_cmd(cfg)
-            try:
-                self._mpv_proc = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-                log(f"SHOW: mpv started (pid={self._mpv_proc.pid})")
-            except OSError as e:
-                log(f"ERROR: Could not start mpv: {e}")
-                self._mpv_proc = None
-                # If we woke the screen but mpv failed, turn it back off
-                if self._screen_woke:
-                    self._screen_off()
-                    self._screen_woke = False
+            if self._feed_up():
+                # Feed already up — just reset the revert timer
+                self._start_revert(revert_sec)
+                log(f"Motion refresh — feed already shown, revert reset to {revert_sec}s")
                 return
 
-            # Start revert timer
-            self._revert_timer = threading.Timer(revert_sec, self._revert)
-            self._revert_timer.daemon = True
-            self._revert_timer.start()
+            if self._standby_alive() and self._raise_standby():
+                self._standby_visible = True
+            else:
+                # Standby not ready (starting, recycling, stream down): cold spawn
+                if self._standby_alive():
+                    # Couldn't raise it; free the decoder for the cold player
+                    self._stop_proc(self._standby, "SHOW: standby mpv")
+                    self._standby = None
+                try:
+                    self._mpv_proc = subprocess.Popen(
+                        self._build_mpv_cmd(cfg),
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                    log(f"SHOW: mpv started cold (pid={self._mpv_proc.pid})")
+                except OSError as e:
+                    log(f"ERROR: Could not start mpv: {e}")
+                    self._mpv_proc = None
+                    # If we woke the screen but mpv failed, turn it back off
+                    self._release_screen()
+                    return
+
+            self._start_revert(revert_sec)
 
     def hide(self):
         """Hide camera feed immediately (called from SIGUSR2 handler thread)."""
         with self._lock:
             self._cancel_revert()
-            if self._grace_timer is not None:
-                self._grace_timer.cancel()
-                self._grace_timer = None
-            self._kill_mpv()
-            if self._screen_woke:
-                self._screen_off()
-                self._screen_woke = False
+            self._hide_feed()
+            self._release_screen()
 
     def _revert(self):
-        """Keep mpv + screen alive for grace period.
-
-        Don't turn screen off here — keep HDMI link alive so re-triggers
-        during grace period skip the 8-10s HDMI handshake entirely.
-        Screen and mpv are killed together in _grace_kill after 5 min idle.
-        """
+        """Revert timeout: hide the feed; a screen we woke goes off once idle."""
         with self._lock:
             self._revert_timer = None
-            log("REVERT: timeout — mpv + screen alive for fast re-trigger")
-            # Start grace timer to eventually kill mpv + screen
-            self._grace_timer = threading.Timer(self._mpv_grace_sec, self._grace_kill)
-            self._grace_timer.daemon = True
-            self._grace_timer.start()
-
-    def _grace_kill(self):
-        """Kill mpv and turn screen off after grace period with no motion."""
-        with self._lock:
-            self._grace_timer = None
-            self._kill_mpv()
+            self._hide_feed()
             if self._screen_woke:
-                self._screen_off()
-                self._screen_woke = False
-            log(f"GRACE: mpv killed + screen off after {self._mpv_grace_sec}s idle")
+                self._screen_timer = threading.Timer(SCREEN_GRACE_SEC, self._screen_idle)
+                self._screen_timer.daemon = True
+                self._screen_timer.start()
+            log("REVERT: timeout")
+
+    def _screen_idle(self):
+        """Screen grace over with no motion: turn off the screen we woke."""
+        with self._lock:
+            self._screen_timer = None
+            # A trigger that raced the timer owns the screen again
+            if self._feed_up():
+                return
+            self._release_screen()
+            log(f"GRACE: screen off after {SCREEN_GRACE_SEC}s idle")
+
+    def _feed_up(self):
+        """Whether a feed is showing. Must be called with _lock held."""
+        return self._standby_visible or (self._mpv_proc is not None and self._mpv_proc.poll() is None)
+
+    def _hide_feed(self):
+        """Hide the standby player, kill a cold one. Must be called with _lock held."""
+        if self._standby_visible:
+            self._standby_visible = False
+            if self._standby_ipc(STANDBY_HIDE):
+                log("HIDE: standby mpv hidden")
+            else:
+                # Can't hide it: drop it, the supervisor starts a fresh one
+                log("HIDE: standby mpv unresponsive, killing")
+                self._stop_proc(self._standby, "HIDE: standby mpv")
+                self._standby = None
+        self._kill_mpv()
+
+    def _release_screen(self):
+        """Turn the screen back off now if we woke it. Must be called with _lock held."""
+        self._cancel_screen_off()
+        if self._screen_woke:
+            self._screen_off()
+            self._screen_woke = False
 
     def _kill_mpv(self):
-        """Kill mpv process. Must be called with _lock held."""
+        """Kill the cold-spawned mpv. Must be called with _lock held."""
         if self._mpv_proc is not None:
-            if self._mpv_proc.poll() is None:
-                self._mpv_proc.terminate()
-                try:
-                    self._mpv_proc.wait(timeout=3)
-                except subprocess.TimeoutExpired:
-                    self._mpv_proc.kill()
-                    self._mpv_proc.wait()
-                log(f"HIDE: mpv killed (pid={self._mpv_proc.pid})")
+            self._stop_proc(self._mpv_proc, "HIDE: mpv")
             self._mpv_proc = None
 
+    @staticmethod
+    def _stop_proc(proc, label):
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=3)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+            log(f"{label} killed (pid={proc.pid})")
+
+    def _start_revert(self, revert_sec):
+        """(Re)start the revert timer. Must be called with _lock held."""
+        self._revert_timer = threading.Timer(revert_sec, self._revert)
+        self._revert_timer.daemon = True
+        self._revert_timer.start()
+
     def _cancel_revert(self):
         """Cancel pending revert timer. Must be called with _lock held."""
         if self._revert_timer is not None:
             self._revert_timer.cancel()
             self._revert_timer = None
 
+    def _cancel_screen_off(self):
+        """Cancel pending screen-off timer. Must be called with _lock held."""
+        if self._screen_timer is not None:
+            self._screen_timer.cancel()
+            self._screen_timer = None
+
+    # ─── Standby player ──────────────────────────────────────────────────────
+
+    def _standby_alive(self):
+        return self._standby is not None and self._standby.poll() is None
+
+    @staticmethod
+    def _standby_ipc(commands):
+        return all(mpv_command(MPV_SOCKET, command) for command in commands)
+
+    def _raise_standby(self):
+        """Unminimize the standby window. Must be called with _lock held.
+
+        Fails if its window doesn't exist yet (still connecting) or wlrctl
+        is missing. The logged time is the compositor round trip; the
+        picture is already decoded.
+        """
+        start = time.monotonic()
+        try:
+            result = subprocess.run(STANDBY_RAISE, capture_output=True, timeout=RAISE_TIMEOUT_SEC)
+        except (subprocess.TimeoutExpired, OSError) as e:
+            log(f"SHOW: could not raise standby mpv: {e}")
+            return False
+        if result.returncode != 0:
+            log(f"SHOW: could not raise standby mpv (wlrctl exit {result.returncode})")
+            return False
+        log(f"SHOW: standby mpv raised in {(time.monotonic() - start) * 1000:.0f} ms "
+            f"(pid={self._standby.pid})")
+        return True
+
+    def _spawn_standby(self, cfg):
+        """Start a hidden standby mpv. Must be called with _lock held."""
+        try:
+            os.unlink(MPV_SOCKET)
+        except OSError:
+            pass
+        try:
+            self._standby = subprocess.Popen(
+                self._build_standby_cmd(cfg),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            log(f"ERROR: Could not start standby mpv: {e}")
+            self._standby = None
+            self._standby_retry_at = time.monotonic() + STANDBY_RETRY_SEC
+            return
+        self._standby_since = time.monotonic()
+        log(f"STANDBY: mpv started minimized (pid={self._standby.pid})")
+
+    def supervise_standby(self):
+        """Keep one standby player warm while a trigger would be shown.
+
+        Respawns it if it dies and recycles it on schedule while hidden.
+        Outside those hours (daytime with the screen on and no override), or
+        with the camera disabled, no player or RTSP session is kept.
+        """
+        while not self._stop.wait(STANDBY_CHECK_SEC):
+            cfg = load_config()
+            wanted = (cfg.get("standby", True) and trigger_would_show(cfg)
+                      and shutil.which(STANDBY_RAISE[0]) is not None)
+            recycle_sec = cfg.get("standby_recycle_minutes", 15) * 60
+            retired = None
+            with self._lock:
+                # Leave the player alone while shown, and don't decode a
+                # second stream next to a cold-spawned one
+                if self._feed_up():
+                    continue
+                now = time.monotonic()
+                if self._standby is not None:
+                    age = now - self._standby_since
+                    if not wanted:
+                        log("STANDBY: not needed now (disabled, daytime or no wlrctl), stopping mpv")
+                        retired = self._standby
+                    elif not self._standby_alive():
+                        log(f"STANDBY: mpv exited after {age:.0f}s")
+                        if age < STANDBY_MIN_LIFE_SEC:
+                            self._standby_retry_at = now + STANDBY_RETRY_SEC
+                        retired = self._standby
+                    elif age >= recycle_sec:
+                        log(f"STANDBY: recycling mpv after {age / 60:.0f} min")
+                        retired = self._standby
+                    if retired is not None:
+                        self._standby = None
+            # Terminating can take seconds; don't hold up a trigger meanwhile
+            if retired is not None:
+                self._stop_proc(retired, "STANDBY: mpv")
+            with self._lock:
+                if (wanted and self._standby is None and not self._feed_up()
+                        and time.monotonic() >= self._standby_retry_at):
+                    self._spawn_standby(cfg)
+
     def _screen_on(self):
         """Turn HDMI output on via wlr-randr. Must be called with _lock held."""
         try:
@@ -272,15 +473,15 @@ class CamController:
 
     def cleanup(self):
         """Clean shutdown."""
+        self._stop.set()
         with self._lock:
             self._cancel_revert()
-            if self._grace_timer is not None:
-                self._grace_timer.cancel()
-                self._grace_timer = None
+            self._standby_visible = False
             self._kill_mpv()
-            if self._screen_woke:
-                self._screen_off()
-                self._screen_woke = False
+            if self._standby is not None:
+                self._stop_proc(self._standby, "STANDBY: mpv")
+                self._standby = None
+            self._release_screen()
 
 
 def main():
@@ -299,7 +500,8 @@ def main():
 
     log(f"FocusBoard Camera Controller started (pid={os.getpid()})")
     log(f"Config: night={cfg['night_start_hour']:02d}:00-{cfg['night_end_hour']:02d}:00, "
-        f"revert={cfg['revert_seconds']}s, panscan={cfg['panscan']}")
+        f"revert={cfg['revert_seconds']}s, panscan={cfg['panscan']}, "
+        f"standby={'on' if cfg['standby'] else 'off'}")
 
     # Signal handlers — run actions in threads to avoid signal handler restrictions
     def on_show(signum, frame):
@@ -322,6 +524,8 @@ def main():
     signal.signal(signal.SIGTERM, on_term)
     signal.signal(signal.SIGINT, on_term)
 
+    threading.Thread(target=ctrl.supervise_standby, daemon=True).start()
+
     # Main loop: just wait for signals
     try:
         while True:
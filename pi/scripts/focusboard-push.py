@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""FocusBoard push receiver — streams dashboard changes to the kiosk (SSE).
+
+State still arrives from the Mac over SSH (focusboard-state.py applies the
+patch, or the scp fallback replaces the file); nginx still serves the static
+files. This service watches state.json, override.json and the Mac's
+heartbeat file (tmpfs, written by focusboard-state.py) and streams each
+change to connected browsers as Server-Sent Events on GET /events, which
+nginx proxies from :8080/events. Chromium then does nothing between changes
+instead of re-fetching and re-parsing both files every 10 seconds.
+
+Events:
+    event: state      data: state.json (compact, one line)
+    event: override   data: override.json
+    event: sync       data: {"at": TIME}, the Mac's last heartbeat
+A new connection gets the current files immediately. Idle connections get a
+comment every HEARTBEAT_SEC so dead ones are noticed. A file that doesn't
+parse (mid-write by a non-atomic writer) is skipped until it changes again.
+"""
+
+import json
+import os
+import signal
+import sys
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DASHBOARD_DIR = Path(__file__).parent.parent / "dashboard"
+WATCHED = {
+    "state": DASHBOARD_DIR / "state.json",
+    "override": DASHBOARD_DIR / "override.json",
+    "sync": Path("/dev/shm/focusboard-sync.json"),
+}
+LISTEN = ("127.0.0.1", 8081)
+
+# A stat() of three files this often is the whole cost of idling
+WATCH_INTERVAL_SEC = 0.5
+HEARTBEAT_SEC = 25
+# Client reconnect delay after a dropped stream
+RETRY_MS = 3000
+
+
+def log(msg):
+    ts = datetime.now().strftime("%H:%M:%S")
+    print(f"[{ts}] {msg}", flush=True)
+
+
+class Hub:
+    """Latest payload per event, with a sequence number clients wait on."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.latest = {}  # event name -> (seq, data)
+
+    def publish(self, name, data):
+        with self.cond:
+            # A rewrite with identical content (e.g. an scp fallback) isn't news
+            if name in self.latest and self.latest[name][1] == data:
+                return
+            self.seq += 1
+            self.latest[name] = (self.seq, data)
+            self.cond.notify_all()
+
+    def wait(self, seen, timeout):
+        """Events newer than seen as [(name, data)], plus the new seq.
+
+        Waits up to timeout for one; returns ([], seen) if none arrived.
+        Bursts coalesce: only the latest payload of each event is returned.
+        """
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > seen, timeout)
+            fresh = [(name, data) for name, (seq, data) in self.latest.items() if seq > seen]
+            return fresh, self.seq
+
+
+hub = Hub()
+
+
+def watch(stop):
+    """Publish each watched file whenever its (mtime, size, inode) changes."""
+    stamps = {}
+    while not stop.is_set():
+        for name, path in WATCHED.items():
+            try:
+                st = os.stat(path)
+                stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+            except OSError:
+                stamp = None
+            if stamp == stamps.get(name):
+                continue
+            stamps[name] = stamp
+            if stamp is None:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.dumps(json.load(f), separators=(",", ":"), ensure_ascii=False)
+            except (OSError, ValueError) as e:
+                log(f"Skipping unreadable {path.name}: {e}")
+                continue
+            hub.publish(name, data)
+        stop.wait(WATCH_INTERVAL_SEC)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/events", "/"):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("X-Accel-Buffering", "no")
+        self.end_headers()
+
+        seen = 0
+        try:
+            self.wfile.write(f"retry: {RETRY_MS}\n\n".encode())
+            self.wfile.flush()
+            while True:
+                events, seen = hub.wait(seen, HEARTBEAT_SEC)
+                if events:
+                    chunk = "".join(f"event: {name}\ndata: {data}\n\n" for name, data in events)
+                else:
+                    chunk = ": ping\n\n"
+                self.wfile.write(chunk.encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            pass
+        # One stream per connection; let the browser reconnect cleanly
+        self.close_connection = True
+
+    def log_message(self, fmt, *args):
+        # Quiet: the kiosk reconnects on every reload
+        pass
+
+
+def main():
+    stop = threading.Event()
+    server = ThreadingHTTPServer(LISTEN, Handler)
+    server.daemon_threads = True
+
+    def on_term(signum, frame):
+        log("Shutting down...")
+        stop.set()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, on_term)
+    signal.signal(signal.SIGINT, on_term)
+
+    threading.Thread(target=watch, args=(stop,), daemon=True).start()
+    log(f"FocusBoard push receiver on {LISTEN[0]}:{LISTEN[1]} (pid={os.getpid()})")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        log("Stopped")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""FocusBoard state receiver — applies pushes from the Mac to state.json.
+
+Invoked over SSH by mac/state_push.py with the payload on stdin:
+    focusboard-state.py apply --base HASH   # stdin: RFC 6902 patch against HASH
+    focusboard-state.py apply --full        # stdin: complete state
+    focusboard-state.py heartbeat TIME      # Mac synced at TIME, nothing changed
+    focusboard-state.py hash                # print the current state's hash
+
+The base hash is sha256 of the canonical JSON form (sorted keys, no
+whitespace, ASCII) — the same form the Mac hashes. If the current
+state.json doesn't match the base, nothing is written and the Mac falls
+back to a full push. Writes go to a temp file in the same directory and
+are fsynced and moved into place with os.replace(), so the dashboard's
+poller never reads a half-written file, even after a power cut. A state
+identical to the current file isn't rewritten (SD-card wear). The Mac
+stamps meta.generation, which only goes up when the content changes.
+
+Heartbeats don't touch state.json: the sync time goes to SYNC_PATH in tmpfs
+({"at": TIME}), which focusboard-push.py streams to the dashboard and nginx
+serves as /sync.json, so an idle Mac costs no SD-card writes.
+
+Exit codes: 0 applied (new hash on stdout), 3 base mismatch, 4 bad input.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+STATE_PATH = Path(__file__).parent.parent / "dashboard" / "state.json"
+# tmpfs: rewritten every heartbeat, so kept off the SD card
+SYNC_PATH = Path("/dev/shm/focusboard-sync.json")
+
+EXIT_BASE_MISMATCH = 3
+EXIT_BAD_INPUT = 4
+
+
+def canonical(obj):
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def state_hash(state):
+    return hashlib.sha256(canonical(state).encode("ascii")).hexdigest()
+
+
+def load_state():
+    """Current state, or None if missing or unreadable."""
+    try:
+        with open(STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def write_state(state):
+    """Atomically and durably replace state.json, unless it's unchanged.
+
+    Temp file in the same dir, fsync, rename, fsync of the directory.
+    Returns False if state.json already held exactly this state.
+    """
+    # Minified: the dashboard parses this on every change
+    data = json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    try:
+        if STATE_PATH.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+
+    fd, tmp = tempfile.mkstemp(dir=STATE_PATH.parent, prefix=".state-", suffix=".json")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, STATE_PATH)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    dir_fd = os.open(STATE_PATH.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+    return True
+
+
+def write_sync(at):
+    """Record the Mac's last sync time (tmpfs, atomic rename, no fsync)."""
+    tmp = SYNC_PATH.with_name(f".{SYNC_PATH.name}.{os.getpid()}")
+    tmp.write_text(json.dumps({"at": at}), encoding="utf-8")
+    os.chmod(tmp, 0o644)
+    os.replace(tmp, SYNC_PATH)
+
+
+# ─── JSON Patch ──────────────────────────────────────────────────────────────
+
+def _tokens(pointer):
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ValueError(f"bad pointer: {pointer!r}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def _index(container, token, allow_end=False):
+    if allow_end and token == "-":
+        return len(container)
+    idx = int(token)
+    limit = len(container) + (1 if allow_end else 0)
+    if not 0 <= idx < limit:
+        raise ValueError(f"index out of range: {token}")
+    return idx
+
+
+def apply_patch(doc, ops):
+    """Apply RFC 6902 add/remove/replace operations and return the result."""
+    for op in ops:
+        kind, tokens = op["op"], _tokens(op["path"])
+        if not tokens:
+            if kind == "remove":
+                raise ValueError("cannot remove the root")
+            doc = op["value"]
+            continue
+
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[_index(parent, token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            if kind == "add":
+                parent.insert(_index(parent, last, allow_end=True), op["value"])
+            elif kind == "remove":
+                del parent[_index(parent, last)]
+            elif kind == "replace":
+                parent[_index(parent, last)] = op["value"]
+            else:
+                raise ValueError(f"unsupported op: {kind}")
+        elif isinstance(parent, dict):
+            if kind == "add":
+                parent[last] = op["value"]
+            elif kind in ("remove", "replace"):
+                if last not in parent:
+                    raise ValueError(f"missing key: {op['path']}")
+                if kind == "remove":
+                    del parent[last]
+                else:
+                    parent[last] = op["value"]
+            else:
+                raise ValueError(f"unsupported op: {kind}")
+        else:
+            raise ValueError(f"not a container: {op['path']}")
+    return doc
+
+
+# ─── Commands ────────────────────────────────────────────────────────────────
+
+def cmd_apply(args):
+    try:
+        payload = json.load(sys.stdin)
+    except json.JSONDecodeError as e:
+        print(f"bad payload: {e}", file=sys.stderr)
+        return EXIT_BAD_INPUT
+
+    if "--full" in args:
+        state = payload
+    elif "--base" in args and args.index("--base") + 1 < len(args):
+        base = args[args.index("--base") + 1]
+        current = load_state()
+        if current is None or state_hash(current) != base:
+            print("base mismatch", file=sys.stderr)
+            return EXIT_BASE_MISMATCH
+        try:
+            state = apply_patch(current, payload)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            print(f"bad patch: {e}", file=sys.stderr)
+            return EXIT_BAD_INPUT
+    else:
+        print("apply needs --base HASH or --full", file=sys.stderr)
+        return EXIT_BAD_INPUT
+
+    if not isinstance(state, dict):
+        print("state must be an object", file=sys.stderr)
+        return EXIT_BAD_INPUT
+
+    write_state(state)
+    print(state_hash(state))
+    return 0
+
+
+def main():
+    args = sys.argv[1:]
+    if args and args[0] == "apply":
+        sys.exit(cmd_apply(args[1:]))
+    if args and args[0] == "heartbeat" and len(args) == 2:
+        write_sync(args[1])
+        sys.exit(0)
+    if args and args[0] == "hash":
+        current = load_state()
+        print(state_hash(current) if current is not None else "")
+        sys.exit(0)
+    print(__doc__.strip(), file=sys.stderr)
+    sys.exit(EXIT_BAD_INPUT)
+
+
+if __name__ == "__main__":
+    main()
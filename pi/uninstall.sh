@@ -4,9 +4,11 @@ set -euo pipefail
 
 echo "Removing FocusBoard..."
 
-sudo systemctl stop focusboard.service 2>/dev/null || true
-sudo systemctl disable focusboard.service 2>/dev/null || true
-sudo rm -f /etc/systemd/system/focusboard.service
+for unit in focusboard.service focusboard-push.service; do
+    sudo systemctl stop "$unit" 2>/dev/null || true
+    sudo systemctl disable "$unit" 2>/dev/null || true
+    sudo rm -f "/etc/systemd/system/$unit"
+done
 sudo systemctl daemon-reload
 
 PI_USER="${SUDO_USER:-$(whoami)}"
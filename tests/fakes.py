@@ -0,0 +1,145 @@
+"""Local stand-ins for FocusBoard's upstream HTTP services."""
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+
+class FakeResponse:
+    """Just enough of requests.Response for the fetchers."""
+
+    def __init__(self, status_code: int, body=None, headers: dict | None = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} from fake", response=self)
+
+
+class FakeCalendar:
+    """One Google Calendar's Events API, behind a requests-style get().
+
+    Honors timeMin/timeMax (overlap), updatedMin (inclusive), showDeleted and
+    If-None-Match, and answers 410 to updatedMin queries while `expired` is
+    set. Every change gets a later server "updated" stamp. Each call's params
+    land in `calls`, and 304s are counted in `not_modified`.
+    """
+
+    def __init__(self):
+        self.events: dict[str, dict] = {}
+        self.expired = False
+        self.calls: list[dict] = []
+        self.not_modified = 0
+        self._clock = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        self._updated = self._stamp()
+
+    def _stamp(self) -> str:
+        self._clock += timedelta(seconds=1)
+        return self._clock.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+    # ─── Changes ─────────────────────────────────────────────────────────
+
+    def put(self, event_id: str, start: datetime, end: datetime, summary: str = "") -> None:
+        self._updated = self._stamp()
+        self.events[event_id] = {
+            "id": event_id,
+            "status": "confirmed",
+            "summary": summary or event_id,
+            "start": {"dateTime": start.isoformat()},
+            "end": {"dateTime": end.isoformat()},
+            "updated": self._updated,
+        }
+
+    def cancel(self, event_id: str) -> None:
+        self._updated = self._stamp()
+        self.events[event_id] = {"id": event_id, "status": "cancelled", "updated": self._updated}
+
+    # ─── API ─────────────────────────────────────────────────────────────
+
+    def get(self, url, params=None, timeout=None, headers=None) -> FakeResponse:
+        params = dict(params or {})
+        self.calls.append(params)
+        if "updatedMin" in params and self.expired:
+            return FakeResponse(410)
+
+        items = []
+        for event in self.events.values():
+            if "updatedMin" in params and event["updated"] < params["updatedMin"]:
+                continue
+            if event["status"] == "cancelled":
+                if params.get("showDeleted") == "true":
+                    items.append(event)
+                continue
+            if "timeMin" in params:
+                start = datetime.fromisoformat(event["start"]["dateTime"])
+                end = datetime.fromisoformat(event["end"]["dateTime"])
+                if not (end > datetime.fromisoformat(params["timeMin"])
+                        and start < datetime.fromisoformat(params["timeMax"])):
+                    continue
+            items.append(event)
+
+        body = {"items": items, "updated": self._updated}
+        etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest()[:16] + '"'
+        if (headers or {}).get("If-None-Match") == etag:
+            self.not_modified += 1
+            return FakeResponse(304)
+        return FakeResponse(200, body, {"ETag": etag})
+
+
+class StubServer:
+    """A real HTTP server on 127.0.0.1 serving JSON bodies by path.
+
+    Each body gets an ETag derived from its content, and a matching
+    If-None-Match is answered 304. Every request lands in `requests` as
+    (path, If-None-Match or None). Use as a context manager; `url` is the
+    base URL.
+    """
+
+    def __init__(self, bodies: dict[str, object]):
+        self.bodies = dict(bodies)
+        self.requests: list[tuple[str, str | None]] = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                tag = self.headers.get("If-None-Match")
+                stub.requests.append((self.path, tag))
+                if self.path not in stub.bodies:
+                    self.send_error(404)
+                    return
+                body = json.dumps(stub.bodies[self.path]).encode()
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                if tag == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "StubServer":
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,91 @@
+"""calendar_sync against a local fake of the Events API."""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+os.environ["HOME"] = tempfile.mkdtemp(prefix="focusboard-test-")
+sys.path.insert(0, str(ROOT / "mac"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+import cache_store  # noqa: E402
+from calendar_sync import sync_calendar  # noqa: E402
+from fakes import FakeCalendar  # noqa: E402
+
+NOW = datetime(2026, 10, 18, 9, 0, tzinfo=timezone.utc)
+TODAY = NOW.replace(hour=0)
+
+
+def at(days: int, hour: int) -> datetime:
+    return TODAY + timedelta(days=days, hours=hour)
+
+
+class CalendarSyncTest(unittest.TestCase):
+    def setUp(self):
+        cache_store._store = cache_store.CacheStore(path=None)
+        self.api = FakeCalendar()
+        self.api.put("standup", at(0, 10), at(0, 11))
+        self.api.put("dentist", at(1, 14), at(1, 15))
+        self.api.put("far", at(20, 9), at(20, 10))
+
+    def sync(self) -> dict[str, dict]:
+        events = sync_calendar(self.api, "primary", "account", lambda force: "token", now=NOW)
+        return {e["id"]: e for e in events}
+
+    def test_full_sync_covers_the_window(self):
+        self.assertEqual(set(self.sync()), {"standup", "dentist"})
+        self.assertIn("timeMin", self.api.calls[-1])
+        self.assertNotIn("updatedMin", self.api.calls[-1])
+
+    def test_incremental_sync_applies_changes(self):
+        self.sync()
+        self.api.put("standup", at(0, 10), at(0, 11), summary="Standup (moved room)")
+        self.api.put("lunch", at(0, 12), at(0, 13))
+
+        events = self.sync()
+        call = self.api.calls[-1]
+        self.assertIn("updatedMin", call)
+        self.assertNotIn("timeMin", call)
+        self.assertNotIn("timeMax", call)
+        self.assertEqual(set(events), {"standup", "dentist", "lunch"})
+        self.assertEqual(events["standup"]["summary"], "Standup (moved room)")
+
+    def test_unchanged_calendar_is_revalidated(self):
+        self.sync()
+        self.sync()
+        events = self.sync()
+        self.assertEqual(self.api.not_modified, 1)
+        self.assertEqual(set(events), {"standup", "dentist"})
+
+    def test_cancellation_drops_event(self):
+        self.sync()
+        self.api.cancel("dentist")
+        self.assertEqual(set(self.sync()), {"standup"})
+
+    def test_event_moved_out_of_window_is_dropped(self):
+        self.sync()
+        self.api.put("dentist", at(10, 14), at(10, 15))
+        self.assertEqual(set(self.sync()), {"standup"})
+
+    def test_event_moved_into_window_appears(self):
+        self.sync()
+        self.api.put("far", at(2, 9), at(2, 10))
+        self.assertEqual(set(self.sync()), {"standup", "dentist", "far"})
+
+    def test_gone_resyncs_fully(self):
+        self.sync()
+        self.api.expired = True
+        self.api.cancel("standup")
+        self.api.put("review", at(3, 16), at(3, 17))
+
+        self.assertEqual(set(self.sync()), {"dentist", "review"})
+        self.assertIn("updatedMin", self.api.calls[-2])
+        self.assertIn("timeMin", self.api.calls[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""pipulse's combined exchange against a local stub PiPulse server."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+os.environ["HOME"] = tempfile.mkdtemp(prefix="focusboard-test-")
+sys.path.insert(0, str(ROOT / "mac"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+import cache_store  # noqa: E402
+import pipulse  # noqa: E402
+from fakes import StubServer  # noqa: E402
+from http_client import NotModified  # noqa: E402
+
+HABITS = pipulse.ENDPOINTS["habits"]
+STREAKS = pipulse.ENDPOINTS["streaks"]
+
+
+class ExchangeTest(unittest.TestCase):
+    def setUp(self):
+        cache_store._store = cache_store.CacheStore(path=None)
+        self.server = StubServer({
+            HABITS: {"water": {"done": 2, "target": 8}},
+            STREAKS: {"RISE": {"current": 5, "best": 12}},
+        })
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__, None, None, None)
+        original, pipulse.PIPULSE_URL = pipulse.PIPULSE_URL, self.server.url
+        self.addCleanup(setattr, pipulse, "PIPULSE_URL", original)
+
+    def test_first_exchange_is_unconditional(self):
+        payload, validators = pipulse._exchange({})
+        self.assertEqual(payload["streaks"], {"RISE": {"current": 5, "best": 12}})
+        self.assertEqual(set(validators), {"habits", "streaks"})
+        self.assertTrue(all(tag is None for _, tag in self.server.requests))
+
+    def test_unchanged_pair_is_not_modified(self):
+        _, validators = pipulse._exchange({})
+        with self.assertRaises(NotModified):
+            pipulse._exchange(validators)
+
+    def test_one_change_refetches_the_other_in_full(self):
+        _, validators = pipulse._exchange({})
+        self.server.bodies[HABITS] = {"water": {"done": 3, "target": 8}}
+        self.server.requests.clear()
+
+        payload, new_validators = pipulse._exchange(validators)
+        self.assertEqual(payload, {
+            "habits": {"water": {"done": 3, "target": 8}},
+            "streaks": {"RISE": {"current": 5, "best": 12}},
+        })
+        self.assertNotEqual(new_validators["habits"], validators["habits"])
+        self.assertEqual(new_validators["streaks"], validators["streaks"])
+        # Both conditional, then the 304'd streaks again without a validator
+        self.assertEqual([path for path, _ in self.server.requests], [HABITS, STREAKS, STREAKS])
+        self.assertIsNotNone(self.server.requests[1][1])
+        self.assertIsNone(self.server.requests[2][1])
+
+    def test_partial_validators_fetch_unconditionally(self):
+        _, validators = pipulse._exchange({})
+        self.server.requests.clear()
+        payload, _ = pipulse._exchange({"habits": validators["habits"]})
+        self.assertEqual(set(payload), {"habits", "streaks"})
+        self.assertTrue(all(tag is None for _, tag in self.server.requests))
+
+
+if __name__ == "__main__":
+    unittest.main()
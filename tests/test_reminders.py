@@ -0,0 +1,90 @@
+"""fetch_reminders through set_backend() with a FileBackend."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+os.environ["HOME"] = tempfile.mkdtemp(prefix="focusboard-test-")
+sys.path.insert(0, str(ROOT / "mac"))
+sys.path.insert(0, str(ROOT / "tests"))
+
+import cache_store  # noqa: E402
+import reminders  # noqa: E402
+from fanout import SourceUnavailable  # noqa: E402
+
+
+class CountingBackend(reminders.FileBackend):
+    """FileBackend that counts queries."""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.queries = 0
+
+    def query(self, lists):
+        self.queries += 1
+        return super().query(lists)
+
+
+class FetchRemindersTest(unittest.TestCase):
+    def setUp(self):
+        cache_store._store = cache_store.CacheStore(path=None)
+        self.path = Path(tempfile.mkdtemp(prefix="focusboard-reminders-")) / "reminders.json"
+        self.write({
+            "Groceries": [{"title": "Milk", "due": ""}, {"title": "  ", "due": ""}],
+            "To-Do": [{"title": "Call dentist", "due": "2026-10-20T09:00:00.000Z"}],
+            "Someday": [{"title": "Learn Rust", "due": ""}],
+        })
+        self.backend = CountingBackend(self.path)
+        reminders.set_backend(self.backend)
+        self.addCleanup(reminders.set_backend, None)
+
+    def write(self, data: dict, mtime_ns: int | None = None) -> None:
+        self.path.write_text(json.dumps(data))
+        if mtime_ns is not None:
+            os.utime(self.path, ns=(mtime_ns, mtime_ns))
+
+    def test_only_requested_lists_are_returned(self):
+        result = reminders.fetch_reminders(["Groceries", "To-Do"])
+        self.assertEqual(result, {"count": 2, "items": [
+            {"title": "Milk", "list": "Groceries", "due": ""},
+            {"title": "Call dentist", "list": "To-Do", "due": "2026-10-20"},
+        ]})
+
+    def test_unchanged_stamp_serves_the_cache(self):
+        first = reminders.fetch_reminders(["Groceries"])
+        # New content, same mtime: the stamp says nothing changed
+        stamp = self.path.stat().st_mtime_ns
+        self.write({"Groceries": [{"title": "Eggs", "due": ""}]}, mtime_ns=stamp)
+
+        self.assertEqual(reminders.fetch_reminders(["Groceries"]), first)
+        self.assertEqual(self.backend.queries, 1)
+
+    def test_stamp_change_requeries(self):
+        reminders.fetch_reminders(["Groceries"])
+        stamp = self.path.stat().st_mtime_ns
+        self.write({"Groceries": [{"title": "Eggs", "due": ""}]}, mtime_ns=stamp + 1_000_000)
+
+        result = reminders.fetch_reminders(["Groceries"])
+        self.assertEqual([item["title"] for item in result["items"]], ["Eggs"])
+        self.assertEqual(self.backend.queries, 2)
+
+    def test_partial_answer_is_not_cached(self):
+        result = reminders.fetch_reminders(["Groceries", "Missing"])
+        self.assertEqual(result["count"], 1)
+        reminders.fetch_reminders(["Groceries", "Missing"])
+        self.assertEqual(self.backend.queries, 2)
+
+    def test_failure_serves_last_answer_or_raises(self):
+        first = reminders.fetch_reminders(["Groceries"])
+        self.path.write_text("not json")
+        self.assertEqual(reminders.fetch_reminders(["Groceries"]), first)
+        with self.assertRaises(SourceUnavailable):
+            reminders.fetch_reminders(["To-Do"])
+
+
+if __name__ == "__main__":
+    unittest.main()